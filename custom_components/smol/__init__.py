@@ -1,21 +1,28 @@
 from datetime import timedelta
 import logging
+import time
 
 from homeassistant.const import (
+    EVENT_HOMEASSISTANT_CLOSE,
     EVENT_HOMEASSISTANT_STOP
 )
 from homeassistant.helpers import (
+  config_validation as cv,
   issue_registry as ir
 )
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.util.dt import (utcnow)
+from homeassistant.util.ssl import get_default_context
 
 from .api_client import ApiException, AuthenticationException, SmolApiClient
+from .api_client.session import SmolSessionMetrics, create_client_session
 from .config.main import async_migrate_main_config
-from .const import CONFIG_ACCOUNT_NAME, CONFIG_ACCOUNT_PASSWORD, CONFIG_ACCOUNT_USERNAME, CONFIG_KIND, CONFIG_KIND_ACCOUNT, CONFIG_VERSION, DATA_ACCOUNT, DATA_CLIENT, DOMAIN, REFRESH_RATE_IN_MINUTES_ACCOUNT, REPAIR_ACCOUNT_NOT_FOUND
+from .const import CONFIG_ACCOUNT_NAME, CONFIG_ACCOUNT_PASSWORD, CONFIG_ACCOUNT_USERNAME, CONFIG_KIND, CONFIG_KIND_ACCOUNT, CONFIG_VERSION, DATA_ACCOUNT, DATA_ACCOUNT_COORDINATOR, DATA_CLIENT, DATA_SETUP_DURATION, DATA_SHARED_SESSION, DOMAIN, REPAIR_ACCOUNT_NOT_FOUND
 from .coordinators.account import AccountCoordinatorResult, async_setup_account_info_coordinator
 from .utils.repairs import safe_repair_key
-from .storage.account import async_load_cached_account, async_save_cached_account
+from .storage.account import async_load_cached_account, async_save_cached_account, get_account_store
+from .storage.token import async_load_cached_token, async_remove_cached_token, async_save_cached_token
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,6 +30,13 @@ SCAN_INTERVAL = timedelta(minutes=1)
 
 ACCOUNT_PLATFORMS = ["sensor", "binary_sensor"]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+async def async_setup(hass, config):
+  """Set up services that aren't tied to a single entity"""
+  async_setup_services(hass)
+  return True
+
 async def async_migrate_entry(hass, config_entry):
   """Migrate old entry."""
   if (config_entry.version < CONFIG_VERSION):
@@ -65,10 +79,51 @@ async def async_unload_entry(hass, entry):
       if unload_ok:
         account_name = entry.data[CONFIG_ACCOUNT_NAME]
         await _async_close_client(hass, account_name)
+        await get_account_store(hass, account_name).async_flush()
         hass.data[DOMAIN].pop(account_name)
 
+        if len(hass.data[DOMAIN]) == 0:
+          await _async_close_shared_session(hass)
+
     return unload_ok
 
+async def async_remove_entry(hass, entry):
+  """Remove any data stored for the config entry once it has been deleted"""
+  if entry.data[CONFIG_KIND] == CONFIG_KIND_ACCOUNT:
+    # Our refresh token can still be used to access the account, so shouldn't be left behind
+    await async_remove_cached_token(hass, entry.data[CONFIG_ACCOUNT_NAME])
+
+def _get_shared_session(hass):
+  """Gets the session shared by all account clients, so that connections and DNS lookups are reused across accounts"""
+  if DATA_SHARED_SESSION not in hass.data:
+    metrics = SmolSessionMetrics()
+    session = create_client_session(metrics, get_default_context())
+
+    async def async_close_session(_) -> None:
+      # Our listener has fired, so there is nothing to remove
+      hass.data[DATA_SHARED_SESSION]["remove_listener"] = None
+      await _async_close_shared_session(hass)
+
+    hass.data[DATA_SHARED_SESSION] = {
+      "session": session,
+      "metrics": metrics,
+      "remove_listener": hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, async_close_session)
+    }
+
+  shared_session = hass.data[DATA_SHARED_SESSION]
+  return (shared_session["session"], shared_session["metrics"])
+
+async def _async_close_shared_session(hass):
+  shared_session = hass.data.pop(DATA_SHARED_SESSION, None)
+  if shared_session is not None:
+    _LOGGER.debug('Closing shared session...')
+
+    if shared_session["remove_listener"] is not None:
+      shared_session["remove_listener"]()
+
+    await shared_session["session"].close()
+    _LOGGER.debug('Shared session closed.')
+
 async def _async_close_client(hass, account_name: str):
   if account_name in hass.data[DOMAIN]:
     if DATA_CLIENT in hass.data[DOMAIN][account_name]:
@@ -87,9 +142,18 @@ async def async_setup_entry(hass, entry):
   hass.data[DOMAIN].setdefault(account_name, {})
 
   if config[CONFIG_KIND] == CONFIG_KIND_ACCOUNT:
+    setup_started = time.monotonic()
     await async_setup_account(hass, account_name, config)
     await hass.config_entries.async_forward_entry_setups(entry, ACCOUNT_PLATFORMS)
 
+    setup_duration = time.monotonic() - setup_started
+    hass.data[DOMAIN][account_name][DATA_SETUP_DURATION] = setup_duration
+    _LOGGER.debug(f"Account {account_name} set up in {setup_duration:.3f} seconds")
+
+    # Retrieve our latest data in the background so setup isn't held up by Smol's API
+    account_coordinator = hass.data[DOMAIN][account_name][DATA_ACCOUNT_COORDINATOR]
+    entry.async_create_background_task(hass, account_coordinator.async_refresh(), f"smol_refresh_account_{account_name}")
+
     async def async_close_connection(_) -> None:
       """Close client."""
       await _async_close_client(hass, account_name)
@@ -115,13 +179,34 @@ async def async_setup_account(hass, account_name, config):
   await async_setup_account_info_coordinator(hass, account_name)
     
   await _async_close_client(hass, account_name)
-  client = SmolApiClient(config[CONFIG_ACCOUNT_USERNAME], config[CONFIG_ACCOUNT_PASSWORD])
+  username = config[CONFIG_ACCOUNT_USERNAME]
+  token = await async_load_cached_token(hass, account_name, username)
+  (session, session_metrics) = _get_shared_session(hass)
+  client = SmolApiClient(
+    username,
+    config[CONFIG_ACCOUNT_PASSWORD],
+    token=token,
+    async_token_updated=lambda new_token: async_save_cached_token(hass, account_name, username, new_token),
+    session=session,
+    session_metrics=session_metrics
+  )
   hass.data[DOMAIN][account_name][DATA_CLIENT] = client
   
   # Delete any issues that may have been previously raised
   ir.async_delete_issue(hass, DOMAIN, safe_repair_key(REPAIR_ACCOUNT_NOT_FOUND, account_name))
 
-  is_cached_account = False
+  # Start with our cached account (if available) so that setup isn't held up by Smol's API. The latest account
+  # information is then retrieved by the coordinator in the background once our entities have been set up
+  account_info = await async_load_cached_account(hass, account_name)
+  if account_info is not None:
+    _LOGGER.debug(f"Using cached account information for {account_name} during startup. This data will be updated automatically in the background.")
+
+    # Mark our cached account as due a refresh, so it's retrieved as part of the first coordinator refresh
+    cached_result = AccountCoordinatorResult(utcnow(), 1, account_info)
+    cached_result.next_refresh = cached_result.last_evaluated
+    hass.data[DOMAIN][account_name][DATA_ACCOUNT] = cached_result
+    return
+
   try:
     account_info = await client.async_get_account()
     if (account_info is None):
@@ -141,13 +226,7 @@ async def async_setup_account(hass, account_name, config):
         translation_key="account_not_found",
         translation_placeholders={ "name": account_name },
       )
-      raise ConfigEntryNotReady(f"Failed to retrieve account information: {e}")
-    else:
-      is_cached_account = True
-      account_info = await async_load_cached_account(hass, account_name)
-      if (account_info is None):
-        raise ConfigEntryNotReady(f"Failed to retrieve account information: {e}")
-      else:
-        _LOGGER.warning(f"Using cached account information for {account_name} during startup. This data will be updated automatically when available.")
+
+    raise ConfigEntryNotReady(f"Failed to retrieve account information: {e}")
   
-  hass.data[DOMAIN][account_name][DATA_ACCOUNT] = AccountCoordinatorResult(utcnow() + timedelta(minutes=REFRESH_RATE_IN_MINUTES_ACCOUNT if not is_cached_account else 0), 1, account_info)
\ No newline at end of file
+  hass.data[DOMAIN][account_name][DATA_ACCOUNT] = AccountCoordinatorResult(utcnow(), 1, account_info)
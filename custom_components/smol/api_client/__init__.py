@@ -1,89 +1,85 @@
 import logging
 import json
-from typing import Any
+from typing import Any, Awaitable, Callable
 import aiohttp
 from asyncio import TimeoutError
+import time
 from datetime import (datetime, timedelta, timezone)
-from threading import RLock
 
 from homeassistant.util.dt import (now)
 
 from ..const import INTEGRATION_VERSION
-
-from .account import SmolAccount
+from ..utils.redaction import redaction_filter
+
+from .account import SmolAccount, SmolChangeNextChargeDateResult, SmolHolidyMode
+from .token_manager import SmolToken, SmolTokenManager
+from .session import SmolSessionMetrics, create_client_session
+from .retry import SmolRetryMetrics, SmolRetryPolicy, get_remaining_retry_time_in_seconds
+from .circuit_breaker import SmolCircuitBreaker
+from .mutation_queue import SmolMutationQueue
+from .metrics import (
+  SmolClientMetrics,
+  SmolOperationMetrics,
+  operation_change_next_charge_date,
+  operation_change_next_charge_dates,
+  operation_end_holiday,
+  operation_get_account,
+  operation_start_holiday,
+  operation_token
+)
+from .graphql import (
+  GraphQLDocument,
+  account_query_operation_name,
+  change_next_charge_date_operation_name,
+  change_next_charge_dates_operation_name,
+  create_account_query,
+  create_change_next_charge_date_mutation,
+  create_change_next_charge_dates_mutation,
+  create_end_holiday_mode_mutation,
+  create_start_holiday_mode_mutation,
+  default_market,
+  end_holiday_mode_operation_name,
+  persisted_query_not_found_error,
+  persisted_query_not_supported_error,
+  start_holiday_mode_operation_name
+)
+
+try:
+  # orjson is significantly faster and decodes straight from bytes, but isn't guaranteed to be available
+  import orjson
+  json_loads = orjson.loads
+except ImportError:
+  json_loads = json.loads
 
 _LOGGER = logging.getLogger(__name__)
-
-account_query = '''query GetAccount {{
-	customer(market: {market}) {{
-    holidayMode {{
-      config {{
-        endDate
-      }}
-    }}
-    subscriptions(orderBy: NEXT_CHARGE_DATE_ASC) {{
-      id
-      nextChargeScheduledAt
-      address {{
-        id
-      }}
-      product {{
-        typeId
-        name
-        packSize
-      }}
-    }}
-  }}
-}}'''
-
-start_holiday_mode_mutation = '''mutation StartHolidayMode {{
-  startHolidayMode(input: {{
-    endDate: "{end_date}"
-    market: {market}
-  }}) {{
-    ...HolidayMode
-    __typename
- }}
-}}
-
-fragment HolidayMode on HolidayMode {{
-  id
-  __typename
-}}
-'''
-
-end_holiday_mode_mutation = '''mutation EndHolidayMode {{
-  endHolidayModeEarly(input: {{
-    market: {market}
-  }}) {{
-    ...HolidayMode
-    __typename
-  }}
-}}
-
-fragment HolidayMode on HolidayMode {{
-  id
-  __typename
-}}
-'''
-
-change_next_charge_date_mutation = '''mutation ChangeNextChargeDate {{
-  changeNextChargeDate(input: {{
-    market: {market}
-    date: "{next_charge_date}"
-    subscriptionId: "{subscription_id}"
-    addressId: "{address_id}"
-    donateAWashSubscriptionId: null
-  }}) {{
-    __typename
-  }}
-}}
-'''
+_LOGGER.addFilter(redaction_filter)
 
 user_agent_value = "bottlecapdave-ha-smol"
 
+default_base_url = "https://customer-api.smol.com"
+default_auth_url = "https://login.smolproducts.com"
+
 integration_context_header = "Ha-Integration-Context"
 
+token_client_id = "sp7P3EXkSoOFxZFjvncSLPduD4Kr5kFv"
+token_grant_type_password = "password"
+token_grant_type_refresh_token = "refresh_token"
+
+max_error_body_length = 512
+
+# The operation each request's metrics are recorded against
+operations_by_graphql_operation_name = {
+  account_query_operation_name: operation_get_account,
+  start_holiday_mode_operation_name: operation_start_holiday,
+  end_holiday_mode_operation_name: operation_end_holiday,
+  change_next_charge_date_operation_name: operation_change_next_charge_date,
+  change_next_charge_dates_operation_name: operation_change_next_charge_dates,
+}
+
+# Resources used to order mutations. Holiday mode affects the whole account, so conflicts with everything
+mutation_resource_account = "account"
+mutation_resource_subscription_prefix = "subscription_"
+
 class ApiException(Exception): ...
 
 class ServerException(ApiException): ...
@@ -92,19 +88,23 @@ class TimeoutException(ApiException): ...
 
 class RequestException(ApiException):
   errors: list[str]
+  response: Any | None
 
-  def __init__(self, message: str, errors: list[str]):
+  def __init__(self, message: str, errors: list[str], response: Any | None = None):
     super().__init__(message)
     self.errors = errors
+    # The full response, as some operations within a request may have succeeded
+    self.response = response
 
 class AuthenticationException(RequestException): ...
 
+class CircuitOpenException(ApiException): ...
+
 def process_graphql_response(data: Any, url: str, request_context: str, ignore_errors: bool, accepted_error_codes: list[str]):
   if ("graphql" in url and "errors" in data and ignore_errors == False):
-    msg = f'Errors in request ({url}) ({request_context}): {data["errors"]}'
     errors = list(map(lambda error: error["message"].strip(".,!"), data["errors"]))
     errors_as_string = ', '.join(errors)
-    _LOGGER.warning(msg)
+    _LOGGER.warning('Errors in request (%s) (%s): %s', url, request_context, data["errors"])
 
     for error in data["errors"]:
       if ("extensions" in error and
@@ -117,15 +117,38 @@ def process_graphql_response(data: Any, url: str, request_context: str, ignore_e
           error["extensions"]["errorCode"] in accepted_error_codes):
         return None
 
-    raise RequestException(f"Failed - {errors_as_string}. See logs for more details.", errors)
+    raise RequestException(f"Failed - {errors_as_string}. See logs for more details.", errors, data)
   
   return data
 
+def get_error_body(body: bytes) -> str:
+  """Decodes the response body for use in error messages, truncating large bodies"""
+  if body is None:
+    return ""
+
+  if len(body) > max_error_body_length:
+    return f'{body[:max_error_body_length].decode("utf-8", errors="replace")}... ({len(body)} bytes)'
+
+  return body.decode("utf-8", errors="replace")
+
 class SmolApiClient:
-  _refresh_token_lock = RLock()
-  _session_lock = RLock()
 
-  def __init__(self, username: str, password: str, timeout_in_seconds = 20, market = "GB"):
+  def __init__(
+    self,
+    username: str,
+    password: str,
+    timeout_in_seconds = 20,
+    market = default_market,
+    token: SmolToken | None = None,
+    async_token_updated: Callable[[SmolToken], Awaitable[None]] | None = None,
+    use_persisted_queries = False,
+    session: aiohttp.ClientSession | None = None,
+    session_metrics: SmolSessionMetrics | None = None,
+    retry_policy: SmolRetryPolicy | None = None,
+    circuit_breaker: SmolCircuitBreaker | None = None,
+    base_url = default_base_url,
+    auth_url = default_auth_url
+  ):
     if (username is None):
       raise Exception('Username is not set')
 
@@ -135,201 +158,393 @@ class SmolApiClient:
     self._username = username
     self._password = password
     self._market = market
-    self._base_url = 'https://customer-api.smol.com'
+    self._use_persisted_queries = use_persisted_queries
+    # Overridable so the client can be pointed at a stand-in for Smol's API, e.g. for offline tests
+    self._base_url = base_url.rstrip("/")
+    self._auth_url = auth_url.rstrip("/")
 
-    self._graphql_token = None
-    self._graphql_expiration = None
+    self._token_manager = SmolTokenManager(self.__async_fetch_token_with_fallback, async_token_updated=async_token_updated)
+    if token is not None:
+      self._token_manager.set_token(token)
 
     self._timeout = aiohttp.ClientTimeout(total=None, sock_connect=timeout_in_seconds, sock_read=timeout_in_seconds)
     self._default_headers = { "user-agent": f'{user_agent_value}/{INTEGRATION_VERSION}' }
 
-    self._session = None
+    # A provided session is shared with other clients, so we're not responsible for closing it
+    self._session = session
+    self._owns_session = session is None
+    self._session_metrics = session_metrics if session_metrics is not None else SmolSessionMetrics()
+
+    # Only used for reads, as mutations aren't safe to repeat. The deadline allows a timed out attempt to be retried,
+    # with each attempt's timeout capped so the request as a whole never exceeds it
+    self._retry_policy = retry_policy if retry_policy is not None else SmolRetryPolicy(
+      (ServerException, TimeoutException, aiohttp.ClientConnectionError),
+      deadline_in_seconds=timeout_in_seconds * 2
+    )
+    self._retry_metrics = SmolRetryMetrics()
+
+    self._circuit_breaker = circuit_breaker if circuit_breaker is not None else SmolCircuitBreaker()
+
+    self._mutation_queue = SmolMutationQueue()
+
+    self._metrics = SmolClientMetrics()
+
+  @property
+  def token_manager(self) -> SmolTokenManager:
+    return self._token_manager
+
+  @property
+  def session_metrics(self) -> SmolSessionMetrics:
+    return self._session_metrics
+
+  @property
+  def retry_metrics(self) -> SmolRetryMetrics:
+    return self._retry_metrics
+
+  @property
+  def circuit_breaker(self) -> SmolCircuitBreaker:
+    return self._circuit_breaker
+
+  @property
+  def mutation_queue(self) -> SmolMutationQueue:
+    return self._mutation_queue
+
+  @property
+  def metrics(self) -> SmolClientMetrics:
+    return self._metrics
 
   async def async_close(self):
-    with self._session_lock:
-      if self._session is not None:
-        await self._session.close()
+    if self._session is not None and self._owns_session:
+      session = self._session
+      self._session = None
+      await session.close()
 
   def _create_client_session(self):
-    if self._session is not None:
-      return self._session
-    
-    with self._session_lock:
-      if self._session is not None:
-        return self._session
-      
-      self._session = aiohttp.ClientSession(headers=self._default_headers, skip_auto_headers=['User-Agent'])
-      return self._session
+    # Only ever called from the event loop, so no locking is required
+    if self._session is None:
+      self._session = create_client_session(self._session_metrics)
+      self._owns_session = True
+
+    return self._session
 
   async def async_refresh_token(self):
     """Refresh user token"""
-    if (self._graphql_expiration is not None and (self._graphql_expiration - timedelta(minutes=5)) > now()):
-      return
-
-    with self._refresh_token_lock:
-      # Check that our token wasn't refreshed while waiting for the lock
-      if (self._graphql_expiration is not None and (self._graphql_expiration - timedelta(minutes=5)) > now()):
-        return
+    try:
+      await self._token_manager.async_refresh_token()
+    except TimeoutError:
+      _LOGGER.warning('Failed to connect. Timeout of %s exceeded.', self._timeout)
+      raise TimeoutException()
 
+  async def __async_fetch_token_with_fallback(self, current_token: SmolToken | None) -> SmolToken | None:
+    if current_token is not None and current_token.refresh_token is not None:
       try:
-        try:
-          await self.__async_fetch_token()
-        except AuthenticationException:
-          if (self._graphql_refresh_token is not None):
-            _LOGGER.debug("Failed to refresh auth token using refresh token, attempting to use original API key")
-            self._graphql_refresh_token = None
-            self._graphql_expiration = None
-            
-            await self.__async_fetch_token()
-          else:
-            raise
-
-      except TimeoutError:
-        _LOGGER.warning(f'Failed to connect. Timeout of {self._timeout} exceeded.')
-        raise TimeoutException()
-
-  async def __async_fetch_token(self):
-    client = self._create_client_session()
-    url = 'https://login.smolproducts.com/oauth/token'
-    payload = {
-      "grant_type": "http://auth0.com/oauth/grant-type/password-realm",
-      "client_id": "sp7P3EXkSoOFxZFjvncSLPduD4Kr5kFv",
-      "username": self._username,
-      "password": self._password,
-      "realm": "Username-Password-Authentication",
-      "audience": "https://customer-api.smolproducts.com",
-      "scope": "openid profile email"
-    }
-    headers = {}
-    async with client.post(url, headers=headers, json=payload) as token_response:
-      token_response_body = await self.__async_read_response__(token_response, url)
-      if (token_response_body is not None and 
-          "access_token" in token_response_body and
-          "expires_in" in token_response_body):
-        
-        self._graphql_token = token_response_body["access_token"]
-        self._graphql_expiration = now() + timedelta(seconds=(int(token_response_body["expires_in"])))
-      elif (self._graphql_expiration is None or self._graphql_expiration > now()):
-        raise AuthenticationException("Failed to retrieve auth token and current token is expired")
-      else:
-        _LOGGER.error("Failed to retrieve auth token")
+        return await self.__async_fetch_token(token_grant_type_refresh_token, current_token)
+      except RequestException:
+        _LOGGER.debug("Failed to refresh auth token using refresh token, attempting to use username and password")
+
+    return await self.__async_fetch_token(token_grant_type_password, current_token)
+
+  async def __async_fetch_token(self, grant_type: str, current_token: SmolToken | None) -> SmolToken | None:
+    url = f'{self._auth_url}/oauth/token'
+    if grant_type == token_grant_type_refresh_token:
+      payload = {
+        "grant_type": "refresh_token",
+        "client_id": token_client_id,
+        "refresh_token": current_token.refresh_token,
+      }
+    else:
+      payload = {
+        "grant_type": "http://auth0.com/oauth/grant-type/password-realm",
+        "client_id": token_client_id,
+        "username": self._username,
+        "password": self._password,
+        "realm": "Username-Password-Authentication",
+        "audience": "https://customer-api.smolproducts.com",
+        "scope": "openid profile email offline_access"
+      }
+
+    token_response_body = await self.__async_post_with_metrics(
+      operation_token,
+      url,
+      payload,
+      self._default_headers
+    )
+    if (token_response_body is not None and 
+        "access_token" in token_response_body and
+        "expires_in" in token_response_body):
+      
+      # Refresh tokens are not always rotated, so keep hold of our existing one if a new one isn't provided
+      refresh_token = token_response_body["refresh_token"] if "refresh_token" in token_response_body else None
+      if refresh_token is None and grant_type == token_grant_type_refresh_token:
+        refresh_token = current_token.refresh_token
+
+      _LOGGER.debug('Retrieved auth token using %s grant', grant_type)
+      return SmolToken(
+        token_response_body["access_token"],
+        now() + timedelta(seconds=(int(token_response_body["expires_in"]))),
+        refresh_token,
+        grant_type
+      )
+    elif (current_token is None or current_token.expiration <= now()):
+      raise AuthenticationException("Failed to retrieve auth token and current token is expired", [])
+    else:
+      _LOGGER.error("Failed to retrieve auth token")
+
+    return None
     
   async def async_get_account(self) -> SmolAccount | None:
     """Get the user's account"""
-    await self.async_refresh_token()
-
-    try:
-      client = self._create_client_session()
-      url = f'{self._base_url}/v2/graphql'
-      # Get account response
-      payload = { "query": account_query.format(market=self._market), "variables": { "market": self._market } }
-      headers = { "Authorization": f"Bearer {self._graphql_token}" }
-      async with client.post(url, json=payload, headers=headers) as account_response:
-        account_response_body = await self.__async_read_response__(account_response, url)
-        _LOGGER.debug(f'account: {account_response_body}')
-
-        if (account_response_body is not None and 
-            "data" in account_response_body and 
-            "customer" in account_response_body["data"]):
-          return SmolAccount.model_validate(account_response_body["data"]["customer"])
-        else:
-          _LOGGER.error("Failed to retrieve account")
+    account_response_body = await self._retry_policy.async_execute(
+      lambda: self.__async_post_graphql(create_account_query(self._market)),
+      self._retry_metrics
+    )
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+      _LOGGER.debug('account: %s', account_response_body)
+
+    if (account_response_body is not None and 
+        "data" in account_response_body and 
+        "customer" in account_response_body["data"]):
+      return SmolAccount.model_validate(account_response_body["data"]["customer"])
+    else:
+      _LOGGER.error("Failed to retrieve account")
     
-    except TimeoutError:
-      _LOGGER.warning(f'Failed to connect. Timeout of {self._timeout} exceeded.')
-      raise TimeoutException()
+    return None
+  
+  async def async_start_holiday(self, end_date: datetime) -> SmolHolidyMode | None:
+    """Set holiday mode for the user, returning the updated holiday mode"""
+    return await self._mutation_queue.async_run(
+      ("start_holiday", end_date.isoformat()),
+      lambda: self.__async_start_holiday(end_date),
+      exclusive_resources=[mutation_resource_account]
+    )
+
+  async def __async_start_holiday(self, end_date: datetime) -> SmolHolidyMode | None:
+    account_response_body = await self.__async_post_graphql(create_start_holiday_mode_mutation(self._market, end_date.isoformat()))
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+      _LOGGER.debug('start_holiday response: %s', account_response_body)
+
+    if (account_response_body is not None and 
+        "data" in account_response_body and 
+        account_response_body["data"].get("startHolidayMode") is not None and
+        "id" in account_response_body["data"]["startHolidayMode"]):
+      return SmolHolidyMode.model_validate(account_response_body["data"]["startHolidayMode"])
+    else:
+      _LOGGER.error("Failed to set holiday mode")
     
     return None
   
-  async def async_start_holiday(self, end_date: datetime) -> SmolAccount | None:
-    """Set holiday mode for the user"""
-    await self.async_refresh_token()
-
-    try:
-      client = self._create_client_session()
-      url = f'{self._base_url}/v2/graphql'
-      # Get account response
-      payload = { "query": start_holiday_mode_mutation.format(end_date=end_date.isoformat(), market=self._market), "variables": { "market": self._market } }
-      headers = { "Authorization": f"Bearer {self._graphql_token}" }
-      async with client.post(url, json=payload, headers=headers) as account_response:
-        account_response_body = await self.__async_read_response__(account_response, url)
-        _LOGGER.debug(f'start_holiday response: {account_response_body}')
-
-        if (account_response_body is not None and 
-            "data" in account_response_body and 
-            "startHolidayMode" in account_response_body["data"]):
-          return "id" in account_response_body["data"]["startHolidayMode"]
-        else:
-          _LOGGER.error("Failed to set holiday mode")
+  async def async_end_holiday(self) -> SmolHolidyMode | None:
+    """End holiday mode for the user, returning the updated holiday mode"""
+    return await self._mutation_queue.async_run(
+      ("end_holiday",),
+      self.__async_end_holiday,
+      exclusive_resources=[mutation_resource_account]
+    )
+
+  async def __async_end_holiday(self) -> SmolHolidyMode | None:
+    account_response_body = await self.__async_post_graphql(create_end_holiday_mode_mutation(self._market))
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+      _LOGGER.debug('end_holiday response: %s', account_response_body)
+
+    if (account_response_body is not None and 
+        "data" in account_response_body and 
+        account_response_body["data"].get("endHolidayModeEarly") is not None and
+        "id" in account_response_body["data"]["endHolidayModeEarly"]):
+      return SmolHolidyMode.model_validate(account_response_body["data"]["endHolidayModeEarly"])
+    else:
+      _LOGGER.error("Failed to set holiday mode")
     
-    except TimeoutError:
-      _LOGGER.warning(f'Failed to connect. Timeout of {self._timeout} exceeded.')
-      raise TimeoutException()
+    return None
+  
+  async def async_change_next_charge_date(self, subscription_id: str, address_id: str, next_charge_date: datetime) -> bool:
+    """Change the next charge date of the subscription"""
+    return await self._mutation_queue.async_run(
+      ("change_next_charge_date", subscription_id, address_id, next_charge_date.isoformat()),
+      lambda: self.__async_change_next_charge_date(subscription_id, address_id, next_charge_date),
+      exclusive_resources=[f"{mutation_resource_subscription_prefix}{subscription_id}"],
+      shared_resources=[mutation_resource_account]
+    )
+
+  async def __async_change_next_charge_date(self, subscription_id: str, address_id: str, next_charge_date: datetime) -> bool:
+    account_response_body = await self.__async_post_graphql(
+      create_change_next_charge_date_mutation(self._market, subscription_id, address_id, next_charge_date.isoformat())
+    )
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+      _LOGGER.debug('change_next_charge_date response: %s', account_response_body)
+
+    if (account_response_body is not None and 
+        "data" in account_response_body and 
+        "changeNextChargeDate" in account_response_body["data"]):
+      return True
+    else:
+      _LOGGER.error("Failed to change next charge date")
     
     return False
-  
-  async def async_end_holiday(self) -> SmolAccount | None:
-    """End holiday mode for the user"""
-    await self.async_refresh_token()
+
+  async def async_change_next_charge_dates(self, changes: list[tuple[str, str, datetime]]) -> list[SmolChangeNextChargeDateResult]:
+    """
+    Change the next charge date of multiple subscriptions in a single request. Each change is a tuple of the
+    subscription id, address id and next charge date.
+    """
+    if len(changes) == 0:
+      return []
+
+    return await self._mutation_queue.async_run(
+      ("change_next_charge_dates",) + tuple(map(lambda change: (change[0], change[1], change[2].isoformat()), changes)),
+      lambda: self.__async_change_next_charge_dates(changes),
+      exclusive_resources=list(set(map(lambda change: f"{mutation_resource_subscription_prefix}{change[0]}", changes))),
+      shared_resources=[mutation_resource_account]
+    )
+
+  async def __async_change_next_charge_dates(self, changes: list[tuple[str, str, datetime]]) -> list[SmolChangeNextChargeDateResult]:
+    document = create_change_next_charge_dates_mutation(
+      self._market,
+      list(map(lambda change: (change[0], change[1], change[2].isoformat()), changes))
+    )
 
     try:
-      client = self._create_client_session()
-      url = f'{self._base_url}/v2/graphql'
-      # Get account response
-      payload = { "query": end_holiday_mode_mutation.format(market=self._market), "variables": { "market": self._market } }
-      headers = { "Authorization": f"Bearer {self._graphql_token}" }
-      async with client.post(url, json=payload, headers=headers) as account_response:
-        account_response_body = await self.__async_read_response__(account_response, url)
-        _LOGGER.debug(f'end_holiday response: {account_response_body}')
-
-        if (account_response_body is not None and 
-            "data" in account_response_body and 
-            "endHolidayModeEarly" in account_response_body["data"]):
-          return "id" in account_response_body["data"]["endHolidayModeEarly"]
-        else:
-          _LOGGER.error("Failed to set holiday mode")
-    
-    except TimeoutError:
-      _LOGGER.warning(f'Failed to connect. Timeout of {self._timeout} exceeded.')
-      raise TimeoutException()
-    
-    return False
-  
-  async def async_change_next_charge_date(self, subscription_id: str, address_id: str, next_charge_date: datetime) -> SmolAccount | None:
-    """End holiday mode for the user"""
+      response_body = await self.__async_post_graphql(document)
+      errors = []
+    except RequestException as e:
+      # Operations are independent, so some may have succeeded even though others failed
+      if e.response is None or e.response.get("data") is None:
+        raise
+
+      response_body = e.response
+      errors = e.response.get("errors", [])
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+      _LOGGER.debug('change_next_charge_dates response: %s', response_body)
+
+    results = []
+    for index, (subscription_id, _, _) in enumerate(changes):
+      alias = f"change{index}"
+      alias_errors = list(map(
+        lambda error: error["message"].strip(".,!"),
+        filter(lambda error: "path" in error and len(error["path"]) > 0 and error["path"][0] == alias, errors)
+      ))
+      success = (response_body is not None and
+                 response_body.get("data") is not None and
+                 response_body["data"].get(alias) is not None and
+                 len(alias_errors) == 0)
+
+      if success == False:
+        _LOGGER.error("Failed to change next charge date (subscriptionId: %s)", subscription_id)
+
+      results.append(SmolChangeNextChargeDateResult(
+        subscriptionId=subscription_id,
+        success=success,
+        error=", ".join(alias_errors) if len(alias_errors) > 0 else (None if success else "No result returned")
+      ))
+
+    return results
+
+  async def __async_post_graphql(self, document: GraphQLDocument):
+    """Sends the document to the graphql endpoint, failing fast if Smol's API is currently unavailable"""
+    if self._circuit_breaker.allow_request() == False:
+      raise CircuitOpenException("Requests to Smol are paused as their servers are currently failing")
+
+    try:
+      result = await self.__async_send_graphql(document)
+    except (ServerException, TimeoutException, aiohttp.ClientConnectionError):
+      self._circuit_breaker.record_failure()
+      raise
+    except ApiException:
+      # The server has responded, so is available
+      self._circuit_breaker.record_success()
+      raise
+    except BaseException:
+      self._circuit_breaker.record_aborted()
+      raise
+
+    self._circuit_breaker.record_success()
+    return result
+
+  async def __async_send_graphql(self, document: GraphQLDocument):
+    """Sends the document to the graphql endpoint, retrieving a new token if our current one has been rejected"""
     await self.async_refresh_token()
 
     try:
-      client = self._create_client_session()
-      url = f'{self._base_url}/v2/graphql'
-      # Get account response
-      payload = { "query": change_next_charge_date_mutation.format(market=self._market, next_charge_date=next_charge_date.isoformat(), subscription_id=subscription_id, address_id=address_id), "variables": { "market": self._market } }
-      headers = { "Authorization": f"Bearer {self._graphql_token}" }
-      async with client.post(url, json=payload, headers=headers) as account_response:
-        account_response_body = await self.__async_read_response__(account_response, url)
-        _LOGGER.debug(f'end_holiday response: {account_response_body}')
-
-        if (account_response_body is not None and 
-            "data" in account_response_body and 
-            "changeNextChargeDate" in account_response_body["data"]):
-          return True
-        else:
-          _LOGGER.error("Failed to change next charge date")
-    
+      access_token = self._token_manager.access_token
+      try:
+        return await self.__async_post_document(document, access_token)
+      except AuthenticationException:
+        # Our token may have been revoked (e.g. a persisted token from a previous run), so try once more with a new token
+        _LOGGER.debug("Token was rejected, retrieving a new token")
+        self._token_manager.expire_token(access_token)
+        await self.async_refresh_token()
+        return await self.__async_post_document(document, self._token_manager.access_token)
+
     except TimeoutError:
-      _LOGGER.warning(f'Failed to connect. Timeout of {self._timeout} exceeded.')
+      _LOGGER.warning('Failed to connect. Timeout of %s exceeded.', self._timeout)
       raise TimeoutException()
-    
-    return False
 
-  async def __async_read_response__(self, response, url, ignore_errors = False, accepted_error_codes = []):
+  async def __async_post_document(self, document: GraphQLDocument, access_token: str):
+    """Sends the document, only sending the hash if persisted queries are enabled and falling back to the full query if the server doesn't know it"""
+    url = f'{self._base_url}/v2/graphql'
+    if self._use_persisted_queries == False or document.persistable == False:
+      return await self.__async_post(url, document.to_payload(), access_token)
+
+    try:
+      return await self.__async_post(url, document.to_payload(use_persisted_query=True), access_token)
+    except RequestException as e:
+      if persisted_query_not_supported_error in e.errors:
+        _LOGGER.debug("Persisted queries are not supported, sending full queries from now on")
+        self._use_persisted_queries = False
+        return await self.__async_post(url, document.to_payload(), access_token)
+      elif persisted_query_not_found_error in e.errors:
+        # Send the full query along with the hash so the server registers it for next time
+        _LOGGER.debug("Persisted query not found for '%s', sending full query", document.operation_name)
+        return await self.__async_post(url, document.to_payload(include_hash=True), access_token)
+
+      raise
+
+  async def __async_post(self, url: str, payload: dict, access_token: str):
+    headers = { **self._default_headers, "Authorization": f"Bearer {access_token}" }
+    return await self.__async_post_with_metrics(
+      operations_by_graphql_operation_name[payload["operationName"]],
+      url,
+      payload,
+      headers
+    )
+
+  async def __async_post_with_metrics(self, operation: str, url: str, payload: dict, headers: dict):
+    """Sends the request, recording its latency, outcome and size against the operation"""
+    client = self._create_client_session()
+    started = time.monotonic()
+    error = None
+    try:
+      async with client.post(url, json=payload, headers=headers, timeout=self.__get_attempt_timeout()) as response:
+        return await self.__async_read_response__(response, url, operation_metrics=self._metrics.get_operation(operation))
+    except Exception as e:
+      error = e
+      raise
+    finally:
+      self._metrics.record_request(operation, time.monotonic() - started, error)
+
+  def __get_attempt_timeout(self) -> aiohttp.ClientTimeout:
+    """Our timeout, capped to the time left if the request is being retried"""
+    remaining_in_seconds = get_remaining_retry_time_in_seconds()
+    if remaining_in_seconds is None:
+      return self._timeout
+
+    if remaining_in_seconds <= 0:
+      raise TimeoutError()
+
+    return aiohttp.ClientTimeout(total=remaining_in_seconds, sock_connect=self._timeout.sock_connect, sock_read=self._timeout.sock_read)
+
+  async def __async_read_response__(self, response, url, ignore_errors = False, accepted_error_codes = [], operation_metrics: SmolOperationMetrics | None = None):
     """Reads the response, logging any json errors"""
 
     request_context = response.request_info.headers[integration_context_header] if integration_context_header in response.request_info.headers else "Unknown"
 
-    text = await response.text()
+    # Read the raw bytes so we only decode to text when we need to report an error
+    body = await response.read()
+    if operation_metrics is not None:
+      operation_metrics.record_bytes_received(len(body))
 
     if response.status >= 400:
+      text = get_error_body(body)
       if response.status >= 500:
         msg = f'Response received - {url} ({request_context}) - DO NOT REPORT - Smol server error ({url}): {response.status}; {text}'
         _LOGGER.warning(msg)
@@ -343,15 +558,15 @@ class SmolApiClient:
         _LOGGER.warning(msg)
         raise RequestException(msg, [])
       
-      _LOGGER.info(f"Response received - {url} ({request_context}) - Unexpected response received: {response.status}; {text}")
+      _LOGGER.info("Response received - %s (%s) - Unexpected response received: %s; %s", url, request_context, response.status, text)
       return None
     
-    _LOGGER.debug(f'Response received - {url} ({request_context}) - Successful response')
+    _LOGGER.debug('Response received - %s (%s) - Successful response', url, request_context)
 
     data_as_json = None
     try:
-      data_as_json = json.loads(text)
-    except:
-      raise Exception(f'Failed to extract response json: {url}; {text}')
+      data_as_json = json_loads(body)
+    except ValueError:
+      raise Exception(f'Failed to extract response json: {url}; {get_error_body(body)}')
     
-    return process_graphql_response(data_as_json, url, request_context, ignore_errors, accepted_error_codes)
+    return process_graphql_response(data_as_json, url, request_context, ignore_errors, accepted_error_codes)
\ No newline at end of file
@@ -26,3 +26,8 @@ class SmolAccount(BaseModel):
   holidayMode: SmolHolidyMode
   subscriptions: list[SmolSubscription]
 
+
+class SmolChangeNextChargeDateResult(BaseModel):
+  subscriptionId: str
+  success: bool
+  error: Optional[str] = None
@@ -0,0 +1,97 @@
+import logging
+import time
+from typing import Callable
+
+from ..utils.redaction import redaction_filter
+
+_LOGGER = logging.getLogger(__name__)
+_LOGGER.addFilter(redaction_filter)
+
+circuit_state_closed = "closed"
+circuit_state_open = "open"
+circuit_state_half_open = "half_open"
+
+class SmolCircuitBreaker:
+  """
+  Stops requests being sent while Smol's API is failing. After a number of consecutive failures the circuit opens
+  and requests fail fast. Once the recovery timeout has passed, a single trial request is let through (half open),
+  closing the circuit if it succeeds or opening it again if it fails.
+  """
+
+  def __init__(self, failure_threshold = 5, recovery_timeout_in_seconds = 60):
+    self._failure_threshold = failure_threshold
+    self._recovery_timeout_in_seconds = recovery_timeout_in_seconds
+    self._state = circuit_state_closed
+    self._consecutive_failures = 0
+    self._opened_at: float | None = None
+    self._trial_in_flight = False
+    self._listeners: list[Callable[[str], None]] = []
+
+    self.opened_count = 0
+    self.rejected_count = 0
+
+  @property
+  def state(self) -> str:
+    return self._state
+
+  def add_listener(self, listener: Callable[[str], None]) -> Callable[[], None]:
+    """Adds a listener called with the new state whenever the circuit changes state, returning a remover"""
+    self._listeners.append(listener)
+
+    def remove_listener():
+      if listener in self._listeners:
+        self._listeners.remove(listener)
+
+    return remove_listener
+
+  def __set_state(self, state: str):
+    if state == self._state:
+      return
+
+    self._state = state
+    for listener in list(self._listeners):
+      try:
+        listener(state)
+      except Exception as e:
+        _LOGGER.error("Failed to notify circuit breaker listener - %s", e)
+
+  def allow_request(self, current: float | None = None) -> bool:
+    """Determines if a request can be sent. If true, the outcome must be reported via record_success, record_failure or record_aborted"""
+    if self._state == circuit_state_closed:
+      return True
+
+    current = current if current is not None else time.monotonic()
+    if self._state == circuit_state_open and current >= self._opened_at + self._recovery_timeout_in_seconds:
+      _LOGGER.debug("Circuit half open, sending trial request")
+      self.__set_state(circuit_state_half_open)
+
+    if self._state == circuit_state_half_open and self._trial_in_flight == False:
+      self._trial_in_flight = True
+      return True
+
+    self.rejected_count += 1
+    return False
+
+  def record_success(self):
+    if self._state != circuit_state_closed:
+      _LOGGER.debug("Circuit closed")
+
+    self._consecutive_failures = 0
+    self._trial_in_flight = False
+    self.__set_state(circuit_state_closed)
+
+  def record_failure(self, current: float | None = None):
+    self._consecutive_failures += 1
+    self._trial_in_flight = False
+
+    if self._state == circuit_state_half_open or self._consecutive_failures >= self._failure_threshold:
+      if self._state != circuit_state_open:
+        _LOGGER.debug("Circuit opened after %s consecutive failures", self._consecutive_failures)
+        self.opened_count += 1
+
+      self._opened_at = current if current is not None else time.monotonic()
+      self.__set_state(circuit_state_open)
+
+  def record_aborted(self):
+    """The request was cancelled before completing, so tells us nothing about the health of the API"""
+    self._trial_in_flight = False
@@ -0,0 +1,155 @@
+from functools import lru_cache
+import hashlib
+import json
+
+# Arguments are sent as inline literals rather than $variables, as declaring variables requires the names of Smol's
+# input types (e.g. StartHolidayModeInput), which haven't been confirmed against their schema. A wrong name would break
+# every request, so documents only move to variables once test_graphql_schema.py in the integration tests passes.
+#
+# Until then, documents that only depend on the market are static and persistable, which covers the account query
+# made on every refresh. Mutations contain the values being changed, so are built per request and always sent in full.
+# They are only sent when a service is called, so persisting them would save little.
+
+default_market = "GB"
+
+persisted_query_not_found_error = "PersistedQueryNotFound"
+persisted_query_not_supported_error = "PersistedQueryNotSupported"
+
+account_query_operation_name = "GetAccount"
+start_holiday_mode_operation_name = "StartHolidayMode"
+end_holiday_mode_operation_name = "EndHolidayMode"
+change_next_charge_date_operation_name = "ChangeNextChargeDate"
+change_next_charge_dates_operation_name = "ChangeNextChargeDates"
+
+class GraphQLDocument:
+  """
+  A GraphQL document. Documents that are the same for every request (e.g. only depend on the market) are persistable,
+  with their sha256 hash computed once for use with automatic persisted queries.
+  """
+  operation_name: str
+  query: str
+  persistable: bool
+  sha256_hash: str | None
+
+  def __init__(self, operation_name: str, query: str, persistable: bool = True):
+    self.operation_name = operation_name
+    self.query = query
+    self.persistable = persistable
+    self.sha256_hash = hashlib.sha256(query.encode("utf-8")).hexdigest() if persistable else None
+
+  def to_payload(self, use_persisted_query: bool = False, include_hash: bool = False) -> dict:
+    """Builds the request payload. When using persisted queries, only the hash of the query is sent"""
+    payload = {
+      "operationName": self.operation_name,
+      "variables": {},
+    }
+
+    if use_persisted_query == False or self.persistable == False:
+      payload["query"] = self.query
+
+    if self.persistable and (use_persisted_query or include_hash):
+      payload["extensions"] = {
+        "persistedQuery": {
+          "version": 1,
+          "sha256Hash": self.sha256_hash
+        }
+      }
+
+    return payload
+
+def to_graphql_string(value: str) -> str:
+  """Formats the value as a GraphQL string literal, escaping any quotes"""
+  return json.dumps(value)
+
+holiday_mode_fragment = '''fragment HolidayMode on HolidayMode {
+  id
+  config {
+    endDate
+  }
+  __typename
+}'''
+
+@lru_cache(maxsize=8)
+def create_account_query(market: str) -> GraphQLDocument:
+  """Creates the account query for the market. This is the same for every request, so can be persisted"""
+  return GraphQLDocument(account_query_operation_name, f'''query {account_query_operation_name} {{
+  customer(market: {market}) {{
+    holidayMode {{
+      config {{
+        endDate
+      }}
+    }}
+    subscriptions(orderBy: NEXT_CHARGE_DATE_ASC) {{
+      id
+      nextChargeScheduledAt
+      address {{
+        id
+      }}
+      product {{
+        typeId
+        name
+        packSize
+      }}
+    }}
+  }}
+}}''')
+
+def create_start_holiday_mode_mutation(market: str, end_date: str) -> GraphQLDocument:
+  return GraphQLDocument(start_holiday_mode_operation_name, f'''mutation {start_holiday_mode_operation_name} {{
+  startHolidayMode(input: {{
+    endDate: {to_graphql_string(end_date)}
+    market: {market}
+  }}) {{
+    ...HolidayMode
+    __typename
+  }}
+}}
+
+{holiday_mode_fragment}''', persistable=False)
+
+@lru_cache(maxsize=8)
+def create_end_holiday_mode_mutation(market: str) -> GraphQLDocument:
+  """Creates the end holiday mode mutation for the market. This is the same for every request, so can be persisted"""
+  return GraphQLDocument(end_holiday_mode_operation_name, f'''mutation {end_holiday_mode_operation_name} {{
+  endHolidayModeEarly(input: {{
+    market: {market}
+  }}) {{
+    ...HolidayMode
+    __typename
+  }}
+}}
+
+{holiday_mode_fragment}''')
+
+# Built, and hashed, once at import for the default market
+account_query = create_account_query(default_market)
+end_holiday_mode_mutation = create_end_holiday_mode_mutation(default_market)
+
+def create_change_next_charge_date_input(market: str, subscription_id: str, address_id: str, next_charge_date: str) -> str:
+  return f'''{{
+    market: {market}
+    date: {to_graphql_string(next_charge_date)}
+    subscriptionId: {to_graphql_string(subscription_id)}
+    addressId: {to_graphql_string(address_id)}
+    donateAWashSubscriptionId: null
+  }}'''
+
+def create_change_next_charge_date_mutation(market: str, subscription_id: str, address_id: str, next_charge_date: str) -> GraphQLDocument:
+  return GraphQLDocument(change_next_charge_date_operation_name, f'''mutation {change_next_charge_date_operation_name} {{
+  changeNextChargeDate(input: {create_change_next_charge_date_input(market, subscription_id, address_id, next_charge_date)}) {{
+    __typename
+  }}
+}}''', persistable=False)
+
+def create_change_next_charge_dates_mutation(market: str, changes: list[tuple[str, str, str]]) -> GraphQLDocument:
+  """
+  Creates a single document containing an aliased changeNextChargeDate operation for each change. Each change is a
+  tuple of the subscription id, address id and next charge date.
+  """
+  operations = "\n".join(map(lambda indexed_change: f"""  change{indexed_change[0]}: changeNextChargeDate(input: {create_change_next_charge_date_input(market, *indexed_change[1])}) {{
+    __typename
+  }}""", enumerate(changes)))
+
+  return GraphQLDocument(change_next_charge_dates_operation_name, f"""mutation {change_next_charge_dates_operation_name} {{
+{operations}
+}}""", persistable=False)
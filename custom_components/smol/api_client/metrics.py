@@ -0,0 +1,108 @@
+from collections import deque
+import logging
+import math
+import time
+from typing import Callable
+
+from ..utils.redaction import redaction_filter
+
+_LOGGER = logging.getLogger(__name__)
+_LOGGER.addFilter(redaction_filter)
+
+operation_token = "token"
+operation_get_account = "get_account"
+operation_start_holiday = "start_holiday"
+operation_end_holiday = "end_holiday"
+operation_change_next_charge_date = "change_next_charge_date"
+operation_change_next_charge_dates = "change_next_charge_dates"
+
+operations = [
+  operation_token,
+  operation_get_account,
+  operation_start_holiday,
+  operation_end_holiday,
+  operation_change_next_charge_date,
+  operation_change_next_charge_dates,
+]
+
+default_latency_window_in_seconds = 3600
+default_max_latency_samples = 1000
+
+def calculate_percentile(sorted_values: list[float], percentile: float) -> float | None:
+  """Calculates the percentile using the nearest rank method"""
+  if len(sorted_values) == 0:
+    return None
+
+  rank = max(math.ceil(percentile / 100 * len(sorted_values)), 1)
+  return sorted_values[rank - 1]
+
+class SmolOperationMetrics:
+  """Request counts, outcomes, bytes received and latencies over a rolling window for a single operation"""
+
+  def __init__(self, window_in_seconds = default_latency_window_in_seconds, max_samples = default_max_latency_samples):
+    self._window_in_seconds = window_in_seconds
+    self._latencies: deque[tuple[float, float]] = deque(maxlen=max_samples)
+
+    self.requests = 0
+    self.errors = 0
+    self.errors_by_type: dict[str, int] = {}
+    self.bytes_received = 0
+    self.last_duration_in_seconds: float | None = None
+
+  def record_request(self, duration_in_seconds: float, error: Exception | None = None, current: float | None = None):
+    self.requests += 1
+    self.last_duration_in_seconds = duration_in_seconds
+    self._latencies.append((current if current is not None else time.monotonic(), duration_in_seconds))
+
+    if error is not None:
+      self.errors += 1
+      error_type = type(error).__name__
+      self.errors_by_type[error_type] = self.errors_by_type.get(error_type, 0) + 1
+
+  def record_bytes_received(self, number_of_bytes: int):
+    self.bytes_received += number_of_bytes
+
+  def get_latencies_in_window(self, current: float | None = None) -> list[float]:
+    current = current if current is not None else time.monotonic()
+    while len(self._latencies) > 0 and self._latencies[0][0] < current - self._window_in_seconds:
+      self._latencies.popleft()
+
+    return [duration for (_, duration) in self._latencies]
+
+  def get_latency_percentiles(self, percentiles: list[float] = [50, 95, 99], current: float | None = None) -> dict[float, float | None]:
+    """Calculates the requested latency percentiles, in seconds, over the rolling window"""
+    latencies = sorted(self.get_latencies_in_window(current))
+    return { percentile: calculate_percentile(latencies, percentile) for percentile in percentiles }
+
+class SmolClientMetrics:
+  """Metrics for each operation performed by a client, notifying listeners whenever a request completes"""
+
+  def __init__(self, window_in_seconds = default_latency_window_in_seconds, max_samples = default_max_latency_samples):
+    self._operations = { operation: SmolOperationMetrics(window_in_seconds, max_samples) for operation in operations }
+    self._listeners: list[Callable[[str], None]] = []
+
+  @property
+  def operations(self) -> dict[str, SmolOperationMetrics]:
+    return self._operations
+
+  def get_operation(self, operation: str) -> SmolOperationMetrics:
+    return self._operations[operation]
+
+  def add_listener(self, listener: Callable[[str], None]) -> Callable[[], None]:
+    """Adds a listener called with the operation whenever one of its requests completes, returning a remover"""
+    self._listeners.append(listener)
+
+    def remove_listener():
+      if listener in self._listeners:
+        self._listeners.remove(listener)
+
+    return remove_listener
+
+  def record_request(self, operation: str, duration_in_seconds: float, error: Exception | None = None, current: float | None = None):
+    self._operations[operation].record_request(duration_in_seconds, error, current)
+
+    for listener in list(self._listeners):
+      try:
+        listener(operation)
+      except Exception as e:
+        _LOGGER.error("Failed to notify metrics listener - %s", e)
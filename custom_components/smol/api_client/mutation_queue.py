@@ -0,0 +1,112 @@
+import asyncio
+from functools import partial
+import logging
+import time
+from typing import Any, Awaitable, Callable, Hashable
+
+from ..utils.redaction import redaction_filter
+
+_LOGGER = logging.getLogger(__name__)
+_LOGGER.addFilter(redaction_filter)
+
+class _ResourceState:
+  def __init__(self):
+    self.exclusive: asyncio.Future | None = None
+    self.shared: list[asyncio.Future] = []
+
+class SmolMutationQueue:
+  """
+  Orders the mutations for a single account. Operations wait for any earlier conflicting operations to complete
+  before starting, in the order they were queued, while operations that don't conflict run concurrently.
+
+  An operation conflicts with another if one requires exclusive access to a resource the other uses. Identical
+  operations that are still queued or running are only sent once, with all callers receiving the same result.
+  """
+
+  def __init__(self):
+    self._resources: dict[str, _ResourceState] = {}
+    self._in_flight: dict[Hashable, asyncio.Future] = {}
+
+    self.depth = 0
+    self.max_depth = 0
+    self.executed = 0
+    self.deduplicated = 0
+    self.last_wait_in_seconds: float | None = None
+    self.max_wait_in_seconds: float | None = None
+
+  async def async_run(
+    self,
+    operation_key: Hashable,
+    async_operation: Callable[[], Awaitable[Any]],
+    exclusive_resources: list[str] = [],
+    shared_resources: list[str] = []
+  ) -> Any:
+    if operation_key in self._in_flight:
+      _LOGGER.debug("Operation %s is already queued, waiting for existing operation", operation_key)
+      self.deduplicated += 1
+      return await asyncio.shield(self._in_flight[operation_key])
+
+    # Completed once our operation has finished, regardless of its outcome
+    completed = asyncio.get_running_loop().create_future()
+    dependencies: list[asyncio.Future] = []
+
+    for resource in exclusive_resources:
+      state = self._resources.setdefault(resource, _ResourceState())
+      if state.exclusive is not None:
+        dependencies.append(state.exclusive)
+      dependencies.extend(state.shared)
+      state.exclusive = completed
+      state.shared = []
+
+    for resource in shared_resources:
+      state = self._resources.setdefault(resource, _ResourceState())
+      if state.exclusive is not None:
+        dependencies.append(state.exclusive)
+      state.shared.append(completed)
+
+    self.depth += 1
+    self.max_depth = max(self.max_depth, self.depth)
+
+    task = asyncio.ensure_future(self.__async_run(async_operation, dependencies))
+    task.add_done_callback(partial(self.__on_operation_complete, operation_key, completed, exclusive_resources + shared_resources))
+    self._in_flight[operation_key] = task
+
+    # Shield the operation so a cancelled caller doesn't stop an operation others may be waiting on
+    return await asyncio.shield(task)
+
+  async def __async_run(self, async_operation: Callable[[], Awaitable[Any]], dependencies: list[asyncio.Future]):
+    queued = time.monotonic()
+    if len(dependencies) > 0:
+      await asyncio.wait(dependencies)
+
+    wait_in_seconds = time.monotonic() - queued
+    self.last_wait_in_seconds = wait_in_seconds
+    self.max_wait_in_seconds = max(self.max_wait_in_seconds, wait_in_seconds) if self.max_wait_in_seconds is not None else wait_in_seconds
+
+    self.executed += 1
+    return await async_operation()
+
+  def __on_operation_complete(self, operation_key: Hashable, completed: asyncio.Future, resources: list[str], task: asyncio.Future):
+    # Handled here rather than within our operation, so we're cleaned up even if cancelled before starting
+    self.depth -= 1
+    if self._in_flight.get(operation_key) is task:
+      del self._in_flight[operation_key]
+
+    completed.set_result(None)
+
+    # Forget about our operation if nothing has queued behind it
+    for resource in resources:
+      state = self._resources.get(resource)
+      if state is None:
+        continue
+
+      if state.exclusive is completed:
+        state.exclusive = None
+      if completed in state.shared:
+        state.shared.remove(completed)
+      if state.exclusive is None and len(state.shared) == 0:
+        del self._resources[resource]
+
+    # Mark any exception as retrieved, as all callers may have been cancelled
+    if task.cancelled() == False:
+      task.exception()
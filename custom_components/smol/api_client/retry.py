@@ -0,0 +1,86 @@
+import logging
+from asyncio import sleep
+from contextvars import ContextVar
+import random
+import time
+from typing import Awaitable, Callable, TypeVar
+
+from ..utils.redaction import redaction_filter
+
+_LOGGER = logging.getLogger(__name__)
+_LOGGER.addFilter(redaction_filter)
+
+T = TypeVar("T")
+
+# When the request currently being retried must complete by, so each attempt can cap its timeout to what's left
+retry_deadline: ContextVar[float | None] = ContextVar("smol_retry_deadline", default=None)
+
+def get_remaining_retry_time_in_seconds() -> float | None:
+  """The time left before the deadline of the request currently being retried, or None if it isn't being retried"""
+  deadline = retry_deadline.get()
+  return deadline - time.monotonic() if deadline is not None else None
+
+class SmolRetryMetrics:
+  """Counts of the requests that needed retrying"""
+
+  def __init__(self):
+    self.retried = 0
+    self.recovered = 0
+    self.given_up = 0
+
+class SmolRetryPolicy:
+  """
+  Retries transient failures using exponential backoff with full jitter. This should only be used for idempotent
+  requests, as a failed request may still have been processed by the server.
+
+  The deadline covers the whole request, including each attempt, so should be longer than a single attempt's timeout
+  for timeouts to be retried. Attempts should cap their timeout using get_remaining_retry_time_in_seconds.
+  """
+
+  def __init__(
+    self,
+    retryable_exceptions: tuple[type[Exception], ...],
+    max_attempts = 3,
+    base_delay_in_seconds = 0.5,
+    max_delay_in_seconds = 5,
+    deadline_in_seconds = 15
+  ):
+    self.retryable_exceptions = retryable_exceptions
+    self.max_attempts = max_attempts
+    self.base_delay_in_seconds = base_delay_in_seconds
+    self.max_delay_in_seconds = max_delay_in_seconds
+    self.deadline_in_seconds = deadline_in_seconds
+
+  def get_delay(self, attempt: int) -> float:
+    """The delay before the next attempt, where attempt is the number of attempts made so far"""
+    return random.uniform(0, min(self.max_delay_in_seconds, self.base_delay_in_seconds * (2 ** (attempt - 1))))
+
+  async def async_execute(self, async_request: Callable[[], Awaitable[T]], metrics: SmolRetryMetrics | None = None) -> T:
+    started = time.monotonic()
+    deadline_token = retry_deadline.set(started + self.deadline_in_seconds)
+    try:
+      attempt = 0
+      while True:
+        attempt += 1
+        try:
+          result = await async_request()
+        except self.retryable_exceptions as e:
+          delay = self.get_delay(attempt)
+          if attempt >= self.max_attempts or (time.monotonic() - started) + delay > self.deadline_in_seconds:
+            if metrics is not None:
+              metrics.given_up += 1
+            raise
+
+          _LOGGER.debug("Request failed on attempt %s (%s), retrying in %.2f seconds", attempt, type(e).__name__, delay)
+          if metrics is not None:
+            metrics.retried += 1
+
+          await sleep(delay)
+          continue
+
+        if attempt > 1 and metrics is not None:
+          metrics.recovered += 1
+
+        return result
+    finally:
+      retry_deadline.reset(deadline_token)
@@ -0,0 +1,56 @@
+from collections import deque
+import ssl
+import time
+import aiohttp
+
+default_limit_per_host = 4
+default_ttl_dns_cache_in_seconds = 300
+default_keepalive_timeout_in_seconds = 60
+
+class SmolSessionMetrics:
+  """Tracks the connections created by a session. As all requests are over https, each new connection is a TLS handshake"""
+
+  def __init__(self, window_in_seconds: int = 3600):
+    self._window_in_seconds = window_in_seconds
+    self._created: deque[float] = deque()
+    self.connections_created = 0
+
+  def record_connection_created(self, created: float | None = None):
+    created = created if created is not None else time.monotonic()
+    self.connections_created += 1
+    self._created.append(created)
+    self.__prune(created)
+
+  def connections_created_in_window(self, current: float | None = None) -> int:
+    self.__prune(current if current is not None else time.monotonic())
+    return len(self._created)
+
+  def __prune(self, current: float):
+    while len(self._created) > 0 and self._created[0] <= current - self._window_in_seconds:
+      self._created.popleft()
+
+def create_client_session(
+  metrics: SmolSessionMetrics | None = None,
+  ssl_context: ssl.SSLContext | None = None,
+  limit_per_host = default_limit_per_host,
+  ttl_dns_cache_in_seconds = default_ttl_dns_cache_in_seconds,
+  keepalive_timeout_in_seconds = default_keepalive_timeout_in_seconds
+) -> aiohttp.ClientSession:
+  """Creates a session with a connector tuned for a small number of long lived connections to Smol's API"""
+  connector = aiohttp.TCPConnector(
+    limit_per_host=limit_per_host,
+    ttl_dns_cache=ttl_dns_cache_in_seconds,
+    keepalive_timeout=keepalive_timeout_in_seconds,
+    ssl=ssl_context if ssl_context is not None else True
+  )
+
+  trace_configs = []
+  if metrics is not None:
+    async def on_connection_create_end(session, context, params):
+      metrics.record_connection_created()
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_connection_create_end.append(on_connection_create_end)
+    trace_configs.append(trace_config)
+
+  return aiohttp.ClientSession(connector=connector, trace_configs=trace_configs, skip_auto_headers=['User-Agent'])
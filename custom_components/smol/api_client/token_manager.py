@@ -0,0 +1,107 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+import time
+from typing import Awaitable, Callable
+
+from homeassistant.util.dt import (now)
+
+from ..utils.redaction import redaction_filter
+
+_LOGGER = logging.getLogger(__name__)
+_LOGGER.addFilter(redaction_filter)
+
+class SmolToken:
+  access_token: str
+  expiration: datetime
+  refresh_token: str | None
+  grant_type: str | None
+
+  def __init__(self, access_token: str, expiration: datetime, refresh_token: str | None = None, grant_type: str | None = None):
+    self.access_token = access_token
+    self.expiration = expiration
+    self.refresh_token = refresh_token
+    self.grant_type = grant_type
+
+  def __repr__(self):
+    # Never expose the raw tokens
+    return f'SmolToken(expiration={self.expiration}, grant_type={self.grant_type})'
+
+class SmolTokenManager:
+  """Manages the access token for a single client, ensuring only one token fetch is in flight at any one time"""
+
+  def __init__(
+    self,
+    async_fetch_token: Callable[[SmolToken | None], Awaitable[SmolToken | None]],
+    refresh_buffer: timedelta = timedelta(minutes=5),
+    async_token_updated: Callable[[SmolToken], Awaitable[None]] | None = None
+  ):
+    self._async_fetch_token = async_fetch_token
+    self._async_token_updated = async_token_updated
+    self._refresh_buffer = refresh_buffer
+    self._token: SmolToken | None = None
+    self._in_flight: asyncio.Future | None = None
+
+    self.fetch_count = 0
+    self.coalesced_waiters = 0
+    self.last_fetched: datetime | None = None
+    self.last_fetch_duration_in_seconds: float | None = None
+
+  @property
+  def token(self) -> SmolToken | None:
+    return self._token
+
+  @property
+  def access_token(self) -> str | None:
+    return self._token.access_token if self._token is not None else None
+
+  def set_token(self, token: SmolToken | None):
+    """Sets the current token, e.g. one persisted from a previous run"""
+    self._token = token
+
+  def expire_token(self, access_token: str):
+    """Marks the token as expired if it's still our current token, keeping the refresh token for renewal"""
+    if self._token is not None and self._token.access_token == access_token:
+      self._token = SmolToken(self._token.access_token, now(), self._token.refresh_token, self._token.grant_type)
+
+  def is_token_valid(self) -> bool:
+    return self._token is not None and (self._token.expiration - self._refresh_buffer) > now()
+
+  async def async_refresh_token(self):
+    """Refresh the token if required. Concurrent callers will await the same in-flight fetch"""
+    if self.is_token_valid():
+      return
+
+    if self._in_flight is None:
+      self._in_flight = asyncio.ensure_future(self.__async_fetch_token())
+      self._in_flight.add_done_callback(self.__on_fetch_complete)
+    else:
+      self.coalesced_waiters += 1
+
+    # Shield the fetch so a cancelled caller doesn't cancel the fetch for everyone else
+    await asyncio.shield(self._in_flight)
+
+  async def __async_fetch_token(self):
+    self.fetch_count += 1
+    started = time.monotonic()
+    try:
+      new_token = await self._async_fetch_token(self._token)
+    finally:
+      self.last_fetch_duration_in_seconds = time.monotonic() - started
+
+    if new_token is not None:
+      self._token = new_token
+      self.last_fetched = now()
+
+      if self._async_token_updated is not None:
+        try:
+          await self._async_token_updated(new_token)
+        except Exception as e:
+          _LOGGER.warning("Failed to handle updated token - %s", e)
+
+  def __on_fetch_complete(self, task: asyncio.Future):
+    self._in_flight = None
+
+    # Mark any exception as retrieved, as all waiters may have been cancelled
+    if task.cancelled() == False:
+      task.exception()
@@ -56,4 +56,5 @@ async def async_setup_default_sensors(hass, config, async_add_entities):
       "async_end_holiday_mode"
     )
 
-  async_add_entities(entities, True)
\ No newline at end of file
+  # Our entities are updated by the account coordinator's first refresh, which happens in the background
+  async_add_entities(entities)
\ No newline at end of file
@@ -34,6 +34,8 @@ async def async_validate_main_config(data, account_ids = []):
     account_info = None
   except ServerException:
     errors[CONFIG_ACCOUNT_USERNAME] = "server_error"
+  finally:
+    await client.async_close()
   
   if (CONFIG_ACCOUNT_USERNAME not in errors and account_info is None):
     errors[CONFIG_ACCOUNT_USERNAME] = "account_not_found"
@@ -1,7 +1,18 @@
 DOMAIN = "smol"
 INTEGRATION_VERSION = "1.0.0"
 
-REFRESH_RATE_IN_MINUTES_ACCOUNT = 360 # 6 hours
+# How often the account is refreshed, based on how long until the next charge or the end of holiday mode
+REFRESH_RATES_IN_MINUTES_ACCOUNT = [
+  (6, 30), # Within 6 hours, every 30 minutes
+  (24, 60), # Within a day, every hour
+  (72, 180), # Within 3 days, every 3 hours
+  (168, 360), # Within a week, every 6 hours
+  (336, 720), # Within 2 weeks, every 12 hours
+]
+REFRESH_RATE_IN_MINUTES_ACCOUNT = 1440 # Otherwise, once a day
+
+# Keep refreshing frequently for a while after a charge or holiday end, so we pick up the changes it causes
+REFRESH_RATE_RECENT_EVENT_IN_HOURS = 6
 
 CONFIG_VERSION = 1
 
@@ -16,7 +27,18 @@ DATA_CLIENT = "CLIENT"
 DATA_CONFIG = "CONFIG"
 DATA_ACCOUNT = "ACCOUNT"
 DATA_ACCOUNT_COORDINATOR = "ACCOUNT_COORDINATOR"
+DATA_SETUP_DURATION = "SETUP_DURATION"
+DATA_ACCOUNT_STORE = "ACCOUNT_STORE"
+
+# Stored at the root of hass.data as it is shared by all accounts
+DATA_SHARED_SESSION = "smol_shared_session"
 
 REPAIR_ACCOUNT_NOT_FOUND = "account_not_found_{}"
 
-COORDINATOR_REFRESH_IN_SECONDS = 60
\ No newline at end of file
+COORDINATOR_REFRESH_IN_SECONDS = 60
+
+# How long to wait before confirming changes we've applied locally after a mutation
+RECONCILE_AFTER_MUTATION_IN_SECONDS = 60
+
+# Refreshes requested within this window share a single account retrieval
+REFRESH_COALESCE_WINDOW_IN_SECONDS = 0.5
\ No newline at end of file
@@ -1,13 +1,17 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
+from typing import Callable
 
 from homeassistant.helpers.update_coordinator import (
   CoordinatorEntity,
 )
 
+from ..const import COORDINATOR_REFRESH_IN_SECONDS
+from ..utils.redaction import redaction_filter
 from ..utils.requests import calculate_next_refresh
 
 _LOGGER = logging.getLogger(__name__)
+_LOGGER.addFilter(redaction_filter)
 
 class MultiCoordinatorEntity(CoordinatorEntity):
   def __init__(self, primary_coordinator, secondary_coordinators):
@@ -24,6 +28,39 @@ class MultiCoordinatorEntity(CoordinatorEntity):
           )
       )
 
+class CoordinatorListenerMetrics:
+  """How many listeners a coordinator has updated, and how long each listener took to handle its updates"""
+
+  def __init__(self):
+    self.updates = 0
+    self.listeners_notified = 0
+    self.listeners_skipped = 0
+    self.last_listeners_notified = 0
+    self.last_listeners_skipped = 0
+    self.handling_durations: dict[str, dict] = {}
+
+  def record_update(self, notified: int, skipped: int):
+    self.updates += 1
+    self.listeners_notified += notified
+    self.listeners_skipped += skipped
+    self.last_listeners_notified = notified
+    self.last_listeners_skipped = skipped
+
+  def record_listener(self, update_callback: Callable[[], None], duration_in_seconds: float):
+    name = get_listener_name(update_callback)
+    durations = self.handling_durations.setdefault(name, { "count": 0, "total_in_seconds": 0, "max_in_seconds": 0 })
+    durations["count"] += 1
+    durations["total_in_seconds"] += duration_in_seconds
+    durations["max_in_seconds"] = max(durations["max_in_seconds"], duration_in_seconds)
+
+def get_listener_name(update_callback: Callable[[], None]) -> str:
+  """Identifies the listener by the entity it belongs to, falling back to the name of the callback"""
+  entity_id = getattr(getattr(update_callback, "__self__", None), "entity_id", None)
+  if entity_id is not None:
+    return entity_id
+
+  return getattr(update_callback, "__qualname__", repr(update_callback))
+
 class BaseCoordinatorResult:
   last_evaluated: datetime
   last_retrieved: datetime
@@ -36,6 +73,22 @@ class BaseCoordinatorResult:
     self.last_evaluated = last_evaluated
     self.last_retrieved = last_retrieved if last_retrieved is not None else last_evaluated
     self.request_attempts = request_attempts
+    self.refresh_rate_in_minutes = refresh_rate_in_minutes
     self.next_refresh = calculate_next_refresh(last_evaluated, request_attempts, refresh_rate_in_minutes)
     self.last_error = last_error
-    _LOGGER.debug(f'last_evaluated: {last_evaluated}; last_retrieved: {last_retrieved}; request_attempts: {request_attempts}; refresh_rate_in_minutes: {refresh_rate_in_minutes}; next_refresh: {self.next_refresh}; last_error: {self.last_error}')
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+      _LOGGER.debug(
+        'last_evaluated: %s; last_retrieved: %s; request_attempts: %s; refresh_rate_in_minutes: %s; next_refresh: %s; last_error: %s',
+        last_evaluated,
+        last_retrieved,
+        request_attempts,
+        refresh_rate_in_minutes,
+        self.next_refresh,
+        self.last_error
+      )
+
+
+def calculate_update_interval(current: datetime, next_refresh: datetime) -> timedelta:
+  """Calculates how long a coordinator can sleep before it next needs to wake up"""
+  # Never wake up more often than our original polling interval, e.g. when a refresh is overdue
+  return max(next_refresh - current, timedelta(seconds=COORDINATOR_REFRESH_IN_SECONDS))
@@ -1,9 +1,12 @@
 import logging
 from datetime import datetime, timedelta
+import time
 from typing import Callable
 
 from custom_components.smol.storage.account import async_save_cached_account
+from homeassistant.core import callback
 from homeassistant.util.dt import (now)
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import (
   DataUpdateCoordinator
 )
@@ -17,45 +20,242 @@ from ..const import (
   DATA_CLIENT,
   DATA_ACCOUNT,
   DATA_ACCOUNT_COORDINATOR,
+  REFRESH_COALESCE_WINDOW_IN_SECONDS,
   REFRESH_RATE_IN_MINUTES_ACCOUNT,
+  REFRESH_RATE_RECENT_EVENT_IN_HOURS,
+  REFRESH_RATES_IN_MINUTES_ACCOUNT,
   REPAIR_ACCOUNT_NOT_FOUND,
 )
 
-from ..api_client.account import SmolAccount
+from ..api_client.account import SmolAccount, SmolHolidyMode, SmolSubscription
 from ..api_client import ApiException, AuthenticationException, SmolApiClient
-from . import BaseCoordinatorResult
+from . import BaseCoordinatorResult, CoordinatorListenerMetrics, calculate_update_interval
+from ..utils.coalesce import CoalescedCall
+from ..utils.redaction import redaction_filter
 from ..utils.repairs import safe_repair_key
+from ..utils.requests import calculate_next_refresh
 
 _LOGGER = logging.getLogger(__name__)
+_LOGGER.addFilter(redaction_filter)
+
+# Contexts used by entities to only be updated when their part of the account changes
+ACCOUNT_CONTEXT_RESULT = "result"
+ACCOUNT_CONTEXT_HOLIDAY_MODE = "holiday_mode"
+ACCOUNT_CONTEXT_SUBSCRIPTION_PREFIX = "subscription_"
 
 class AccountCoordinatorResult(BaseCoordinatorResult):
-  account: dict
+  account: SmolAccount
+  subscriptions_by_type_id: dict[str, SmolSubscription]
 
   def __init__(self, last_evaluated: datetime, request_attempts: int, account: SmolAccount, last_error: Exception | None = None):
-    super().__init__(last_evaluated, request_attempts, REFRESH_RATE_IN_MINUTES_ACCOUNT, None, last_error)
+    super().__init__(last_evaluated, request_attempts, calculate_account_refresh_rate_in_minutes(last_evaluated, account), None, last_error)
     self.account = account
 
+    # Index our subscriptions once, so entities don't have to search for their subscription on every update
+    self.subscriptions_by_type_id = {}
+    if account is not None:
+      for subscription in account.subscriptions:
+        self.subscriptions_by_type_id.setdefault(subscription.product.typeId, subscription)
+
 class AccountDataUpdateCoordinator(DataUpdateCoordinator):
   
-  def __init__(self, hass, name: str, refresh_account) -> None:
+  def __init__(
+    self,
+    hass,
+    name: str,
+    refresh_account,
+    set_account_result: Callable[[AccountCoordinatorResult], None] | None = None,
+    refresh_window_in_seconds: float = REFRESH_COALESCE_WINDOW_IN_SECONDS
+  ) -> None:
     """Initialize coordinator."""
     self.__refresh_account = refresh_account
+    self.__coalesced_refresh = CoalescedCall(self.__async_refresh_account, refresh_window_in_seconds)
+    self.__set_account_result = set_account_result
+    self.__cancel_reconcile: Callable[[], None] | None = None
+    self.__changed_contexts: set[str] | None = None
+    self.__last_notified_success = True
+    self.__listener_metrics = CoordinatorListenerMetrics()
     super().__init__(
         hass,
         _LOGGER,
         name=name,
-        update_method=self.__refresh_account,
+        update_method=self.__async_update_data,
         update_interval=timedelta(seconds=COORDINATOR_REFRESH_IN_SECONDS),
+        # We decide which listeners need updating ourselves
         always_update=True
     )
 
+  async def __async_update_data(self, is_manual_refresh = False):
+    previous_result: AccountCoordinatorResult | None = self.data
+    result = await self.__refresh_account(is_manual_refresh=is_manual_refresh)
+
+    current = now()
+    self.__changed_contexts = get_changed_account_contexts(previous_result, result)
+
+    # Sleep until we next need to do something, rather than waking up at a fixed interval
+    if result is not None:
+      self.update_interval = calculate_account_update_interval(current, result)
+
+    return result
+
+  @property
+  def coalesced_refresh(self) -> CoalescedCall:
+    return self.__coalesced_refresh
+
+  @property
+  def listener_metrics(self) -> CoordinatorListenerMetrics:
+    return self.__listener_metrics
+
   async def refresh_account(self):
+    """Refreshes the account, sharing a single retrieval with anyone else requesting a refresh at the same time"""
+    return await self.__coalesced_refresh.async_call()
+
+  async def __async_refresh_account(self):
     _LOGGER.debug('Refreshing account')
-    result = await self.__refresh_account(is_manual_refresh=True)
-    self.data = result
-    self.async_update_listeners()
+    result = await self.__async_update_data(is_manual_refresh=True)
+    self.async_set_updated_data(result)
     return result
 
+  @callback
+  def async_apply_account_update(self, update_account: Callable[[SmolAccount], None], reconcile_in_seconds: float | None = None):
+    """
+    Applies a change we've made via the API to our current account, rather than retrieving the whole account again.
+    If reconcile_in_seconds is provided, the account will be retrieved after this period to confirm the change.
+    """
+    previous_result: AccountCoordinatorResult | None = self.data
+    if previous_result is None or previous_result.account is None:
+      return None
+
+    account = previous_result.account.model_copy(deep=True)
+    update_account(account)
+
+    # Keep our original retrieval information, so our next scheduled refresh isn't affected (e.g. a failure's backoff)
+    result = AccountCoordinatorResult(previous_result.last_evaluated, previous_result.request_attempts, account, previous_result.last_error)
+    result.next_refresh = previous_result.next_refresh
+    if self.__set_account_result is not None:
+      self.__set_account_result(result)
+
+    current = now()
+    self.__changed_contexts = get_changed_account_contexts(previous_result, result)
+    self.update_interval = calculate_account_update_interval(current, result)
+    self.async_set_updated_data(result)
+
+    if reconcile_in_seconds is not None:
+      if self.__cancel_reconcile is not None:
+        self.__cancel_reconcile()
+
+      self.__cancel_reconcile = async_call_later(self.hass, reconcile_in_seconds, self.__async_reconcile)
+
+    return result
+
+  async def __async_reconcile(self, _):
+    self.__cancel_reconcile = None
+    await self.refresh_account()
+
+  async def async_shutdown(self) -> None:
+    if self.__cancel_reconcile is not None:
+      self.__cancel_reconcile()
+      self.__cancel_reconcile = None
+
+    self.__coalesced_refresh.cancel()
+
+    await super().async_shutdown()
+
+  @callback
+  def async_update_listeners(self) -> None:
+    """Update only the listeners whose part of the account has changed"""
+    changed_contexts = self.__changed_contexts
+    self.__changed_contexts = None
+
+    # Make sure everyone is updated if our availability has changed
+    notify_all = changed_contexts is None or self.last_update_success != self.__last_notified_success
+    self.__last_notified_success = self.last_update_success
+
+    notified = 0
+    skipped = 0
+    for update_callback, context in list(self._listeners.values()):
+      if notify_all or context is None or context in changed_contexts:
+        started = time.perf_counter()
+        update_callback()
+        self.__listener_metrics.record_listener(update_callback, time.perf_counter() - started)
+        notified += 1
+      else:
+        skipped += 1
+
+    self.__listener_metrics.record_update(notified, skipped)
+
+def get_holiday_end_date(account: SmolAccount | None) -> datetime | None:
+  return account.holidayMode.config.endDate if account is not None and account.holidayMode is not None and account.holidayMode.config is not None else None
+
+def set_holiday_mode(account: SmolAccount, holiday_mode: SmolHolidyMode):
+  account.holidayMode = holiday_mode
+
+def set_subscription_next_charge_date(account: SmolAccount, subscription_id: str, next_charge_date: datetime):
+  for subscription in account.subscriptions:
+    if subscription.id == subscription_id:
+      subscription.nextChargeScheduledAt = next_charge_date
+
+  # Keep our subscriptions in the same order as the API returns them
+  account.subscriptions.sort(key=lambda subscription: (subscription.nextChargeScheduledAt is None, subscription.nextChargeScheduledAt))
+
+def calculate_account_refresh_rate_in_minutes(current: datetime, account: SmolAccount | None) -> float:
+  """Refresh more often as the next charge or end of holiday mode approaches, and rarely when nothing is happening"""
+  if account is None:
+    return REFRESH_RATE_IN_MINUTES_ACCOUNT
+
+  event_dates = [subscription.nextChargeScheduledAt for subscription in account.subscriptions]
+  event_dates.append(get_holiday_end_date(account))
+
+  # Events that have recently passed are treated as happening now, as the account will be changing as a result
+  recent_event_cut_off = current - timedelta(hours=REFRESH_RATE_RECENT_EVENT_IN_HOURS)
+  hours_until_next_event = None
+  for event_date in event_dates:
+    if event_date is not None and event_date > recent_event_cut_off:
+      hours_until_event = max((event_date - current).total_seconds() / 3600, 0)
+      if hours_until_next_event is None or hours_until_event < hours_until_next_event:
+        hours_until_next_event = hours_until_event
+
+  if hours_until_next_event is not None:
+    for (hours, refresh_rate_in_minutes) in REFRESH_RATES_IN_MINUTES_ACCOUNT:
+      if hours_until_next_event <= hours:
+        return refresh_rate_in_minutes
+
+  return REFRESH_RATE_IN_MINUTES_ACCOUNT
+
+def get_subscription_context(type_id: str) -> str:
+  return f"{ACCOUNT_CONTEXT_SUBSCRIPTION_PREFIX}{type_id}"
+
+def get_changed_account_contexts(
+  previous_result: AccountCoordinatorResult | None,
+  current_result: AccountCoordinatorResult | None
+) -> set[str] | None:
+  """Determines the parts of the account that have changed. None indicates everything should be treated as changed"""
+  if previous_result is None or current_result is None or previous_result.account is None or current_result.account is None:
+    return None
+
+  if previous_result is current_result:
+    return set()
+
+  changed_contexts = set([ACCOUNT_CONTEXT_RESULT])
+
+  previous_account = previous_result.account
+  current_account = current_result.account
+  if previous_account is not current_account:
+    if previous_account.holidayMode != current_account.holidayMode:
+      changed_contexts.add(ACCOUNT_CONTEXT_HOLIDAY_MODE)
+
+    previous_subscriptions = previous_result.subscriptions_by_type_id
+    current_subscriptions = current_result.subscriptions_by_type_id
+    for type_id in previous_subscriptions.keys() | current_subscriptions.keys():
+      if previous_subscriptions.get(type_id) != current_subscriptions.get(type_id):
+        changed_contexts.add(get_subscription_context(type_id))
+
+  return changed_contexts
+
+def calculate_account_update_interval(current: datetime, result: AccountCoordinatorResult) -> timedelta:
+  # Time derived state, such as holiday mode ending, is handled by the entities themselves
+  return calculate_update_interval(current, result.next_refresh)
+
 def raise_account_not_found(hass, name: str):
   ir.async_create_issue(
     hass,
@@ -107,9 +307,13 @@ async def async_refresh_account(
         previous_request.account,
         last_error=e
       )
+
+      # Retry based on how long we've been failing rather than how often we'd normally refresh, as our previous
+      # result may not have been retrieved recently (e.g. our cached account at startup)
+      result.next_refresh = calculate_next_refresh(current, result.request_attempts, 0)
       
       if (result.request_attempts == 2):
-        _LOGGER.warning(f'Failed to retrieve account information - using cached version. See diagnostics sensor for more information.')
+        _LOGGER.warning('Failed to retrieve account information - using cached version. See diagnostics sensor for more information.')
       
       return result
 
@@ -141,8 +345,12 @@ async def async_setup_account_info_coordinator(hass, name: str):
     
     return account_info
 
+  def set_account_result(result: AccountCoordinatorResult):
+    hass.data[DOMAIN][name][DATA_ACCOUNT] = result
+
   hass.data[DOMAIN][name][DATA_ACCOUNT_COORDINATOR] = AccountDataUpdateCoordinator(
     hass,
     f"update_account-{name}",
-    async_update_account_data
+    async_update_account_data,
+    set_account_result
   )
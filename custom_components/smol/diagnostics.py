@@ -0,0 +1,197 @@
+import logging
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.util.dt import (now)
+
+from .api_client import SmolApiClient
+from .const import (
+  CONFIG_ACCOUNT_NAME,
+  CONFIG_ACCOUNT_PASSWORD,
+  CONFIG_ACCOUNT_USERNAME,
+  DATA_ACCOUNT,
+  DATA_ACCOUNT_COORDINATOR,
+  DATA_ACCOUNT_STORE,
+  DATA_CLIENT,
+  DATA_SETUP_DURATION,
+  DOMAIN
+)
+from .coordinators.account import AccountCoordinatorResult, AccountDataUpdateCoordinator
+from .storage.account import SmolAccountStore
+from .utils.attributes import parse_attribute_string
+from .utils.durations import to_milliseconds
+from .utils.error import exception_to_string
+
+_LOGGER = logging.getLogger(__name__)
+
+TO_REDACT = {
+  CONFIG_ACCOUNT_USERNAME,
+  CONFIG_ACCOUNT_PASSWORD,
+  "id",
+  "subscriptionId",
+  "addressId",
+  "access_token",
+  "refresh_token",
+}
+
+# The number of most recent latencies included for each operation
+RECENT_LATENCIES = 10
+
+def get_account_diagnostics(result: AccountCoordinatorResult | None):
+  if result is None or result.account is None:
+    return None
+
+  return {
+    "number_of_subscriptions": len(result.account.subscriptions),
+    "account": async_redact_data(result.account.model_dump(mode="json"), TO_REDACT),
+  }
+
+def get_coordinator_diagnostics(coordinator: AccountDataUpdateCoordinator | None, result: AccountCoordinatorResult | None):
+  return {
+    "last_update_success": coordinator.last_update_success if coordinator is not None else None,
+    "update_interval_in_seconds": coordinator.update_interval.total_seconds() if coordinator is not None and coordinator.update_interval is not None else None,
+    "last_evaluated": result.last_evaluated if result is not None else None,
+    "last_retrieved": result.last_retrieved if result is not None else None,
+    "next_refresh": result.next_refresh if result is not None else None,
+    "request_attempts": result.request_attempts if result is not None else None,
+    "refresh_rate_in_minutes": result.refresh_rate_in_minutes if result is not None else None,
+    "last_error": exception_to_string(result.last_error) if result is not None and result.last_error is not None else None,
+  }
+
+def get_request_diagnostics(client: SmolApiClient):
+  requests = {}
+  for operation, metrics in client.metrics.operations.items():
+    percentiles = metrics.get_latency_percentiles([50, 95, 99])
+    requests[operation] = {
+      "requests": metrics.requests,
+      "errors": metrics.errors,
+      "errors_by_type": dict(metrics.errors_by_type),
+      "bytes_received": metrics.bytes_received,
+      "p50_latency_in_ms": to_milliseconds(percentiles[50]),
+      "p95_latency_in_ms": to_milliseconds(percentiles[95]),
+      "p99_latency_in_ms": to_milliseconds(percentiles[99]),
+      "recent_latencies_in_ms": [to_milliseconds(latency) for latency in metrics.get_latencies_in_window()[-RECENT_LATENCIES:]],
+    }
+
+  return requests
+
+def get_token_diagnostics(client: SmolApiClient):
+  token_manager = client.token_manager
+  token = token_manager.token
+  current = now()
+  return {
+    "grant_type": token.grant_type if token is not None else None,
+    "last_retrieved": token_manager.last_fetched,
+    "age_in_seconds": round((current - token_manager.last_fetched).total_seconds()) if token_manager.last_fetched is not None else None,
+    "expires_in_seconds": round((token.expiration - current).total_seconds()) if token is not None else None,
+    "last_retrieval_duration_in_seconds": token_manager.last_fetch_duration_in_seconds,
+  }
+
+def get_cache_info(cached_function):
+  info = cached_function.cache_info()
+  return { "hits": info.hits, "misses": info.misses, "size": info.currsize }
+
+def get_cache_diagnostics(client: SmolApiClient | None, coordinator: AccountDataUpdateCoordinator | None):
+  caches = {
+    # Shared by all accounts
+    "attribute_parsing": get_cache_info(parse_attribute_string),
+  }
+
+  if client is not None:
+    caches["token_fetches"] = {
+      "fetches": client.token_manager.fetch_count,
+      "coalesced": client.token_manager.coalesced_waiters,
+    }
+    caches["mutations"] = {
+      "executed": client.mutation_queue.executed,
+      "deduplicated": client.mutation_queue.deduplicated,
+    }
+
+  if coordinator is not None:
+    caches["account_refreshes"] = {
+      "refreshes": coordinator.coalesced_refresh.calls,
+      "coalesced": coordinator.coalesced_refresh.coalesced_calls,
+    }
+
+  return caches
+
+def get_listener_diagnostics(coordinator: AccountDataUpdateCoordinator | None):
+  if coordinator is None:
+    return None
+
+  metrics = coordinator.listener_metrics
+  handling = {}
+  for name, durations in sorted(metrics.handling_durations.items(), key=lambda item: item[1]["total_in_seconds"], reverse=True):
+    handling[name] = {
+      "updates": durations["count"],
+      "mean_in_ms": to_milliseconds(durations["total_in_seconds"] / durations["count"]),
+      "max_in_ms": to_milliseconds(durations["max_in_seconds"]),
+      "total_in_ms": to_milliseconds(durations["total_in_seconds"]),
+    }
+
+  return {
+    "updates": metrics.updates,
+    "listeners_notified": metrics.listeners_notified,
+    "listeners_skipped": metrics.listeners_skipped,
+    "last_listeners_notified": metrics.last_listeners_notified,
+    "last_listeners_skipped": metrics.last_listeners_skipped,
+    "handling_by_entity": handling,
+  }
+
+def get_performance_diagnostics(account_data: dict):
+  client: SmolApiClient | None = account_data.get(DATA_CLIENT)
+  coordinator: AccountDataUpdateCoordinator | None = account_data.get(DATA_ACCOUNT_COORDINATOR)
+  store: SmolAccountStore | None = account_data.get(DATA_ACCOUNT_STORE)
+  setup_duration = account_data.get(DATA_SETUP_DURATION)
+
+  performance = {
+    "setup_duration_in_seconds": round(setup_duration, 3) if setup_duration is not None else None,
+    "caches": get_cache_diagnostics(client, coordinator),
+    "storage": {
+      "account_writes_performed": store.writes_performed,
+      "account_writes_skipped": store.writes_skipped,
+    } if store is not None else None,
+    "listeners": get_listener_diagnostics(coordinator),
+  }
+
+  if client is not None:
+    performance["requests"] = get_request_diagnostics(client)
+    performance["token"] = get_token_diagnostics(client)
+    performance["session"] = {
+      # The session may be shared with other accounts, in which case this covers all accounts
+      "tls_handshakes_in_last_hour": client.session_metrics.connections_created_in_window(),
+      "connections_created": client.session_metrics.connections_created,
+    }
+    performance["retries"] = {
+      "retried": client.retry_metrics.retried,
+      "recovered": client.retry_metrics.recovered,
+      "given_up": client.retry_metrics.given_up,
+    }
+    performance["circuit_breaker"] = {
+      "state": client.circuit_breaker.state,
+      "opened": client.circuit_breaker.opened_count,
+      "rejected_requests": client.circuit_breaker.rejected_count,
+    }
+    performance["mutation_queue"] = {
+      "depth": client.mutation_queue.depth,
+      "max_depth": client.mutation_queue.max_depth,
+      "last_wait_in_seconds": client.mutation_queue.last_wait_in_seconds,
+      "max_wait_in_seconds": client.mutation_queue.max_wait_in_seconds,
+    }
+
+  return performance
+
+async def async_get_config_entry_diagnostics(hass, entry):
+  """Return diagnostics for a config entry, including a snapshot of how the integration is performing"""
+  config = dict(entry.data)
+  account_name = config[CONFIG_ACCOUNT_NAME]
+  account_data = hass.data.get(DOMAIN, {}).get(account_name, {})
+  result: AccountCoordinatorResult | None = account_data.get(DATA_ACCOUNT)
+
+  _LOGGER.info(f"Retrieving diagnostics for {account_name}")
+
+  return {
+    "config": async_redact_data(config, TO_REDACT),
+    "account": get_account_diagnostics(result),
+    "coordinator": get_coordinator_diagnostics(account_data.get(DATA_ACCOUNT_COORDINATOR), result),
+    "performance": get_performance_diagnostics(account_data),
+  }
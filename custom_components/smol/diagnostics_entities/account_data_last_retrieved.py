@@ -1,12 +1,19 @@
+from homeassistant.core import callback
+
 from .base import SmolBaseDataLastRetrieved
+from ..api_client import SmolApiClient
+from ..const import DATA_SETUP_DURATION, DOMAIN
+from ..coordinators.account import ACCOUNT_CONTEXT_RESULT
 
 class SmolAccountDataLastRetrieved(SmolBaseDataLastRetrieved):
   """Sensor for displaying the last time the account data was last retrieved."""
+  _unrecorded_attributes = SmolBaseDataLastRetrieved._unrecorded_attributes | frozenset({ "token_grant_type", "token_last_retrieved", "token_retrieval_duration_in_seconds", "setup_duration_in_seconds", "requests_retried", "requests_recovered", "requests_given_up", "api_circuit_state", "api_circuit_rejected_requests" })
 
-  def __init__(self, hass, coordinator, account_name):
+  def __init__(self, hass, coordinator, account_name, client: SmolApiClient):
     """Init sensor."""
     self._account_name = account_name
-    SmolBaseDataLastRetrieved.__init__(self, hass, coordinator)
+    self._client = client
+    SmolBaseDataLastRetrieved.__init__(self, hass, coordinator, ACCOUNT_CONTEXT_RESULT)
 
   @property
   def unique_id(self):
@@ -16,4 +23,31 @@ class SmolAccountDataLastRetrieved(SmolBaseDataLastRetrieved):
   @property
   def name(self):
     """Name of the sensor."""
-    return f"Account Data Last Retrieved ({self._account_name})"
\ No newline at end of file
+    return f"Account Data Last Retrieved ({self._account_name})"
+
+  def _get_additional_attributes(self) -> dict:
+    token_manager = self._client.token_manager
+    token = token_manager.token
+    setup_duration = self.hass.data[DOMAIN][self._account_name].get(DATA_SETUP_DURATION) if self.hass is not None else None
+    return {
+      "setup_duration_in_seconds": round(setup_duration, 3) if setup_duration is not None else None,
+      "token_grant_type": token.grant_type if token is not None else None,
+      "token_last_retrieved": token_manager.last_fetched,
+      "token_retrieval_duration_in_seconds": round(token_manager.last_fetch_duration_in_seconds, 3) if token_manager.last_fetch_duration_in_seconds is not None else None,
+      "requests_retried": self._client.retry_metrics.retried,
+      "requests_recovered": self._client.retry_metrics.recovered,
+      "requests_given_up": self._client.retry_metrics.given_up,
+      "api_circuit_state": self._client.circuit_breaker.state,
+      "api_circuit_rejected_requests": self._client.circuit_breaker.rejected_count,
+    }
+
+  @callback
+  def _handle_circuit_state_changed(self, state: str) -> None:
+    # The circuit can change outside of an account refresh (e.g. when a service is called), so update straight away
+    self._attributes = { **self._attributes, **self._get_additional_attributes() }
+    self.async_write_ha_state()
+
+  async def async_added_to_hass(self):
+    """Call when entity about to be added to hass."""
+    await super().async_added_to_hass()
+    self.async_on_remove(self._client.circuit_breaker.add_listener(self._handle_circuit_state_changed))
@@ -0,0 +1,120 @@
+import logging
+
+from homeassistant.const import (
+    EntityCategory,
+    UnitOfTime,
+)
+from homeassistant.core import callback
+from homeassistant.components.sensor import (
+  SensorDeviceClass,
+  SensorEntity,
+  SensorStateClass,
+)
+from homeassistant.helpers.entity import generate_entity_id
+
+from ..api_client import SmolApiClient
+from ..utils.durations import to_milliseconds
+
+_LOGGER = logging.getLogger(__name__)
+
+class SmolApiOperationLatency(SensorEntity):
+  """Sensor for displaying the 95th percentile latency of requests for an operation, along with its outcomes."""
+  _unrecorded_attributes = frozenset({ "requests", "errors", "errors_by_type", "bytes_received", "p50_latency", "p99_latency", "last_latency" })
+
+  def __init__(self, hass, account_name: str, client: SmolApiClient, operation: str):
+    """Init sensor."""
+    self._account_name = account_name
+    self._client = client
+    self._operation = operation
+    self._state = None
+    self._attributes = {}
+
+    self.entity_id = generate_entity_id("sensor.{}", self.unique_id, hass=hass)
+
+  @property
+  def unique_id(self):
+    """The id of the sensor."""
+    return f"smol_{self._account_name}_{self._operation}_api_latency"
+
+  @property
+  def name(self):
+    """Name of the sensor."""
+    return f"API Latency {self._operation.replace('_', ' ').title()} ({self._account_name})"
+
+  @property
+  def entity_registry_enabled_default(self) -> bool:
+    """Return if the entity should be enabled when first added.
+
+    This only applies when fist added to the entity registry.
+    """
+    return False
+
+  @property
+  def entity_category(self):
+    """The category of the sensor"""
+    return EntityCategory.DIAGNOSTIC
+
+  @property
+  def should_poll(self) -> bool:
+    return False
+
+  @property
+  def device_class(self):
+    """The type of sensor"""
+    return SensorDeviceClass.DURATION
+
+  @property
+  def state_class(self):
+    """The state class of sensor"""
+    return SensorStateClass.MEASUREMENT
+
+  @property
+  def native_unit_of_measurement(self):
+    """The unit of measurement of sensor"""
+    return UnitOfTime.MILLISECONDS
+
+  @property
+  def suggested_display_precision(self):
+    """The number of decimal places the latency is displayed with"""
+    return 1
+
+  @property
+  def icon(self):
+    """Icon of the sensor."""
+    return "mdi:timer-outline"
+
+  @property
+  def extra_state_attributes(self):
+    """Attributes of the sensor."""
+    return self._attributes
+
+  @property
+  def native_value(self):
+    return self._state
+
+  def _update_state(self):
+    metrics = self._client.metrics.get_operation(self._operation)
+    percentiles = metrics.get_latency_percentiles([50, 95, 99])
+
+    self._state = to_milliseconds(percentiles[95])
+    self._attributes = {
+      "requests": metrics.requests,
+      "errors": metrics.errors,
+      "errors_by_type": dict(metrics.errors_by_type),
+      "bytes_received": metrics.bytes_received,
+      "p50_latency": to_milliseconds(percentiles[50]),
+      "p99_latency": to_milliseconds(percentiles[99]),
+      "last_latency": to_milliseconds(metrics.last_duration_in_seconds),
+    }
+
+  @callback
+  def _handle_request_completed(self, operation: str) -> None:
+    if operation == self._operation:
+      self._update_state()
+      self.async_write_ha_state()
+
+  async def async_added_to_hass(self):
+    """Call when entity about to be added to hass."""
+    await super().async_added_to_hass()
+    self._update_state()
+    self.async_on_remove(self._client.metrics.add_listener(self._handle_request_completed))
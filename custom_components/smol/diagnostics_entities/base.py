@@ -27,9 +27,9 @@ class SmolBaseDataLastRetrieved(CoordinatorEntity, RestoreSensor):
   """Base sensor for data last retrieved."""
   _unrecorded_attributes = frozenset({ "attempts", "next_refresh" })
 
-  def __init__(self, hass, coordinator):
+  def __init__(self, hass, coordinator, context = None):
     """Init sensor."""
-    CoordinatorEntity.__init__(self, coordinator)
+    CoordinatorEntity.__init__(self, coordinator, context)
     self._state = None
     self._attributes = {}
 
@@ -67,6 +67,10 @@ class SmolBaseDataLastRetrieved(CoordinatorEntity, RestoreSensor):
   def native_value(self):
     return self._state
   
+  def _get_additional_attributes(self) -> dict:
+    """Additional attributes provided by the derived sensor"""
+    return {}
+
   @callback
   def _handle_coordinator_update(self) -> None:
     result: BaseCoordinatorResult = self.coordinator.data if self.coordinator is not None and self.coordinator.data is not None else None
@@ -76,6 +80,7 @@ class SmolBaseDataLastRetrieved(CoordinatorEntity, RestoreSensor):
       "attempts": result.request_attempts if result is not None else None,
       "next_refresh": result.next_refresh if result is not None else None,
       "last_error": exception_to_string(result.last_error) if result is not None else None,
+      **self._get_additional_attributes(),
     }
     super()._handle_coordinator_update()
 
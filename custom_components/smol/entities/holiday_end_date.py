@@ -17,7 +17,7 @@ from homeassistant.components.sensor import (
 )
 
 from ..utils.attributes import dict_to_typed_dict
-from ..coordinators.account import AccountCoordinatorResult
+from ..coordinators.account import ACCOUNT_CONTEXT_HOLIDAY_MODE, AccountCoordinatorResult
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,7 +27,7 @@ class SmolHolidayEndDate(CoordinatorEntity, RestoreSensor):
   def __init__(self, hass: HomeAssistant, coordinator, account_name: str):
     """Init sensor."""
 
-    CoordinatorEntity.__init__(self, coordinator)
+    CoordinatorEntity.__init__(self, coordinator, ACCOUNT_CONTEXT_HOLIDAY_MODE)
   
     self._account_name = account_name
     self._state = None
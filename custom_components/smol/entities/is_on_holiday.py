@@ -19,9 +19,11 @@ from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.exceptions import ServiceValidationError
 
 from ..utils.attributes import dict_to_typed_dict
-from ..api_client.account import SmolAccount
-from ..coordinators.account import AccountCoordinatorResult
+from ..utils.timers import BoundaryTimer
+from ..api_client.account import SmolAccount, SmolHolidyMode, SmolHolidyModeConfig
+from ..coordinators.account import ACCOUNT_CONTEXT_HOLIDAY_MODE, AccountCoordinatorResult, get_holiday_end_date, set_holiday_mode
 from ..api_client import SmolApiClient
+from ..const import RECONCILE_AFTER_MUTATION_IN_SECONDS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -33,13 +35,14 @@ class SmolIsOnHoliday(CoordinatorEntity, BinarySensorEntity, RestoreEntity):
   def __init__(self, hass: HomeAssistant, coordinator, client: SmolApiClient, account_name: str):
     """Init sensor."""
 
-    CoordinatorEntity.__init__(self, coordinator)
+    CoordinatorEntity.__init__(self, coordinator, ACCOUNT_CONTEXT_HOLIDAY_MODE)
   
     self._account_name = account_name
     self._client = client
     self._state = None
     self._attributes = {}
     self._last_updated = None
+    self._holiday_end_timer = BoundaryTimer(hass, self._handle_holiday_end)
 
     self.entity_id = generate_entity_id("binary_sensor.{}", self.unique_id, hass=hass)
 
@@ -67,8 +70,7 @@ class SmolIsOnHoliday(CoordinatorEntity, BinarySensorEntity, RestoreEntity):
   def is_on(self):
     return self._state
   
-  @callback
-  def _handle_coordinator_update(self) -> None:
+  def _update_state(self):
     """Determine if the account is on holiday"""
     self._state = False
     result: AccountCoordinatorResult = self.coordinator.data if self.coordinator is not None and self.coordinator.data is not None else None
@@ -78,11 +80,24 @@ class SmolIsOnHoliday(CoordinatorEntity, BinarySensorEntity, RestoreEntity):
 
       self._attributes = {}
 
-      self._state = account.holidayMode is not None and account.holidayMode.config is not None and account.holidayMode.config.endDate > now()
+      holiday_end_date = get_holiday_end_date(account)
+      self._state = holiday_end_date is not None and holiday_end_date > now()
+
+      # Turn off exactly when the holiday ends, rather than waiting for the account to next be refreshed
+      self._holiday_end_timer.schedule(holiday_end_date if self._state else None)
 
     self._attributes = dict_to_typed_dict(self._attributes)
+
+  @callback
+  def _handle_coordinator_update(self) -> None:
+    self._update_state()
     super()._handle_coordinator_update()
 
+  @callback
+  def _handle_holiday_end(self, _) -> None:
+    self._update_state()
+    self.async_write_ha_state()
+
   async def async_added_to_hass(self):
     """Call when entity about to be added to hass."""
     # If not None, we got an initial value.
@@ -95,6 +110,12 @@ class SmolIsOnHoliday(CoordinatorEntity, BinarySensorEntity, RestoreEntity):
     
     if (self._state is None):
       self._state = False
+
+    # Our restored state may have become stale while we were offline
+    if self.coordinator.data is not None:
+      self._update_state()
+
+    self.async_on_remove(self._holiday_end_timer.cancel)
     
     _LOGGER.debug(f'Restored SmolIsOnHoliday state: {self._state}')
 
@@ -105,17 +126,29 @@ class SmolIsOnHoliday(CoordinatorEntity, BinarySensorEntity, RestoreEntity):
     if local_end_date_time < utcnow().replace(minute=0, second=0, microsecond=0) + timedelta(days=1):
       raise ServiceValidationError("End date time must be in the future")
 
-    result = await self._client.async_start_holiday(local_end_date_time)
-    if result is not True:
+    holiday_mode = await self._client.async_start_holiday(local_end_date_time)
+    if holiday_mode is None:
       raise ServiceValidationError("Failed to start holiday mode")
 
-    await self.coordinator.refresh_account()
+    # Fall back to what we requested if the new end date wasn't returned
+    if holiday_mode.config is None or holiday_mode.config.endDate is None:
+      holiday_mode = SmolHolidyMode(config=SmolHolidyModeConfig(endDate=local_end_date_time))
+
+    # Apply the returned holiday mode straight away, confirming it with Smol shortly after
+    self.coordinator.async_apply_account_update(
+      lambda account: set_holiday_mode(account, holiday_mode),
+      RECONCILE_AFTER_MUTATION_IN_SECONDS
+    )
 
   @callback
   async def async_end_holiday_mode(self):
     """End holiday mode"""
-    result = await self._client.async_end_holiday()
-    if result is not True:
+    holiday_mode = await self._client.async_end_holiday()
+    if holiday_mode is None:
       raise ServiceValidationError("Failed to end holiday mode")
 
-    await self.coordinator.refresh_account()
+    # Apply the returned holiday mode straight away, confirming it with Smol shortly after
+    self.coordinator.async_apply_account_update(
+      lambda account: set_holiday_mode(account, holiday_mode),
+      RECONCILE_AFTER_MUTATION_IN_SECONDS
+    )
@@ -19,19 +19,32 @@ from homeassistant.components.sensor import (
 from homeassistant.exceptions import ServiceValidationError
 
 from ..utils.attributes import dict_to_typed_dict
-from ..coordinators.account import AccountCoordinatorResult
+from ..utils.timers import BoundaryTimer
+from ..const import RECONCILE_AFTER_MUTATION_IN_SECONDS
+from ..coordinators.account import AccountCoordinatorResult, get_subscription_context, set_subscription_next_charge_date
 from ..api_client.account import SmolSubscription
 from ..api_client import SmolApiClient
 
 _LOGGER = logging.getLogger(__name__)
 
+def get_subscription_next_charge_unique_id(account_name: str, subscription: SmolSubscription):
+  return f"smol_{account_name}_{subscription.product.typeId}_subscription_next_charge"
+
+def get_next_charge_date_time(next_charge_date: date) -> datetime:
+  """Converts the requested date into the time Smol charges, ensuring it's in the future"""
+  local_next_charge_date = as_local(datetime.combine(next_charge_date, time(5)))
+  if local_next_charge_date < utcnow().replace(hour=5, minute=0, second=0, microsecond=0) + timedelta(days=1):
+    raise ServiceValidationError("Next charge time must be in the future")
+
+  return local_next_charge_date
+
 class SmolSubscriptionNextCharge(CoordinatorEntity, RestoreSensor):
   """Sensor for determining the next charge date for the subscription."""
 
   def __init__(self, hass: HomeAssistant, coordinator, account_name: str, subscription: SmolSubscription, client: SmolApiClient):
     """Init sensor."""
 
-    CoordinatorEntity.__init__(self, coordinator)
+    CoordinatorEntity.__init__(self, coordinator, get_subscription_context(subscription.product.typeId))
   
     self._account_name = account_name
     self._subscription = subscription
@@ -42,13 +55,14 @@ class SmolSubscriptionNextCharge(CoordinatorEntity, RestoreSensor):
       "product_type_id": self._subscription.product.typeId,
       "product_name": self._subscription.product.name,
     }
+    self._charge_timer = BoundaryTimer(hass, self._handle_charge_time)
 
     self.entity_id = generate_entity_id("sensor.{}", self.unique_id, hass=hass)
 
   @property
   def unique_id(self):
     """The id of the sensor."""
-    return f"smol_{self._account_name}_{self._subscription.product.typeId}_subscription_next_charge"
+    return get_subscription_next_charge_unique_id(self._account_name, self._subscription)
     
   @property
   def name(self):
@@ -81,13 +95,14 @@ class SmolSubscriptionNextCharge(CoordinatorEntity, RestoreSensor):
     if (result is not None and result.account is not None):
       _LOGGER.debug(f"Updating SmolSubscriptionNextCharge for '{self._account_name}'")
 
-      self._state = None
-      for subscription in result.account.subscriptions:
-        if subscription.product.typeId == self._subscription.product.typeId:
-          self._state = subscription.nextChargeScheduledAt
+      subscription = result.subscriptions_by_type_id.get(self._subscription.product.typeId)
+      self._state = subscription.nextChargeScheduledAt if subscription is not None else None
     else:
       self._state = None
 
+    # Find out our new next charge date once we've been charged, rather than polling for it
+    self._charge_timer.schedule(self._state)
+
     self._attributes = dict_to_typed_dict(self._attributes)
     super()._handle_coordinator_update()
 
@@ -102,15 +117,34 @@ class SmolSubscriptionNextCharge(CoordinatorEntity, RestoreSensor):
       self._state = None if state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN) else last_sensor_state.native_value
       _LOGGER.debug(f'Restored SmolSubscriptionNextCharge state: {self._state}')
 
+    self.async_on_remove(self._charge_timer.cancel)
+
+  @callback
+  def _handle_charge_time(self, _) -> None:
+    """Refresh the account, which is shared with any other subscriptions charged at the same time"""
+    _LOGGER.debug(f"Subscription '{self._subscription.product.typeId}' due to be charged; refreshing account")
+    self.hass.async_create_background_task(
+      self._async_refresh_account(),
+      f"smol_{self._account_name}_refresh_account_after_charge"
+    )
+
+  async def _async_refresh_account(self):
+    try:
+      await self.coordinator.refresh_account()
+    except Exception as e:
+      _LOGGER.warning(f"Failed to refresh account after subscription '{self._subscription.product.typeId}' was due to be charged - {e}")
+
   @callback
   async def async_change_next_charge_date(self, next_charge_date: date):
     """Change next charge date"""
-    local_next_charge_date = as_local(datetime.combine(next_charge_date, time(5)))
-    if local_next_charge_date < utcnow().replace(hour=5, minute=0, second=0, microsecond=0) + timedelta(days=1):
-      raise ServiceValidationError("Next charge time must be in the future")
+    local_next_charge_date = get_next_charge_date_time(next_charge_date)
 
     result = await self._client.async_change_next_charge_date(self._subscription.id, self._subscription.address.id, local_next_charge_date)
     if result is not True:
       raise ServiceValidationError("Failed to change next charge date")
 
-    await self.coordinator.refresh_account()
+    # The new date isn't returned, so apply what we requested and confirm it with Smol shortly after
+    self.coordinator.async_apply_account_update(
+      lambda account: set_subscription_next_charge_date(account, self._subscription.id, local_next_charge_date),
+      RECONCILE_AFTER_MUTATION_IN_SECONDS
+    )
@@ -17,7 +17,7 @@ from homeassistant.components.sensor import (
 )
 
 from ..utils.attributes import dict_to_typed_dict
-from ..coordinators.account import AccountCoordinatorResult
+from ..coordinators.account import AccountCoordinatorResult, get_subscription_context
 from ..api_client.account import SmolSubscription
 
 _LOGGER = logging.getLogger(__name__)
@@ -28,7 +28,7 @@ class SmolSubscriptionQuantity(CoordinatorEntity, RestoreSensor):
   def __init__(self, hass: HomeAssistant, coordinator, account_name: str, subscription: SmolSubscription):
     """Init sensor."""
 
-    CoordinatorEntity.__init__(self, coordinator)
+    CoordinatorEntity.__init__(self, coordinator, get_subscription_context(subscription.product.typeId))
   
     self._account_name = account_name
     self._subscription = subscription
@@ -73,10 +73,8 @@ class SmolSubscriptionQuantity(CoordinatorEntity, RestoreSensor):
     if (result is not None and result.account is not None):
       _LOGGER.debug(f"Updating SmolSubscriptionQuantity for '{self._account_name}'")
 
-      self._state = None
-      for subscription in result.account.subscriptions:
-        if subscription.product.typeId == self._subscription.product.typeId:
-          self._state = subscription.product.packSize
+      subscription = result.subscriptions_by_type_id.get(self._subscription.product.typeId)
+      self._state = subscription.product.packSize if subscription is not None else None
     else:
       self._state = None
 
@@ -5,10 +5,12 @@ import voluptuous as vol
 from homeassistant.helpers import config_validation as cv, entity_platform
 
 from .diagnostics_entities.account_data_last_retrieved import SmolAccountDataLastRetrieved
+from .diagnostics_entities.api_operation_latency import SmolApiOperationLatency
 from .entities.subscription_next_charge import SmolSubscriptionNextCharge
 from .entities.subscription_quantity import SmolSubscriptionQuantity
 from .entities.holiday_end_date import SmolHolidayEndDate
 from .api_client.account import SmolAccount
+from .api_client.metrics import operations
 from .const import CONFIG_ACCOUNT_NAME, CONFIG_KIND, CONFIG_KIND_ACCOUNT, DATA_ACCOUNT, DATA_ACCOUNT_COORDINATOR, DATA_CLIENT, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
@@ -34,7 +36,9 @@ async def async_setup_default_sensors(hass, config, async_add_entities):
   entities = []
   if (account_info is not None):
     entities.append(SmolHolidayEndDate(hass, account_coordinator, account_name))
-    entities.append(SmolAccountDataLastRetrieved(hass, account_coordinator, account_name))
+    entities.append(SmolAccountDataLastRetrieved(hass, account_coordinator, account_name, client))
+    for operation in operations:
+      entities.append(SmolApiOperationLatency(hass, account_name, client, operation))
     for subscription in account_info.subscriptions:
       entities.append(SmolSubscriptionQuantity(hass, account_coordinator, account_name, subscription))
       entities.append(SmolSubscriptionNextCharge(hass, account_coordinator, account_name, subscription, client))
@@ -53,4 +57,5 @@ async def async_setup_default_sensors(hass, config, async_add_entities):
         "async_change_next_charge_date"
       )
 
-  async_add_entities(entities, True)
\ No newline at end of file
+  # Our entities are updated by the account coordinator's first refresh, which happens in the background
+  async_add_entities(entities)
\ No newline at end of file
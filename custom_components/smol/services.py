@@ -0,0 +1,114 @@
+import asyncio
+import logging
+
+import voluptuous as vol
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv, entity_registry as er
+from homeassistant.helpers.service import async_extract_entity_ids
+
+from .api_client import SmolApiClient
+from .api_client.account import SmolChangeNextChargeDateResult, SmolSubscription
+from .const import DATA_ACCOUNT, DATA_ACCOUNT_COORDINATOR, DATA_CLIENT, DOMAIN, RECONCILE_AFTER_MUTATION_IN_SECONDS
+from .coordinators.account import AccountCoordinatorResult, set_subscription_next_charge_date
+from .entities.subscription_next_charge import get_next_charge_date_time, get_subscription_next_charge_unique_id
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_CHANGE_NEXT_CHARGE_DATES = "change_next_charge_dates"
+
+CHANGE_NEXT_CHARGE_DATES_SCHEMA = vol.All(
+  cv.make_entity_service_schema(
+    {
+      vol.Required("next_charge_date"): cv.date
+    }
+  )
+)
+
+def get_subscriptions_by_unique_id(hass: HomeAssistant) -> dict[str, tuple[str, SmolSubscription]]:
+  """Gets the account name and subscription for each of our subscription next charge sensors"""
+  subscriptions = {}
+  for account_name, account_data in hass.data.get(DOMAIN, {}).items():
+    result: AccountCoordinatorResult | None = account_data.get(DATA_ACCOUNT)
+    if result is not None and result.account is not None:
+      for subscription in result.subscriptions_by_type_id.values():
+        subscriptions[get_subscription_next_charge_unique_id(account_name, subscription)] = (account_name, subscription)
+
+  return subscriptions
+
+async def async_change_next_charge_dates(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+  """Changes the next charge date of all targeted subscriptions, using a single request per account"""
+  local_next_charge_date = get_next_charge_date_time(call.data["next_charge_date"])
+
+  entity_registry = er.async_get(hass)
+  subscriptions_by_unique_id = get_subscriptions_by_unique_id(hass)
+
+  entity_ids_by_subscription_id: dict[str, str] = {}
+  subscriptions_by_account: dict[str, list[SmolSubscription]] = {}
+  for entity_id in sorted(await async_extract_entity_ids(hass, call)):
+    entry = entity_registry.async_get(entity_id)
+    if entry is None or entry.platform != DOMAIN or entry.unique_id not in subscriptions_by_unique_id:
+      raise ServiceValidationError(f"{entity_id} is not a Smol subscription next charge sensor")
+
+    (account_name, subscription) = subscriptions_by_unique_id[entry.unique_id]
+    if subscription.id not in entity_ids_by_subscription_id:
+      entity_ids_by_subscription_id[subscription.id] = entity_id
+      subscriptions_by_account.setdefault(account_name, []).append(subscription)
+
+  if len(subscriptions_by_account) == 0:
+    raise ServiceValidationError("No subscriptions were provided")
+
+  async def async_change_account_next_charge_dates(account_name: str, subscriptions: list[SmolSubscription]):
+    client: SmolApiClient = hass.data[DOMAIN][account_name][DATA_CLIENT]
+    results = await client.async_change_next_charge_dates(
+      list(map(lambda subscription: (subscription.id, subscription.address.id, local_next_charge_date), subscriptions))
+    )
+
+    changed_subscription_ids = [result.subscriptionId for result in results if result.success]
+    if len(changed_subscription_ids) > 0:
+      def update_account(account):
+        for subscription_id in changed_subscription_ids:
+          set_subscription_next_charge_date(account, subscription_id, local_next_charge_date)
+
+      # The new dates aren't returned, so apply what we requested and confirm it with Smol shortly after
+      coordinator = hass.data[DOMAIN][account_name][DATA_ACCOUNT_COORDINATOR]
+      coordinator.async_apply_account_update(update_account, RECONCILE_AFTER_MUTATION_IN_SECONDS)
+
+    return results
+
+  account_results: list[list[SmolChangeNextChargeDateResult]] = await asyncio.gather(
+    *[async_change_account_next_charge_dates(account_name, subscriptions) for account_name, subscriptions in subscriptions_by_account.items()]
+  )
+
+  results = []
+  for account_result in account_results:
+    for result in account_result:
+      results.append({
+        "entity_id": entity_ids_by_subscription_id[result.subscriptionId],
+        "subscription_id": result.subscriptionId,
+        "success": result.success,
+        "error": result.error,
+      })
+
+  if call.return_response:
+    return { "results": results }
+
+  failed_entity_ids = [result["entity_id"] for result in results if result["success"] == False]
+  if len(failed_entity_ids) > 0:
+    raise HomeAssistantError(f"Failed to change next charge date for {', '.join(failed_entity_ids)}")
+
+  return None
+
+def async_setup_services(hass: HomeAssistant):
+  """Registers the services that can target multiple entities at once"""
+
+  async def async_handle_change_next_charge_dates(call: ServiceCall) -> ServiceResponse:
+    return await async_change_next_charge_dates(hass, call)
+
+  hass.services.async_register(
+    DOMAIN,
+    SERVICE_CHANGE_NEXT_CHARGE_DATES,
+    async_handle_change_next_charge_dates,
+    schema=CHANGE_NEXT_CHARGE_DATES_SCHEMA,
+    supports_response=SupportsResponse.OPTIONAL
+  )
@@ -1,22 +1,75 @@
 import logging
 from ..api_client.account import SmolAccount
+from ..const import DATA_ACCOUNT_STORE, DOMAIN
 from homeassistant.helpers import storage
 
 _LOGGER = logging.getLogger(__name__)
 
+# Coalesce saves so rapid changes (e.g. multiple service calls) only result in a single write
+SAVE_DELAY_IN_SECONDS = 30
+
+class SmolAccountStore:
+  """Long lived store for an account, which only writes to disk when the account has changed"""
+
+  def __init__(self, hass, account_name: str):
+    self._store = storage.Store(hass, "1", f"smol/{account_name}_account.json")
+    self._last_saved: SmolAccount | None = None
+    self._has_pending_write = False
+
+    self.writes_performed = 0
+    self.writes_skipped = 0
+
+  async def async_load(self) -> SmolAccount | None:
+    data = await self._store.async_load()
+    if data is None:
+      return None
+
+    account = SmolAccount.model_validate(data)
+    self._last_saved = account
+    return account
+
+  def async_save(self, account: SmolAccount) -> bool:
+    """Schedules the account to be saved if it has changed since it was last saved"""
+    if account is self._last_saved or account == self._last_saved:
+      self.writes_skipped += 1
+      return False
+
+    self._last_saved = account
+    self._has_pending_write = True
+    self._store.async_delay_save(self.__get_data_to_save, SAVE_DELAY_IN_SECONDS)
+    return True
+
+  async def async_flush(self):
+    """Writes any pending changes immediately"""
+    if self._has_pending_write and self._last_saved is not None:
+      await self._store.async_save(self.__get_data_to_save())
+
+  def __get_data_to_save(self):
+    # Only called when the data is actually being written, so saves coalesced into a single write are counted once
+    self._has_pending_write = False
+    self.writes_performed += 1
+    return self._last_saved.model_dump()
+
+def get_account_store(hass, account_name: str) -> SmolAccountStore:
+  account_data = hass.data.setdefault(DOMAIN, {}).setdefault(account_name, {})
+  if DATA_ACCOUNT_STORE not in account_data:
+    account_data[DATA_ACCOUNT_STORE] = SmolAccountStore(hass, account_name)
+
+  return account_data[DATA_ACCOUNT_STORE]
+
 async def async_load_cached_account(hass, account_name: str):
-  store = storage.Store(hass, "1", f"smol/{account_name}_account.json")
+  store = get_account_store(hass, account_name)
 
   try:
     data = await store.async_load()
     if data is not None:
       _LOGGER.debug(f"Loaded cached account data for {account_name}")
-    return SmolAccount.model_validate(data)
+    return data
   except:
     return None
   
 async def async_save_cached_account(hass, account_name: str, account_data: SmolAccount):
   if account_data is not None:
-    store = storage.Store(hass, "1", f"smol/{account_name}_account.json")
-    await store.async_save(account_data.dict())
-    _LOGGER.debug(f"Saved account data for ({account_name})")
\ No newline at end of file
+    store = get_account_store(hass, account_name)
+    if store.async_save(account_data):
+      _LOGGER.debug(f"Scheduled save of account data for ({account_name})")
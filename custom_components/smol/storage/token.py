@@ -0,0 +1,53 @@
+import logging
+from datetime import datetime
+
+from homeassistant.helpers import storage
+
+from ..api_client.token_manager import SmolToken
+from ..utils.repairs import hash_ids
+
+_LOGGER = logging.getLogger(__name__)
+
+def _create_store(hass, account_name: str):
+  # Marked as private so the file is only readable by the owner
+  return storage.Store(hass, "1", f"smol/{account_name}_token.json", private=True)
+
+async def async_load_cached_token(hass, account_name: str, username: str) -> SmolToken | None:
+  store = _create_store(hass, account_name)
+
+  try:
+    data = await store.async_load()
+    if data is None:
+      return None
+
+    # Make sure we don't use a token that was retrieved for a different user (e.g. the account was reconfigured)
+    if data["username_hash"] != hash_ids(username)[0]:
+      _LOGGER.debug(f"Ignoring cached token for {account_name} as it belongs to a different user")
+      return None
+
+    _LOGGER.debug(f"Loaded cached token for {account_name}")
+    return SmolToken(
+      data["access_token"],
+      datetime.fromisoformat(data["expiration"]),
+      data["refresh_token"],
+      data["grant_type"]
+    )
+  except:
+    return None
+
+async def async_save_cached_token(hass, account_name: str, username: str, token: SmolToken):
+  if token is not None:
+    store = _create_store(hass, account_name)
+    await store.async_save({
+      "username_hash": hash_ids(username)[0],
+      "access_token": token.access_token,
+      "expiration": token.expiration.isoformat(),
+      "refresh_token": token.refresh_token,
+      "grant_type": token.grant_type,
+    })
+    _LOGGER.debug(f"Saved token for ({account_name})")
+
+async def async_remove_cached_token(hass, account_name: str):
+  store = _create_store(hass, account_name)
+  await store.async_remove()
+  _LOGGER.debug(f"Removed cached token for ({account_name})")
@@ -1,60 +1,95 @@
 import re
 from datetime import datetime
+from functools import lru_cache
 
 from homeassistant.util.dt import (as_local)
 
 attribute_keys_to_skip = []
 default_keys_to_ignore = []
 
+integer_pattern = re.compile("^[0-9]+$")
+float_pattern = re.compile("^[0-9]+\\.[0-9]+$")
+
+_removed = object()
+
+@lru_cache(maxsize=1024)
+def parse_attribute_string(value: str):
+  """Parses a string into an int, float or datetime. Returns None if the string is none of these"""
+  # Integers, floats and ISO dates all start with a digit, so we can reject most strings straight away
+  if value == "" or value[0] not in "0123456789":
+    return None
+
+  if integer_pattern.match(value) is not None:
+    return int(value)
+
+  if float_pattern.match(value) is not None:
+    return float(value)
+
+  try:
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+  except ValueError:
+    return None
+
+def _to_typed_value(key, value):
+  if isinstance(value, str):
+    if key in attribute_keys_to_skip:
+      return value
+
+    parsed_value = parse_attribute_string(value)
+    if parsed_value is None:
+      return value
+
+    # Local time is applied outside of the cache, as the configured time zone can change
+    return as_local(parsed_value) if isinstance(parsed_value, datetime) else parsed_value
+
+  if isinstance(value, dict):
+    return dict_to_typed_dict(value)
+
+  if isinstance(value, list):
+    new_array = None
+    for index, item in enumerate(value):
+      new_item = dict_to_typed_dict(item)
+      if new_item is not item:
+        if new_array is None:
+          new_array = list(value)
+        new_array[index] = new_item
+
+    return new_array if new_array is not None else value
+
+  if isinstance(value, datetime):
+    # Ensure all dates are in local time
+    return as_local(value)
+
+  return value
+
 def dict_to_typed_dict(data: dict, keys_to_ignore = []):
+  """
+  Converts string values into their typed equivalents and ensures all dates are in local time.
+  If nothing needs converting, the original dictionary is returned rather than a copy.
+  """
   if data is not None:
 
     if isinstance(data, dict) == False:
       return data
 
-    new_data = data.copy()
-    keys = list(new_data.keys())
-
-    for key in keys:
+    new_data = None
+    for key, value in data.items():
       if key in keys_to_ignore or key in default_keys_to_ignore:
-        del new_data[key]
+        new_value = _removed
+      else:
+        new_value = _to_typed_value(key, value)
+
+      if new_value is value:
         continue
 
-      if isinstance(new_data[key], str) and key not in attribute_keys_to_skip:
-        # Check for integers
-        matches = re.search("^[0-9]+$", new_data[key])
-        if (matches is not None):
-          new_data[key] = int(new_data[key])
-          continue
-        
-        # Check for floats/decimals
-        matches = re.search("^[0-9]+\\.[0-9]+$", new_data[key])
-        if (matches is not None):
-          new_data[key] = float(new_data[key])
-          continue
-
-        # Check for dates
-        is_date = True
-        try:
-          data_as_datetime = datetime.fromisoformat(new_data[key].replace('Z', '+00:00'))
-          new_data[key] = as_local(data_as_datetime)
-          continue
-        except:
-          # Do nothing
-          is_date = False
-
-      elif isinstance(new_data[key], dict):
-        new_data[key] = dict_to_typed_dict(new_data[key])
-      elif isinstance(new_data[key], list):
-        new_array = []
-        for item in new_data[key]:
-          new_array.append(dict_to_typed_dict(item))
-
-        new_data[key] = new_array
-      elif isinstance(new_data[key], datetime):
-        # Ensure all dates are in local time
-        new_data[key] = as_local(new_data[key])
-
-    return new_data
-  
-  return None
\ No newline at end of file
+      if new_data is None:
+        new_data = data.copy()
+
+      if new_value is _removed:
+        del new_data[key]
+      else:
+        new_data[key] = new_value
+
+    return new_data if new_data is not None else data
+
+  return None
@@ -0,0 +1,49 @@
+import asyncio
+from typing import Awaitable, Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+class CoalescedCall(Generic[T]):
+  """
+  Coalesces calls made within a short window into a single call that all callers await. Calls made once the
+  underlying call has started will trigger a new call, so callers always receive a result from after they called.
+  """
+
+  def __init__(self, async_call: Callable[[], Awaitable[T]], window_in_seconds: float):
+    self._async_call = async_call
+    self._window_in_seconds = window_in_seconds
+    self._pending: asyncio.Future | None = None
+
+    self.calls = 0
+    self.coalesced_calls = 0
+
+  async def async_call(self) -> T:
+    if self._pending is None:
+      self.calls += 1
+      self._pending = asyncio.ensure_future(self.__async_call_after_window())
+      self._pending.add_done_callback(self.__on_call_complete)
+    else:
+      self.coalesced_calls += 1
+
+    # Shield the call so a cancelled caller doesn't cancel the call for everyone else
+    return await asyncio.shield(self._pending)
+
+  def cancel(self):
+    if self._pending is not None:
+      self._pending.cancel()
+      self._pending = None
+
+  async def __async_call_after_window(self) -> T:
+    await asyncio.sleep(self._window_in_seconds)
+
+    # Anyone calling from now on may have made changes we won't see, so they need a new call
+    self._pending = None
+    return await self._async_call()
+
+  def __on_call_complete(self, task: asyncio.Future):
+    if self._pending is task:
+      self._pending = None
+
+    # Mark any exception as retrieved, as all callers may have been cancelled
+    if task.cancelled() == False:
+      task.exception()
@@ -0,0 +1,3 @@
+def to_milliseconds(duration_in_seconds: float | None) -> float | None:
+  """Converts a duration in seconds to milliseconds, keeping microsecond precision"""
+  return round(duration_in_seconds * 1000, 3) if duration_in_seconds is not None else None
@@ -1,6 +1,8 @@
-from ..api_client import ApiException, RequestException, ServerException, TimeoutException
+from ..api_client import ApiException, CircuitOpenException, RequestException, ServerException, TimeoutException
 
 def api_exception_to_string(e: ApiException):
+  if isinstance(e, CircuitOpenException):
+    return "Smol servers are currently failing, so requests have been paused. Please try again later."
   if isinstance(e, ServerException):
     return "Error on Smol servers. Please try again later."
   if isinstance(e, TimeoutException):
@@ -0,0 +1,56 @@
+import logging
+import re
+
+REDACTED = "**REDACTED**"
+
+# Keys whose values identify the user, their account or grant access to it
+redacted_keys = [
+  "access_token",
+  "refresh_token",
+  "password",
+  "username",
+  "id",
+  "subscriptionId",
+  "subscription_id",
+  "addressId",
+  "address_id",
+]
+
+# Matches key/value pairs in dicts, json and log messages, e.g. 'id': 'sub-1', "addressId": "1" or subscriptionId: 1
+key_value_pattern = re.compile(
+  r"""(?<!\w)(['"]?(?:""" + "|".join(redacted_keys) + r""")['"]?\s*[:=]\s*)(['"]?)([^'",\s;)}\]]+)\2"""
+)
+bearer_token_pattern = re.compile(r"(Bearer\s+)[^\s'\",;]+")
+email_pattern = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+")
+
+def redact(message: str) -> str:
+  """Removes tokens, ids and email addresses from the message"""
+  message = key_value_pattern.sub(
+    lambda match: match.group(0) if match.group(3) in ("None", "null") else f"{match.group(1)}{match.group(2)}{REDACTED}{match.group(2)}",
+    message
+  )
+  message = bearer_token_pattern.sub(lambda match: f"{match.group(1)}{REDACTED}", message)
+  return email_pattern.sub(REDACTED, message)
+
+class RedactionFilter(logging.Filter):
+  """
+  Redacts sensitive information from log records. Filters are only called for records that are going to be
+  logged, so messages are only formatted and redacted when the level is enabled.
+  """
+
+  def filter(self, record: logging.LogRecord) -> bool:
+    try:
+      message = record.getMessage()
+    except Exception:
+      # Filters run outside of the handler's error handling, so leave malformed records (e.g. mismatched arguments)
+      # for the handler to report rather than raising into the caller
+      return True
+
+    redacted_message = redact(message)
+    if redacted_message != message:
+      record.msg = redacted_message
+      record.args = None
+
+    return True
+
+redaction_filter = RedactionFilter()
@@ -0,0 +1,56 @@
+from datetime import datetime
+import logging
+from typing import Callable
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util.dt import (as_utc, utcnow)
+
+_LOGGER = logging.getLogger(__name__)
+
+class BoundaryTimer:
+  """
+  Calls back at a single point in time, such as when a holiday ends, so time derived state can change exactly on
+  time without polling. Scheduling a new time replaces any previously scheduled time.
+  """
+
+  def __init__(self, hass: HomeAssistant, action: Callable[[datetime], None]):
+    self._hass = hass
+    self._action = action
+    self._scheduled_for: datetime | None = None
+    self._cancel: CALLBACK_TYPE | None = None
+
+  @property
+  def scheduled_for(self) -> datetime | None:
+    return self._scheduled_for
+
+  @callback
+  def schedule(self, point_in_time: datetime | None, current: datetime | None = None):
+    """Schedules the callback for the provided time. Times that have already passed cancel any scheduled callback"""
+    point_in_time = as_utc(point_in_time) if point_in_time is not None else None
+    if point_in_time is not None and point_in_time == self._scheduled_for:
+      return
+
+    self.cancel()
+
+    current = current if current is not None else utcnow()
+    if point_in_time is None or point_in_time <= current:
+      return
+
+    _LOGGER.debug(f"Scheduling boundary for {point_in_time}")
+    self._scheduled_for = point_in_time
+    self._cancel = async_track_point_in_utc_time(self._hass, self.__on_boundary, point_in_time)
+
+  @callback
+  def cancel(self):
+    if self._cancel is not None:
+      self._cancel()
+
+    self._cancel = None
+    self._scheduled_for = None
+
+  @callback
+  def __on_boundary(self, current: datetime):
+    self._cancel = None
+    self._scheduled_for = None
+    self._action(current)
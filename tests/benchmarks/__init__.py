@@ -0,0 +1,8 @@
+from custom_components.smol.api_client.account import SmolAccount
+from fakes.smol_api import create_fake_account_data
+
+def create_account_data(number_of_subscriptions: int, holiday_end_date: str | None = None):
+  return create_fake_account_data(number_of_subscriptions, holiday_end_date)
+
+def create_account(number_of_subscriptions: int, holiday_end_date: str | None = None):
+  return SmolAccount.model_validate(create_account_data(number_of_subscriptions, holiday_end_date))
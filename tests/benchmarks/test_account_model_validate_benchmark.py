@@ -0,0 +1,35 @@
+import pytest
+
+from custom_components.smol.api_client.account import SmolAccount
+from . import create_account_data
+
+@pytest.mark.parametrize("number_of_subscriptions",[3, 500])
+def test_benchmark_model_validate(benchmark, number_of_subscriptions: int):
+  data = create_account_data(number_of_subscriptions, "2025-02-01T00:00:00Z")
+
+  result = benchmark(SmolAccount.model_validate, data)
+
+  assert len(result.subscriptions) == number_of_subscriptions
+
+@pytest.mark.parametrize("number_of_subscriptions",[3, 500])
+def test_benchmark_model_copy(benchmark, number_of_subscriptions: int):
+  # Performed each time we apply a mutation's result to the cached account
+  account = SmolAccount.model_validate(create_account_data(number_of_subscriptions, "2025-02-01T00:00:00Z"))
+
+  benchmark(account.model_copy, deep=True)
+
+def test_benchmark_model_dump(benchmark):
+  # Performed each time the account is written to storage
+  account = SmolAccount.model_validate(create_account_data(500, "2025-02-01T00:00:00Z"))
+
+  benchmark(account.model_dump)
+
+def test_benchmark_unchanged_account_comparison(benchmark):
+  # Performed after each retrieval to determine if the account needs to be written to storage
+  data = create_account_data(500, "2025-02-01T00:00:00Z")
+  account = SmolAccount.model_validate(data)
+  retrieved_account = SmolAccount.model_validate(data)
+
+  result = benchmark(lambda: account == retrieved_account)
+
+  assert result == True
@@ -0,0 +1,59 @@
+import asyncio
+from datetime import timedelta
+import pytest
+
+from homeassistant.util.dt import (as_utc, parse_datetime)
+
+from custom_components.smol.api_client.account import SmolAccount
+from custom_components.smol.coordinators.account import (
+  AccountCoordinatorResult,
+  async_refresh_account,
+  calculate_account_update_interval,
+  get_changed_account_contexts
+)
+from . import create_account, create_account_data
+
+current = as_utc(parse_datetime("2025-01-01T10:00:00Z"))
+
+class StubClient:
+  """Returns a freshly parsed account, as the client would after each retrieval"""
+  def __init__(self, number_of_subscriptions: int):
+    self._data = create_account_data(number_of_subscriptions, "2025-02-01T00:00:00Z")
+
+  async def async_get_account(self):
+    return SmolAccount.model_validate(self._data)
+
+@pytest.mark.parametrize("number_of_subscriptions",[3, 100])
+def test_benchmark_refresh_cycle(benchmark, number_of_subscriptions: int):
+  client = StubClient(number_of_subscriptions)
+  previous_result = AccountCoordinatorResult(current - timedelta(days=1), 1, create_account(number_of_subscriptions, "2025-02-01T00:00:00Z"))
+  loop = asyncio.new_event_loop()
+
+  async def async_refresh():
+    # Mirrors what the coordinator does with each retrieval
+    result = await async_refresh_account(current, client, "main", previous_result, False, lambda: None, lambda key: None)
+    get_changed_account_contexts(previous_result, result)
+    calculate_account_update_interval(current, result)
+    return result
+
+  try:
+    result = benchmark(lambda: loop.run_until_complete(async_refresh()))
+  finally:
+    loop.close()
+
+  assert result is not previous_result
+
+def test_benchmark_refresh_not_due(benchmark):
+  client = StubClient(3)
+  previous_result = AccountCoordinatorResult(current, 1, create_account(3, "2025-02-01T00:00:00Z"))
+  loop = asyncio.new_event_loop()
+
+  async def async_refresh():
+    return await async_refresh_account(current, client, "main", previous_result, False, lambda: None, lambda key: None)
+
+  try:
+    result = benchmark(lambda: loop.run_until_complete(async_refresh()))
+  finally:
+    loop.close()
+
+  assert result is previous_result
@@ -0,0 +1,11 @@
+import pytest
+
+from homeassistant.util.dt import (as_utc, parse_datetime)
+
+from custom_components.smol.utils.requests import calculate_next_refresh
+
+current = as_utc(parse_datetime("2025-01-01T10:12:34Z"))
+
+@pytest.mark.parametrize("request_attempts",[1, 5, 40])
+def test_benchmark_calculate_next_refresh(benchmark, request_attempts: int):
+  benchmark(calculate_next_refresh, current, request_attempts, 360)
@@ -0,0 +1,39 @@
+import asyncio
+import pytest
+
+from fakes.smol_api import FakeSmolApi
+
+@pytest.mark.parametrize("number_of_subscriptions",[5, 100])
+def test_benchmark_get_account_against_fake_api(benchmark, number_of_subscriptions: int):
+  loop = asyncio.new_event_loop()
+  api = FakeSmolApi(number_of_subscriptions=number_of_subscriptions)
+  loop.run_until_complete(api.async_start())
+  client = api.create_client()
+
+  try:
+    # Retrieve our token up front, so only the account retrieval is measured
+    loop.run_until_complete(client.async_refresh_token())
+    benchmark(lambda: loop.run_until_complete(client.async_get_account()))
+  finally:
+    loop.run_until_complete(client.async_close())
+    loop.run_until_complete(api.async_stop())
+    loop.close()
+
+  assert api.requests_for("token") == 1
+
+def test_benchmark_concurrent_get_account_against_fake_api(benchmark):
+  loop = asyncio.new_event_loop()
+  api = FakeSmolApi(number_of_subscriptions=5, latency_in_seconds=0.005)
+  loop.run_until_complete(api.async_start())
+  client = api.create_client()
+
+  async def async_get_accounts():
+    return await asyncio.gather(*[client.async_get_account() for _ in range(10)])
+
+  try:
+    loop.run_until_complete(client.async_refresh_token())
+    benchmark(lambda: loop.run_until_complete(async_get_accounts()))
+  finally:
+    loop.run_until_complete(client.async_close())
+    loop.run_until_complete(api.async_stop())
+    loop.close()
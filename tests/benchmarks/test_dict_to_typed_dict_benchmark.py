@@ -0,0 +1,44 @@
+from homeassistant.util.dt import (as_local, parse_datetime)
+
+from custom_components.smol.utils.attributes import dict_to_typed_dict, parse_attribute_string
+
+# Attributes as held by entities after their first update
+typed_attributes = {
+  "account_name": "main",
+  "subscription_id": "sub-1",
+  "pack_size": 30,
+  "next_charge_scheduled_at": as_local(parse_datetime("2025-01-20T04:00:00Z")),
+}
+
+# Attributes as restored from the state machine, where everything is a string
+restored_attributes = {
+  "account_name": "main",
+  "subscription_id": "sub-1",
+  "pack_size": "30",
+  "price": "12.50",
+  "next_charge_scheduled_at": "2025-01-20T04:00:00Z",
+  "friendly_name": "Smol Subscription Next Charge",
+  "icon": "mdi:clock",
+}
+
+nested_attributes = {
+  "account_name": "main",
+  "address": { "id": "address-1", "postcode": "AB1 2CD" },
+  "charges": [{ "date": "2025-01-20T04:00:00Z", "quantity": "2" } for _ in range(10)],
+}
+
+def test_benchmark_typed_attributes(benchmark):
+  benchmark(dict_to_typed_dict, typed_attributes)
+
+def test_benchmark_restored_attributes(benchmark):
+  benchmark(dict_to_typed_dict, restored_attributes)
+
+def test_benchmark_restored_attributes_without_cache(benchmark):
+  def convert():
+    parse_attribute_string.cache_clear()
+    dict_to_typed_dict(restored_attributes)
+
+  benchmark(convert)
+
+def test_benchmark_nested_attributes(benchmark):
+  benchmark(dict_to_typed_dict, nested_attributes)
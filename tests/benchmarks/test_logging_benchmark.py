@@ -0,0 +1,32 @@
+import logging
+import pytest
+
+from homeassistant.util.dt import (now)
+
+from custom_components.smol.coordinators import BaseCoordinatorResult
+from . import create_account
+
+_LOGGER = logging.getLogger("custom_components.smol.coordinators")
+
+@pytest.fixture(autouse=True)
+def debug_disabled():
+  level = _LOGGER.level
+  _LOGGER.setLevel(logging.INFO)
+  yield
+  _LOGGER.setLevel(level)
+
+def test_benchmark_eager_debug_log_when_disabled(benchmark):
+  # The previous approach, which formats the message even though nobody reads it
+  account = create_account(100)
+
+  benchmark(lambda: _LOGGER.debug(f'account: {account}'))
+
+def test_benchmark_lazy_debug_log_when_disabled(benchmark):
+  account = create_account(100)
+
+  benchmark(lambda: _LOGGER.debug('account: %s', account))
+
+def test_benchmark_coordinator_result_when_debug_disabled(benchmark):
+  current = now()
+
+  benchmark(BaseCoordinatorResult, current, 1, 30)
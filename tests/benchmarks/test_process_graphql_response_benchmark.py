@@ -0,0 +1,25 @@
+from custom_components.smol.api_client import RequestException, process_graphql_response
+from . import create_account_data
+
+url = "https://customer-api.smol.com/v2/graphql"
+
+def test_benchmark_successful_response(benchmark):
+  data = { "data": { "customer": create_account_data(500) } }
+
+  benchmark(process_graphql_response, data, url, "Unknown", False, [])
+
+def test_benchmark_accepted_error_response(benchmark):
+  data = { "data": None, "errors": [{ "message": "Not found.", "extensions": { "errorCode": "NOT_FOUND" } }] }
+
+  benchmark(process_graphql_response, data, url, "Unknown", False, ["NOT_FOUND"])
+
+def test_benchmark_error_response(benchmark):
+  data = { "data": None, "errors": [{ "message": f"Subscription {index} not found.", "path": [f"change{index}"] } for index in range(10)] }
+
+  def process():
+    try:
+      process_graphql_response(data, url, "Unknown", False, [])
+    except RequestException:
+      pass
+
+  benchmark(process)
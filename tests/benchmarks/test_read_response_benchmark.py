@@ -0,0 +1,50 @@
+import asyncio
+import json
+
+from custom_components.smol.api_client import SmolApiClient
+from . import create_account_data
+
+url = "https://customer-api.smol.com/v2/graphql"
+
+class FakeRequestInfo:
+  def __init__(self):
+    self.headers = {}
+
+class FakeResponse:
+  def __init__(self, status: int, body: bytes):
+    self.status = status
+    self.request_info = FakeRequestInfo()
+    self._body = body
+
+  async def read(self):
+    return self._body
+
+  async def text(self):
+    return self._body.decode("utf-8")
+
+def create_account_response(number_of_subscriptions: int) -> bytes:
+  # Matches the shape of the responses returned by the account query
+  return json.dumps({ "data": { "customer": create_account_data(number_of_subscriptions, "2025-02-01T00:00:00Z") } }).encode("utf-8")
+
+def test_benchmark_decode_account_response_via_text(benchmark):
+  response = FakeResponse(200, create_account_response(500))
+  loop = asyncio.new_event_loop()
+
+  async def read():
+    # The previous decode path
+    return json.loads(await response.text())
+
+  try:
+    benchmark(lambda: loop.run_until_complete(read()))
+  finally:
+    loop.close()
+
+def test_benchmark_read_account_response(benchmark):
+  client = SmolApiClient("user", "pass")
+  response = FakeResponse(200, create_account_response(500))
+  loop = asyncio.new_event_loop()
+
+  try:
+    benchmark(lambda: loop.run_until_complete(client.__async_read_response__(response, url)))
+  finally:
+    loop.close()
@@ -0,0 +1,7 @@
+from custom_components.smol.const import REPAIR_ACCOUNT_NOT_FOUND
+from custom_components.smol.utils.repairs import safe_repair_key
+
+def test_benchmark_safe_repair_key(benchmark):
+  result = benchmark(safe_repair_key, REPAIR_ACCOUNT_NOT_FOUND, "main")
+
+  assert "main" not in result
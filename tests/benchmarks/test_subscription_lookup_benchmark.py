@@ -0,0 +1,34 @@
+from homeassistant.util.dt import (now)
+
+from custom_components.smol.coordinators.account import AccountCoordinatorResult
+from . import create_account
+
+number_of_subscriptions = 500
+
+def test_benchmark_subscription_fan_out_with_linear_scan(benchmark):
+  account = create_account(number_of_subscriptions)
+  type_ids = list(map(lambda subscription: subscription.product.typeId, account.subscriptions))
+
+  def fan_out():
+    # Each subscription entity searching for its subscription, as entities did previously
+    for type_id in type_ids:
+      state = None
+      for subscription in account.subscriptions:
+        if subscription.product.typeId == type_id:
+          state = subscription.nextChargeScheduledAt
+
+  benchmark(fan_out)
+
+def test_benchmark_subscription_fan_out_with_index(benchmark):
+  account = create_account(number_of_subscriptions)
+  type_ids = list(map(lambda subscription: subscription.product.typeId, account.subscriptions))
+  current = now()
+
+  def fan_out():
+    # The index is built once per fetch as part of the result
+    result = AccountCoordinatorResult(current, 1, account)
+    for type_id in type_ids:
+      subscription = result.subscriptions_by_type_id.get(type_id)
+      state = subscription.nextChargeScheduledAt if subscription is not None else None
+
+  benchmark(fan_out)
@@ -0,0 +1,262 @@
+import asyncio
+from collections import deque
+import json
+import re
+import time
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from custom_components.smol.api_client import SmolApiClient
+
+fake_username = "user@example.com"
+fake_password = "password"
+
+# Matches the inline input of each (optionally aliased) operation, e.g. change0: changeNextChargeDate(input: { ... })
+operation_input_pattern = re.compile(r"(?:(\w+):\s*)?(\w+)\(input:\s*\{(.*?)\}\)", re.DOTALL)
+input_field_pattern = re.compile(r'(\w+):\s*("(?:[^"\\]|\\.)*"|\w+)')
+
+def parse_inputs(query: str) -> dict[str, dict]:
+  """Extracts the inline literal input of each operation in the document, keyed by the operation's alias or name"""
+  inputs = {}
+  for match in operation_input_pattern.finditer(query):
+    fields = {}
+    for (key, value) in input_field_pattern.findall(match.group(3)):
+      fields[key] = json.loads(value) if value.startswith('"') else (None if value == "null" else value)
+
+    inputs[match.group(1) if match.group(1) is not None else match.group(2)] = fields
+
+  return inputs
+
+def create_fake_account_data(number_of_subscriptions: int, holiday_end_date: str | None = None):
+  """Creates an account, in the shape returned by Smol's account query, with the requested number of subscriptions"""
+  return {
+    "holidayMode": {
+      "config": { "endDate": holiday_end_date } if holiday_end_date is not None else None
+    },
+    "subscriptions": [
+      {
+        "id": f"sub-{index}",
+        "nextChargeScheduledAt": f"2025-{(index % 12) + 1:02d}-{(index % 28) + 1:02d}T04:00:00Z",
+        "address": { "id": f"address-{index % 3}" },
+        "product": { "typeId": f"product-{index}", "name": f"Product {index}", "packSize": 30 }
+      } for index in range(number_of_subscriptions)
+    ]
+  }
+
+class FakeInjectedError:
+  def __init__(self, endpoint: str | None, status: int, message: str | None, error_code: str | None):
+    self.endpoint = endpoint
+    self.status = status
+    self.message = message
+    self.error_code = error_code
+
+class FakeSmolApi:
+  """
+  A local stand-in for Smol's auth (login.smolproducts.com) and GraphQL (customer-api.smol.com) endpoints, so the
+  client can be tested and benchmarked without credentials or network access. Latency, errors, token expiry and
+  the size of the account can all be configured.
+  """
+
+  def __init__(
+    self,
+    number_of_subscriptions = 3,
+    holiday_end_date: str | None = None,
+    latency_in_seconds: float = 0,
+    token_expires_in_seconds = 3600,
+    rotate_refresh_tokens = True,
+    supports_persisted_queries = True,
+    username = fake_username,
+    password = fake_password
+  ):
+    self.account = create_fake_account_data(number_of_subscriptions, holiday_end_date)
+    self.latency_in_seconds = latency_in_seconds
+    self.token_expires_in_seconds = token_expires_in_seconds
+    self.rotate_refresh_tokens = rotate_refresh_tokens
+    self.supports_persisted_queries = supports_persisted_queries
+    self.username = username
+    self.password = password
+
+    # Every request received, as the endpoint ("token" or "graphql") and the grant type or operation name
+    self.requests: list[tuple[str, str | None]] = []
+
+    self._access_tokens: dict[str, float] = {}
+    self._refresh_tokens: set[str] = set()
+    self._issued_tokens = 0
+    self._persisted_queries: dict[str, str] = {}
+    self._injected_errors: deque[FakeInjectedError] = deque()
+
+    app = web.Application()
+    app.router.add_post("/oauth/token", self.__async_handle_token)
+    app.router.add_post("/v2/graphql", self.__async_handle_graphql)
+    self._server = TestServer(app, host="127.0.0.1")
+
+  @property
+  def base_url(self) -> str:
+    return str(self._server.make_url(""))
+
+  @property
+  def auth_url(self) -> str:
+    return str(self._server.make_url(""))
+
+  def requests_for(self, endpoint: str, name: str | None = None) -> int:
+    return len([request for request in self.requests if request[0] == endpoint and (name is None or request[1] == name)])
+
+  async def async_start(self):
+    await self._server.start_server()
+
+  async def async_stop(self):
+    await self._server.close()
+
+  async def __aenter__(self):
+    await self.async_start()
+    return self
+
+  async def __aexit__(self, *args):
+    await self.async_stop()
+
+  def create_client(self, **kwargs) -> SmolApiClient:
+    """Creates a client pointing at our endpoints"""
+    return SmolApiClient(self.username, self.password, base_url=self.base_url, auth_url=self.auth_url, **kwargs)
+
+  def inject_error(self, status: int, count = 1, endpoint: str | None = None):
+    """Fails the next requests to the endpoint ("token", "graphql" or any if None) with the provided status"""
+    for _ in range(count):
+      self._injected_errors.append(FakeInjectedError(endpoint, status, None, None))
+
+  def inject_graphql_error(self, message: str, count = 1, error_code: str | None = None):
+    """Fails the next graphql requests with the provided GraphQL error"""
+    for _ in range(count):
+      self._injected_errors.append(FakeInjectedError("graphql", 200, message, error_code))
+
+  def expire_tokens(self):
+    """Expires all issued access tokens, as if they had been revoked. Refresh tokens can still be used"""
+    self._access_tokens.clear()
+
+  def __take_injected_error(self, endpoint: str) -> FakeInjectedError | None:
+    for error in self._injected_errors:
+      if error.endpoint is None or error.endpoint == endpoint:
+        self._injected_errors.remove(error)
+        return error
+
+    return None
+
+  async def __async_before_request(self, endpoint: str):
+    if self.latency_in_seconds > 0:
+      await asyncio.sleep(self.latency_in_seconds)
+
+    error = self.__take_injected_error(endpoint)
+    if error is None:
+      return None
+
+    if error.message is not None:
+      extensions = { "errorCode": error.error_code } if error.error_code is not None else {}
+      return web.json_response({ "data": None, "errors": [{ "message": error.message, "extensions": extensions }] })
+
+    return web.json_response({ "error": "injected", "status": error.status }, status=error.status)
+
+  def __issue_token(self, include_refresh_token: bool):
+    self._issued_tokens += 1
+    access_token = f"access-{self._issued_tokens}"
+    self._access_tokens[access_token] = time.monotonic() + self.token_expires_in_seconds
+
+    body = {
+      "access_token": access_token,
+      "expires_in": self.token_expires_in_seconds,
+      "token_type": "Bearer"
+    }
+
+    if include_refresh_token:
+      refresh_token = f"refresh-{self._issued_tokens}"
+      self._refresh_tokens.add(refresh_token)
+      body["refresh_token"] = refresh_token
+
+    return web.json_response(body)
+
+  async def __async_handle_token(self, request: web.Request):
+    payload = await request.json()
+    grant_type = payload.get("grant_type")
+    self.requests.append(("token", grant_type))
+
+    error_response = await self.__async_before_request("token")
+    if error_response is not None:
+      return error_response
+
+    if grant_type == "refresh_token":
+      if payload.get("refresh_token") not in self._refresh_tokens:
+        return web.json_response({ "error": "invalid_grant" }, status=403)
+
+      if self.rotate_refresh_tokens:
+        self._refresh_tokens.remove(payload["refresh_token"])
+
+      return self.__issue_token(self.rotate_refresh_tokens)
+
+    if payload.get("username") != self.username or payload.get("password") != self.password:
+      return web.json_response({ "error": "invalid_grant", "error_description": "Wrong email or password." }, status=403)
+
+    return self.__issue_token(True)
+
+  async def __async_handle_graphql(self, request: web.Request):
+    payload = await request.json()
+    operation_name = payload.get("operationName")
+    self.requests.append(("graphql", operation_name))
+
+    error_response = await self.__async_before_request("graphql")
+    if error_response is not None:
+      return error_response
+
+    authorization = request.headers.get("Authorization", "")
+    access_token = authorization[len("Bearer "):] if authorization.startswith("Bearer ") else None
+    if access_token not in self._access_tokens or self._access_tokens[access_token] <= time.monotonic():
+      return web.json_response({ "error": "Unauthorized" }, status=401)
+
+    query_hash = payload.get("extensions", {}).get("persistedQuery", {}).get("sha256Hash")
+    if "query" not in payload:
+      if self.supports_persisted_queries == False:
+        return web.json_response({ "errors": [{ "message": "PersistedQueryNotSupported" }] })
+      if query_hash not in self._persisted_queries:
+        return web.json_response({ "errors": [{ "message": "PersistedQueryNotFound" }] })
+    elif query_hash is not None and self.supports_persisted_queries:
+      self._persisted_queries[query_hash] = payload["query"]
+
+    inputs = parse_inputs(payload["query"] if "query" in payload else self._persisted_queries[query_hash])
+    if operation_name == "GetAccount":
+      return web.json_response({ "data": { "customer": self.__get_customer() } })
+    elif operation_name == "StartHolidayMode":
+      self.account["holidayMode"] = { "config": { "endDate": inputs["startHolidayMode"]["endDate"] } }
+      return web.json_response({ "data": { "startHolidayMode": self.__get_holiday_mode() } })
+    elif operation_name == "EndHolidayMode":
+      self.account["holidayMode"] = { "config": None }
+      return web.json_response({ "data": { "endHolidayModeEarly": self.__get_holiday_mode() } })
+    elif operation_name in ("ChangeNextChargeDate", "ChangeNextChargeDates"):
+      return web.json_response(self.__change_next_charge_dates(inputs))
+
+    return web.json_response({ "errors": [{ "message": f"Unknown operation {operation_name}" }] }, status=400)
+
+  def __get_customer(self):
+    subscriptions = sorted(
+      self.account["subscriptions"],
+      key=lambda subscription: (subscription["nextChargeScheduledAt"] is None, subscription["nextChargeScheduledAt"] or "")
+    )
+    return { **self.account, "subscriptions": subscriptions }
+
+  def __get_holiday_mode(self):
+    return { "id": "holiday-mode", **self.account["holidayMode"], "__typename": "HolidayMode" }
+
+  def __change_next_charge_dates(self, inputs_by_alias: dict[str, dict]):
+    data = {}
+    errors = []
+    for alias, input in inputs_by_alias.items():
+      subscription = next((subscription for subscription in self.account["subscriptions"] if subscription["id"] == input["subscriptionId"]), None)
+      if subscription is None:
+        data[alias] = None
+        errors.append({ "message": "Subscription not found.", "path": [alias] })
+      else:
+        subscription["nextChargeScheduledAt"] = input["date"]
+        data[alias] = { "__typename": "ChangeNextChargeDatePayload" }
+
+    response = { "data": data }
+    if len(errors) > 0:
+      response["errors"] = errors
+
+    return response
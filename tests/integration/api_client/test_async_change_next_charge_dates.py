@@ -0,0 +1,43 @@
+from datetime import timedelta
+import pytest
+
+from homeassistant.util.dt import (now)
+
+from integration import get_test_context
+from custom_components.smol.api_client import SmolApiClient
+from .test_async_change_next_charge_date import assert_expected_next_charge_date
+
+@pytest.mark.asyncio
+async def test_when_change_next_charge_dates_is_called_then_results_returned():
+    # Arrange
+    context = get_test_context()
+
+    client = SmolApiClient(context.username, context.password)
+
+    account_info = await client.async_get_account()
+    assert account_info is not None 
+    assert account_info.subscriptions is not None 
+    assert len(account_info.subscriptions) > 0
+    original_subscriptions = account_info.subscriptions
+    # Always returns 4am regardless what is sent
+    expected_next_charge_date = now().replace(hour=4, minute=0, second=0, microsecond=0) + timedelta(days=14)
+
+    try:
+        results = await client.async_change_next_charge_dates(
+            list(map(lambda subscription: (subscription.id, subscription.address.id, expected_next_charge_date), original_subscriptions))
+        )
+
+        # Assert
+        assert len(results) == len(original_subscriptions)
+        for result in results:
+            assert result.success is True
+            assert result.error is None
+
+        account_info = await client.async_get_account()
+        for subscription in original_subscriptions:
+            assert_expected_next_charge_date(account_info, subscription.id, expected_next_charge_date)
+    finally:
+        # Cleanup - return to original state
+        for subscription in original_subscriptions:
+            if (subscription.nextChargeScheduledAt is not None):
+                await client.async_change_next_charge_date(subscription.id, subscription.address.id, subscription.nextChargeScheduledAt)
@@ -7,7 +7,7 @@ from integration import get_test_context
 from custom_components.smol.api_client import SmolApiClient
 
 @pytest.mark.asyncio
-async def test_when_start_holiday_mode_is_called_then_true_returned():
+async def test_when_start_holiday_mode_is_called_then_holiday_mode_returned():
     # Arrange
     context = get_test_context()
 
@@ -30,7 +30,9 @@ async def test_when_start_holiday_mode_is_called_then_true_returned():
         account_info = await client.async_get_account()
 
         # Assert
-        assert result is True
+        assert result is not None
+        assert result.config is not None
+        assert result.config.endDate == expected_end_date
         assert account_info is not None
         assert account_info.holidayMode is not None
         assert account_info.holidayMode.config is not None
@@ -0,0 +1,50 @@
+import aiohttp
+import pytest
+
+from integration import get_test_context
+from custom_components.smol.api_client import SmolApiClient, default_base_url
+
+type_query = '''query GetType($name: String!) {
+  __type(name: $name) {
+    name
+    kind
+    inputFields {
+      name
+    }
+  }
+}'''
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("type_name,expected_fields",[
+  ("Market", None),
+  ("StartHolidayModeInput", ["endDate", "market"]),
+  ("EndHolidayModeEarlyInput", ["market"]),
+  ("ChangeNextChargeDateInput", ["market", "date", "subscriptionId", "addressId"]),
+])
+async def test_when_input_type_requested_then_type_exists(type_name: str, expected_fields: list[str] | None):
+    # Confirms the types needed to send arguments as variables rather than inline literals
+
+    # Arrange
+    context = get_test_context()
+    client = SmolApiClient(context.username, context.password)
+
+    try:
+        await client.async_refresh_token()
+        headers = { "Authorization": f"Bearer {client.token_manager.access_token}" }
+
+        # Act
+        async with aiohttp.ClientSession() as session:
+            async with session.post(f"{default_base_url}/v2/graphql", json={ "query": type_query, "variables": { "name": type_name } }, headers=headers) as response:
+                body = await response.json()
+    finally:
+        await client.async_close()
+
+    # Assert
+    assert "errors" not in body
+    assert body["data"]["__type"] is not None
+    assert body["data"]["__type"]["name"] == type_name
+
+    if expected_fields is not None:
+        fields = list(map(lambda field: field["name"], body["data"]["__type"]["inputFields"]))
+        for field in expected_fields:
+            assert field in fields
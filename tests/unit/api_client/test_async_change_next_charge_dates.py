@@ -0,0 +1,113 @@
+from datetime import timedelta
+import pytest
+import mock
+
+from homeassistant.util.dt import (as_utc, now, parse_datetime)
+
+from custom_components.smol.api_client import RequestException, SmolApiClient, token_grant_type_password
+from custom_components.smol.api_client.graphql import create_change_next_charge_dates_mutation
+from custom_components.smol.api_client.token_manager import SmolToken
+
+next_charge_date = as_utc(parse_datetime("2025-02-01T05:00:00Z"))
+
+def create_client():
+  return SmolApiClient("user", "pass", token=SmolToken("valid", now() + timedelta(hours=1), "refresh", token_grant_type_password))
+
+changes = [
+  ("sub-0", "address-1", next_charge_date),
+  ("sub-1", "address-1", next_charge_date),
+  ("sub-2", "address-2", next_charge_date),
+]
+
+def test_when_mutation_created_then_aliased_operation_created_per_change():
+  # Act
+  document = create_change_next_charge_dates_mutation("GB", list(map(lambda change: (change[0], change[1], change[2].isoformat()), changes)))
+
+  # Assert
+  assert document.query.count("changeNextChargeDate(") == 3
+  for index in range(3):
+    assert f"change{index}: changeNextChargeDate(input: {{" in document.query
+    assert f'subscriptionId: "sub-{index}"' in document.query
+
+  # The document contains the values of each change, so can't be persisted
+  assert document.persistable == False
+
+@pytest.mark.asyncio
+async def test_when_all_changes_succeed_then_single_request_sent():
+  # Arrange
+  client = create_client()
+
+  payloads = []
+  async def async_mocked_post(self, url: str, payload: dict, access_token: str):
+    payloads.append(payload)
+    return { "data": { "change0": { "__typename": "Result" }, "change1": { "__typename": "Result" }, "change2": { "__typename": "Result" } } }
+
+  # Act
+  with mock.patch.object(SmolApiClient, "_SmolApiClient__async_post", async_mocked_post):
+    results = await client.async_change_next_charge_dates(changes)
+
+  # Assert
+  assert len(payloads) == 1
+  assert payloads[0]["operationName"] == "ChangeNextChargeDates"
+  assert f'''change2: changeNextChargeDate(input: {{
+    market: GB
+    date: "{next_charge_date.isoformat()}"
+    subscriptionId: "sub-2"
+    addressId: "address-2"
+    donateAWashSubscriptionId: null
+  }})''' in payloads[0]["query"]
+
+  assert list(map(lambda result: (result.subscriptionId, result.success, result.error), results)) == [
+    ("sub-0", True, None),
+    ("sub-1", True, None),
+    ("sub-2", True, None),
+  ]
+
+@pytest.mark.asyncio
+async def test_when_some_changes_fail_then_per_subscription_results_returned():
+  # Arrange
+  client = create_client()
+
+  async def async_mocked_post(self, url: str, payload: dict, access_token: str):
+    response = {
+      "data": { "change0": { "__typename": "Result" }, "change1": None, "change2": { "__typename": "Result" } },
+      "errors": [{ "message": "Subscription cannot be changed.", "path": ["change1"] }]
+    }
+    raise RequestException("Failed", ["Subscription cannot be changed"], response)
+
+  # Act
+  with mock.patch.object(SmolApiClient, "_SmolApiClient__async_post", async_mocked_post):
+    results = await client.async_change_next_charge_dates(changes)
+
+  # Assert
+  assert list(map(lambda result: (result.subscriptionId, result.success, result.error), results)) == [
+    ("sub-0", True, None),
+    ("sub-1", False, "Subscription cannot be changed"),
+    ("sub-2", True, None),
+  ]
+
+@pytest.mark.asyncio
+async def test_when_request_fails_then_exception_raised():
+  # Arrange
+  client = create_client()
+
+  async def async_mocked_post(self, url: str, payload: dict, access_token: str):
+    raise RequestException("Failed", ["Invalid input"], { "data": None, "errors": [{ "message": "Invalid input" }] })
+
+  # Act
+  with mock.patch.object(SmolApiClient, "_SmolApiClient__async_post", async_mocked_post):
+    with pytest.raises(RequestException):
+      await client.async_change_next_charge_dates(changes)
+
+@pytest.mark.asyncio
+async def test_when_no_changes_then_no_request_sent():
+  # Arrange
+  client = create_client()
+
+  # Act
+  with mock.patch.object(SmolApiClient, "_SmolApiClient__async_post") as mocked_post:
+    results = await client.async_change_next_charge_dates([])
+
+  # Assert
+  assert results == []
+  mocked_post.assert_not_called()
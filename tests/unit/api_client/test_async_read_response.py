@@ -0,0 +1,75 @@
+import pytest
+
+from custom_components.smol.api_client import RequestException, ServerException, SmolApiClient, max_error_body_length
+
+class FakeRequestInfo:
+  def __init__(self):
+    self.headers = {}
+
+class FakeResponse:
+  def __init__(self, status: int, body: bytes):
+    self.status = status
+    self.request_info = FakeRequestInfo()
+    self._body = body
+
+  async def read(self):
+    return self._body
+
+  async def text(self):
+    raise Exception("Response should be read as bytes")
+
+url = "https://customer-api.smol.com/v2/graphql"
+
+@pytest.mark.asyncio
+async def test_when_successful_response_then_json_returned():
+  # Arrange
+  client = SmolApiClient("user", "pass")
+  response = FakeResponse(200, b'{"data": {"customer": {"name": "sm\\u00f6l"}}}')
+
+  # Act
+  result = await client.__async_read_response__(response, url)
+
+  # Assert
+  assert result == { "data": { "customer": { "name": "smöl" } } }
+
+@pytest.mark.asyncio
+async def test_when_graphql_errors_then_request_exception_raised():
+  # Arrange
+  client = SmolApiClient("user", "pass")
+  response = FakeResponse(200, b'{"errors": [{"message": "Something went wrong."}]}')
+
+  # Act
+  with pytest.raises(RequestException) as e:
+    await client.__async_read_response__(response, url)
+
+  # Assert
+  assert e.value.errors == ["Something went wrong"]
+
+@pytest.mark.asyncio
+async def test_when_invalid_json_then_exception_raised():
+  # Arrange
+  client = SmolApiClient("user", "pass")
+  response = FakeResponse(200, b'<html>not json</html>')
+
+  # Act
+  with pytest.raises(Exception) as e:
+    await client.__async_read_response__(response, url)
+
+  # Assert
+  assert "<html>not json</html>" in str(e.value)
+
+@pytest.mark.asyncio
+async def test_when_large_error_response_then_error_truncated():
+  # Arrange
+  client = SmolApiClient("user", "pass")
+  body = b'a' * (max_error_body_length * 10)
+  response = FakeResponse(502, body)
+
+  # Act
+  with pytest.raises(ServerException) as e:
+    await client.__async_read_response__(response, url)
+
+  # Assert
+  assert 'a' * max_error_body_length in str(e.value)
+  assert 'a' * (max_error_body_length + 1) not in str(e.value)
+  assert f'({len(body)} bytes)' in str(e.value)
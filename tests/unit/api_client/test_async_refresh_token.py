@@ -0,0 +1,91 @@
+from datetime import timedelta
+import pytest
+import mock
+
+from homeassistant.util.dt import (now)
+
+from custom_components.smol.api_client import AuthenticationException, ServerException, SmolApiClient, token_grant_type_password, token_grant_type_refresh_token
+from custom_components.smol.api_client.token_manager import SmolToken
+
+def create_expired_token(refresh_token: str | None = "refresh"):
+  return SmolToken("expired", now() - timedelta(minutes=1), refresh_token, token_grant_type_password)
+
+@pytest.mark.asyncio
+async def test_when_refresh_token_available_then_refresh_token_grant_used():
+  # Arrange
+  client = SmolApiClient("user", "pass")
+  client.token_manager.set_token(create_expired_token())
+
+  requested_grant_types = []
+  async def async_mocked_fetch_token(self, grant_type: str, current_token: SmolToken | None):
+    requested_grant_types.append(grant_type)
+    return SmolToken("new", now() + timedelta(hours=1), current_token.refresh_token, grant_type)
+
+  # Act
+  with mock.patch.object(SmolApiClient, "_SmolApiClient__async_fetch_token", async_mocked_fetch_token):
+    await client.async_refresh_token()
+
+  # Assert
+  assert requested_grant_types == [token_grant_type_refresh_token]
+  assert client.token_manager.access_token == "new"
+  assert client.token_manager.token.grant_type == token_grant_type_refresh_token
+  assert client.token_manager.last_fetch_duration_in_seconds is not None
+
+@pytest.mark.asyncio
+async def test_when_refresh_token_grant_fails_then_password_grant_used():
+  # Arrange
+  client = SmolApiClient("user", "pass")
+  client.token_manager.set_token(create_expired_token())
+
+  requested_grant_types = []
+  async def async_mocked_fetch_token(self, grant_type: str, current_token: SmolToken | None):
+    requested_grant_types.append(grant_type)
+    if grant_type == token_grant_type_refresh_token:
+      raise AuthenticationException("Invalid refresh token", [])
+
+    return SmolToken("new", now() + timedelta(hours=1), "new_refresh", grant_type)
+
+  # Act
+  with mock.patch.object(SmolApiClient, "_SmolApiClient__async_fetch_token", async_mocked_fetch_token):
+    await client.async_refresh_token()
+
+  # Assert
+  assert requested_grant_types == [token_grant_type_refresh_token, token_grant_type_password]
+  assert client.token_manager.token.refresh_token == "new_refresh"
+  assert client.token_manager.token.grant_type == token_grant_type_password
+
+@pytest.mark.asyncio
+async def test_when_no_refresh_token_available_then_password_grant_used():
+  # Arrange
+  client = SmolApiClient("user", "pass")
+
+  requested_grant_types = []
+  async def async_mocked_fetch_token(self, grant_type: str, current_token: SmolToken | None):
+    requested_grant_types.append(grant_type)
+    return SmolToken("new", now() + timedelta(hours=1), "refresh", grant_type)
+
+  # Act
+  with mock.patch.object(SmolApiClient, "_SmolApiClient__async_fetch_token", async_mocked_fetch_token):
+    await client.async_refresh_token()
+
+  # Assert
+  assert requested_grant_types == [token_grant_type_password]
+
+@pytest.mark.asyncio
+async def test_when_refresh_token_grant_raises_server_error_then_password_grant_not_attempted():
+  # Arrange
+  client = SmolApiClient("user", "pass")
+  client.token_manager.set_token(create_expired_token())
+
+  requested_grant_types = []
+  async def async_mocked_fetch_token(self, grant_type: str, current_token: SmolToken | None):
+    requested_grant_types.append(grant_type)
+    raise ServerException()
+
+  # Act
+  with mock.patch.object(SmolApiClient, "_SmolApiClient__async_fetch_token", async_mocked_fetch_token):
+    with pytest.raises(ServerException):
+      await client.async_refresh_token()
+
+  # Assert
+  assert requested_grant_types == [token_grant_type_refresh_token]
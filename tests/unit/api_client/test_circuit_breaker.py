@@ -0,0 +1,155 @@
+from datetime import datetime
+import pytest
+import mock
+
+from custom_components.smol.api_client import CircuitOpenException, RequestException, ServerException, SmolApiClient
+from custom_components.smol.api_client.circuit_breaker import SmolCircuitBreaker, circuit_state_closed, circuit_state_half_open, circuit_state_open
+
+def test_when_failures_below_threshold_then_circuit_closed():
+  # Arrange
+  circuit_breaker = SmolCircuitBreaker(failure_threshold=3)
+
+  # Act
+  circuit_breaker.record_failure(0)
+  circuit_breaker.record_failure(0)
+
+  # Assert
+  assert circuit_breaker.state == circuit_state_closed
+  assert circuit_breaker.allow_request(0) == True
+
+def test_when_success_recorded_then_consecutive_failures_reset():
+  # Arrange
+  circuit_breaker = SmolCircuitBreaker(failure_threshold=3)
+
+  # Act
+  circuit_breaker.record_failure(0)
+  circuit_breaker.record_failure(0)
+  circuit_breaker.record_success()
+  circuit_breaker.record_failure(0)
+
+  # Assert
+  assert circuit_breaker.state == circuit_state_closed
+
+def test_when_failure_threshold_reached_then_requests_rejected():
+  # Arrange
+  circuit_breaker = SmolCircuitBreaker(failure_threshold=3, recovery_timeout_in_seconds=60)
+
+  # Act
+  for _ in range(3):
+    circuit_breaker.record_failure(0)
+
+  # Assert
+  assert circuit_breaker.state == circuit_state_open
+  assert circuit_breaker.opened_count == 1
+  assert circuit_breaker.allow_request(59) == False
+  assert circuit_breaker.rejected_count == 1
+
+def test_when_recovery_timeout_passed_then_single_trial_request_allowed():
+  # Arrange
+  circuit_breaker = SmolCircuitBreaker(failure_threshold=1, recovery_timeout_in_seconds=60)
+  circuit_breaker.record_failure(0)
+
+  # Act
+  first_allowed = circuit_breaker.allow_request(60)
+  second_allowed = circuit_breaker.allow_request(60)
+
+  # Assert
+  assert first_allowed == True
+  assert second_allowed == False
+  assert circuit_breaker.state == circuit_state_half_open
+
+@pytest.mark.parametrize("trial_succeeded,expected_state",[
+  (True, circuit_state_closed),
+  (False, circuit_state_open),
+])
+def test_when_trial_request_completes_then_circuit_updated(trial_succeeded: bool, expected_state: str):
+  # Arrange
+  circuit_breaker = SmolCircuitBreaker(failure_threshold=1, recovery_timeout_in_seconds=60)
+  circuit_breaker.record_failure(0)
+  assert circuit_breaker.allow_request(60) == True
+
+  # Act
+  if trial_succeeded:
+    circuit_breaker.record_success()
+  else:
+    circuit_breaker.record_failure(60)
+
+  # Assert
+  assert circuit_breaker.state == expected_state
+  assert circuit_breaker.allow_request(61) == trial_succeeded
+
+def test_when_trial_request_aborted_then_another_trial_allowed():
+  # Arrange
+  circuit_breaker = SmolCircuitBreaker(failure_threshold=1, recovery_timeout_in_seconds=60)
+  circuit_breaker.record_failure(0)
+  assert circuit_breaker.allow_request(60) == True
+
+  # Act
+  circuit_breaker.record_aborted()
+
+  # Assert
+  assert circuit_breaker.state == circuit_state_half_open
+  assert circuit_breaker.allow_request(60) == True
+
+def test_when_circuit_changes_state_then_listeners_notified_until_removed():
+  # Arrange
+  circuit_breaker = SmolCircuitBreaker(failure_threshold=2, recovery_timeout_in_seconds=60)
+  states = []
+  remove_listener = circuit_breaker.add_listener(lambda state: states.append(state))
+
+  # Act
+  circuit_breaker.record_failure(0)
+  circuit_breaker.record_failure(0)
+  circuit_breaker.record_failure(0)
+  circuit_breaker.allow_request(60)
+  circuit_breaker.record_success()
+  remove_listener()
+  circuit_breaker.record_failure(100)
+  circuit_breaker.record_failure(100)
+
+  # Assert
+  assert states == [circuit_state_open, circuit_state_half_open, circuit_state_closed]
+  assert circuit_breaker.state == circuit_state_open
+
+@pytest.mark.asyncio
+async def test_when_circuit_open_then_client_fails_fast():
+  # Arrange
+  client = SmolApiClient("user", "pass", circuit_breaker=SmolCircuitBreaker(failure_threshold=2))
+
+  requests = []
+  async def async_mocked_send_graphql(self, document):
+    requests.append(document.operation_name)
+    raise ServerException()
+
+  # Act
+  with mock.patch.object(SmolApiClient, "_SmolApiClient__async_send_graphql", async_mocked_send_graphql):
+    for _ in range(2):
+      with pytest.raises(ServerException):
+        await client.async_end_holiday()
+
+    with pytest.raises(CircuitOpenException):
+      await client.async_end_holiday()
+
+    # Reads stop retrying as soon as the circuit is open
+    with pytest.raises(CircuitOpenException):
+      await client.async_get_account()
+
+  # Assert
+  assert requests == ["EndHolidayMode", "EndHolidayMode"]
+  assert client.circuit_breaker.state == circuit_state_open
+
+@pytest.mark.asyncio
+async def test_when_request_errors_then_circuit_remains_closed():
+  # Arrange
+  client = SmolApiClient("user", "pass", circuit_breaker=SmolCircuitBreaker(failure_threshold=1))
+
+  async def async_mocked_send_graphql(self, document):
+    raise RequestException("Failed", ["Invalid date"])
+
+  # Act
+  with mock.patch.object(SmolApiClient, "_SmolApiClient__async_send_graphql", async_mocked_send_graphql):
+    with pytest.raises(RequestException):
+      await client.async_change_next_charge_date("sub-1", "address-1", datetime(2025, 1, 1))
+
+  # Assert
+  assert client.circuit_breaker.state == circuit_state_closed
@@ -0,0 +1,140 @@
+from datetime import datetime, timezone
+import pytest
+import aiohttp
+
+from custom_components.smol.api_client import AuthenticationException, ServerException, SmolApiClient, TimeoutException
+from custom_components.smol.api_client.retry import SmolRetryPolicy
+from fakes.smol_api import FakeSmolApi
+
+def create_retry_policy():
+  return SmolRetryPolicy((ServerException, TimeoutException, aiohttp.ClientConnectionError), base_delay_in_seconds=0, max_delay_in_seconds=0)
+
+@pytest.mark.asyncio
+async def test_when_get_account_called_then_account_returned():
+  # Arrange
+  async with FakeSmolApi(number_of_subscriptions=25, holiday_end_date="2025-02-01T00:00:00Z") as api:
+    client = api.create_client()
+
+    # Act
+    try:
+      account = await client.async_get_account()
+    finally:
+      await client.async_close()
+
+  # Assert
+  assert account is not None
+  assert len(account.subscriptions) == 25
+  assert account.holidayMode.config.endDate == datetime(2025, 2, 1, tzinfo=timezone.utc)
+  assert api.requests == [("token", "http://auth0.com/oauth/grant-type/password-realm"), ("graphql", "GetAccount")]
+
+@pytest.mark.asyncio
+async def test_when_credentials_are_wrong_then_authentication_exception_raised():
+  # Arrange
+  async with FakeSmolApi() as api:
+    client = SmolApiClient(api.username, "wrong", base_url=api.base_url, auth_url=api.auth_url)
+
+    # Act
+    try:
+      with pytest.raises(AuthenticationException):
+        await client.async_get_account()
+    finally:
+      await client.async_close()
+
+  # Assert
+  assert api.requests_for("graphql") == 0
+
+@pytest.mark.asyncio
+async def test_when_token_revoked_then_new_token_retrieved_via_refresh_token():
+  # Arrange
+  async with FakeSmolApi() as api:
+    client = api.create_client()
+
+    # Act
+    try:
+      await client.async_get_account()
+      api.expire_tokens()
+      account = await client.async_get_account()
+    finally:
+      await client.async_close()
+
+  # Assert
+  assert account is not None
+  assert api.requests_for("token", "refresh_token") == 1
+  assert api.requests_for("graphql", "GetAccount") == 3
+
+@pytest.mark.asyncio
+async def test_when_server_errors_injected_then_request_retried():
+  # Arrange
+  async with FakeSmolApi() as api:
+    client = api.create_client(retry_policy=create_retry_policy())
+    api.inject_error(503, count=2, endpoint="graphql")
+
+    # Act
+    try:
+      account = await client.async_get_account()
+    finally:
+      await client.async_close()
+
+  # Assert
+  assert account is not None
+  assert api.requests_for("graphql", "GetAccount") == 3
+  assert client.retry_metrics.recovered == 1
+
+@pytest.mark.asyncio
+async def test_when_latency_exceeds_timeout_then_timeout_exception_raised():
+  # Arrange
+  async with FakeSmolApi(latency_in_seconds=0.5) as api:
+    client = api.create_client(timeout_in_seconds=0.1)
+
+    # Act
+    try:
+      with pytest.raises(TimeoutException):
+        await client.async_refresh_token()
+    finally:
+      await client.async_close()
+
+@pytest.mark.asyncio
+async def test_when_persisted_queries_used_then_query_only_sent_once():
+  # Arrange
+  async with FakeSmolApi() as api:
+    client = api.create_client(use_persisted_queries=True)
+
+    # Act
+    try:
+      for _ in range(3):
+        await client.async_get_account()
+    finally:
+      await client.async_close()
+
+  # Assert
+  # The first hash is unknown, so is sent again with the full query
+  assert api.requests_for("graphql", "GetAccount") == 4
+
+@pytest.mark.asyncio
+async def test_when_mutations_sent_then_account_updated():
+  # Arrange
+  end_date = datetime(2025, 3, 1, tzinfo=timezone.utc)
+  next_charge_date = datetime(2025, 4, 1, 4, tzinfo=timezone.utc)
+
+  async with FakeSmolApi(number_of_subscriptions=2) as api:
+    client = api.create_client()
+
+    # Act
+    try:
+      holiday_mode = await client.async_start_holiday(end_date)
+      results = await client.async_change_next_charge_dates([
+        ("sub-0", "address-0", next_charge_date),
+        ("sub-missing", "address-0", next_charge_date),
+      ])
+      account = await client.async_get_account()
+    finally:
+      await client.async_close()
+
+  # Assert
+  assert holiday_mode.config.endDate == end_date
+  assert account.holidayMode.config.endDate == end_date
+  assert [(result.subscriptionId, result.success, result.error) for result in results] == [
+    ("sub-0", True, None),
+    ("sub-missing", False, "Subscription not found"),
+  ]
+  assert next(subscription for subscription in account.subscriptions if subscription.id == "sub-0").nextChargeScheduledAt == next_charge_date
@@ -0,0 +1,117 @@
+import pytest
+
+from custom_components.smol.api_client import RequestException, ServerException
+from custom_components.smol.api_client.metrics import (
+  SmolClientMetrics,
+  SmolOperationMetrics,
+  calculate_percentile,
+  operation_get_account,
+  operation_start_holiday,
+  operation_token
+)
+from fakes.smol_api import FakeSmolApi
+
+@pytest.mark.parametrize("percentile,expected_value",[
+  (50, 5),
+  (95, 10),
+  (99, 10),
+  (10, 1),
+  (0, 1),
+])
+def test_when_percentile_calculated_then_nearest_rank_returned(percentile: float, expected_value: float):
+  # Act
+  result = calculate_percentile([1, 2, 3, 4, 5, 6, 7, 8, 9, 10], percentile)
+
+  # Assert
+  assert result == expected_value
+
+def test_when_no_values_then_percentile_is_none():
+  assert calculate_percentile([], 95) is None
+
+def test_when_requests_recorded_then_counts_and_percentiles_updated():
+  # Arrange
+  metrics = SmolOperationMetrics()
+
+  # Act
+  for index in range(100):
+    metrics.record_request((index + 1) / 1000, ServerException() if index % 10 == 0 else None, current=0)
+  metrics.record_request(0.5, TimeoutError(), current=0)
+  metrics.record_bytes_received(100)
+  metrics.record_bytes_received(50)
+
+  # Assert
+  assert metrics.requests == 101
+  assert metrics.errors == 11
+  assert metrics.errors_by_type == { "ServerException": 10, "TimeoutError": 1 }
+  assert metrics.bytes_received == 150
+  assert metrics.last_duration_in_seconds == 0.5
+  assert metrics.get_latency_percentiles([50, 95, 99], current=0) == { 50: 0.051, 95: 0.096, 99: 0.1 }
+
+def test_when_latencies_fall_outside_window_then_they_are_excluded():
+  # Arrange
+  metrics = SmolOperationMetrics(window_in_seconds=60)
+  metrics.record_request(10, current=0)
+  metrics.record_request(0.1, current=100)
+
+  # Act
+  result = metrics.get_latency_percentiles([50, 99], current=120)
+
+  # Assert
+  assert result == { 50: 0.1, 99: 0.1 }
+  assert metrics.requests == 2
+
+def test_when_max_samples_exceeded_then_oldest_latencies_dropped():
+  # Arrange
+  metrics = SmolOperationMetrics(max_samples=3)
+
+  # Act
+  for duration in [10, 1, 2, 3]:
+    metrics.record_request(duration, current=0)
+
+  # Assert
+  assert metrics.get_latencies_in_window(current=0) == [1, 2, 3]
+
+def test_when_request_recorded_then_listeners_notified_until_removed():
+  # Arrange
+  metrics = SmolClientMetrics()
+  notified = []
+  remove_listener = metrics.add_listener(lambda operation: notified.append(operation))
+
+  # Act
+  metrics.record_request(operation_token, 0.1)
+  remove_listener()
+  metrics.record_request(operation_get_account, 0.1)
+
+  # Assert
+  assert notified == [operation_token]
+  assert metrics.get_operation(operation_token).requests == 1
+  assert metrics.get_operation(operation_get_account).requests == 1
+
+@pytest.mark.asyncio
+async def test_when_client_sends_requests_then_metrics_recorded_per_operation():
+  # Arrange
+  async with FakeSmolApi(number_of_subscriptions=10) as api:
+    client = api.create_client()
+    api.inject_graphql_error("Something went wrong.")
+
+    # Act
+    try:
+      with pytest.raises(RequestException):
+        await client.async_get_account()
+      await client.async_get_account()
+    finally:
+      await client.async_close()
+
+  # Assert
+  token_metrics = client.metrics.get_operation(operation_token)
+  assert token_metrics.requests == 1
+  assert token_metrics.errors == 0
+  assert token_metrics.bytes_received > 0
+
+  account_metrics = client.metrics.get_operation(operation_get_account)
+  assert account_metrics.requests == 2
+  assert account_metrics.errors_by_type == { "RequestException": 1 }
+  assert account_metrics.bytes_received > 0
+  assert account_metrics.get_latency_percentiles([95])[95] is not None
+
+  assert client.metrics.get_operation(operation_start_holiday).requests == 0
@@ -0,0 +1,84 @@
+import hashlib
+
+from custom_components.smol.api_client.graphql import (
+  GraphQLDocument,
+  account_query,
+  create_account_query,
+  create_end_holiday_mode_mutation,
+  create_start_holiday_mode_mutation,
+  default_market,
+  end_holiday_mode_mutation
+)
+
+def test_when_document_created_then_hash_computed():
+  # Act
+  document = GraphQLDocument("Test", "query Test { id }")
+
+  # Assert
+  assert document.sha256_hash == hashlib.sha256("query Test { id }".encode("utf-8")).hexdigest()
+
+def test_when_account_query_created_then_market_inlined_and_document_reused():
+  # Act
+  document = create_account_query("GB")
+
+  # Assert
+  assert "customer(market: GB)" in document.query
+  assert "$" not in document.query
+  assert document.persistable == True
+  assert create_account_query("GB") is document
+  assert create_end_holiday_mode_mutation("GB") is create_end_holiday_mode_mutation("GB")
+
+def test_when_imported_then_default_market_documents_built_and_hashed():
+  # Assert
+  assert create_account_query(default_market) is account_query
+  assert create_end_holiday_mode_mutation(default_market) is end_holiday_mode_mutation
+  assert account_query.sha256_hash is not None
+  assert end_holiday_mode_mutation.sha256_hash is not None
+
+def test_when_start_holiday_mutation_created_then_end_date_inlined_and_not_persistable():
+  # Act
+  document = create_start_holiday_mode_mutation("GB", '2025-01-01T00:00:00+00:00"')
+
+  # Assert
+  assert 'endDate: "2025-01-01T00:00:00+00:00\\""' in document.query
+  assert "market: GB" in document.query
+  assert document.persistable == False
+  assert document.sha256_hash is None
+
+def test_when_payload_created_then_query_sent():
+  # Act
+  payload = create_account_query("GB").to_payload()
+
+  # Assert
+  assert payload == {
+    "operationName": "GetAccount",
+    "variables": {},
+    "query": create_account_query("GB").query
+  }
+
+def test_when_persisted_query_payload_created_then_only_hash_sent():
+  # Act
+  payload = create_account_query("GB").to_payload(use_persisted_query=True)
+
+  # Assert
+  assert payload == {
+    "operationName": "GetAccount",
+    "variables": {},
+    "extensions": { "persistedQuery": { "version": 1, "sha256Hash": create_account_query("GB").sha256_hash } }
+  }
+
+def test_when_hash_included_then_query_and_hash_sent():
+  # Act
+  payload = create_account_query("GB").to_payload(include_hash=True)
+
+  # Assert
+  assert payload["query"] == create_account_query("GB").query
+  assert payload["extensions"]["persistedQuery"]["sha256Hash"] == create_account_query("GB").sha256_hash
+
+def test_when_document_not_persistable_then_persisted_query_payload_contains_full_query():
+  # Act
+  payload = create_start_holiday_mode_mutation("GB", "2025-01-01T00:00:00+00:00").to_payload(use_persisted_query=True)
+
+  # Assert
+  assert "query" in payload
+  assert "extensions" not in payload
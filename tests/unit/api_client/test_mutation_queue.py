@@ -0,0 +1,130 @@
+import asyncio
+import pytest
+
+from custom_components.smol.api_client.mutation_queue import SmolMutationQueue
+
+def create_operation(name: str, events: list[str], release: asyncio.Event | None = None, result = None, exception: Exception | None = None):
+  async def async_operation():
+    events.append(f"{name}_started")
+    if release is not None:
+      await release.wait()
+    events.append(f"{name}_finished")
+    if exception is not None:
+      raise exception
+    return result if result is not None else name
+
+  return async_operation
+
+@pytest.mark.asyncio
+async def test_when_operations_conflict_then_run_in_order():
+  # Arrange
+  queue = SmolMutationQueue()
+  events = []
+  release = asyncio.Event()
+
+  # Act
+  holiday = asyncio.ensure_future(queue.async_run("holiday", create_operation("holiday", events, release), exclusive_resources=["account"]))
+  charge = asyncio.ensure_future(queue.async_run("charge", create_operation("charge", events), exclusive_resources=["subscription_1"], shared_resources=["account"]))
+  await asyncio.sleep(0.01)
+
+  # Assert
+  assert events == ["holiday_started"]
+  assert queue.depth == 2
+
+  release.set()
+  assert await holiday == "holiday"
+  assert await charge == "charge"
+  assert events == ["holiday_started", "holiday_finished", "charge_started", "charge_finished"]
+  assert queue.depth == 0
+  assert queue.max_depth == 2
+  assert queue.max_wait_in_seconds > 0
+
+@pytest.mark.asyncio
+async def test_when_operations_do_not_conflict_then_run_concurrently():
+  # Arrange
+  queue = SmolMutationQueue()
+  events = []
+  release = asyncio.Event()
+
+  # Act
+  first = asyncio.ensure_future(queue.async_run("charge_1", create_operation("charge_1", events, release), exclusive_resources=["subscription_1"], shared_resources=["account"]))
+  second = asyncio.ensure_future(queue.async_run("charge_2", create_operation("charge_2", events, release), exclusive_resources=["subscription_2"], shared_resources=["account"]))
+  await asyncio.sleep(0.01)
+
+  # Assert
+  assert events == ["charge_1_started", "charge_2_started"]
+
+  release.set()
+  await asyncio.gather(first, second)
+
+@pytest.mark.asyncio
+async def test_when_exclusive_operation_queued_after_shared_operations_then_waits_for_all():
+  # Arrange
+  queue = SmolMutationQueue()
+  events = []
+  release = asyncio.Event()
+
+  # Act
+  first = asyncio.ensure_future(queue.async_run("charge_1", create_operation("charge_1", events, release), exclusive_resources=["subscription_1"], shared_resources=["account"]))
+  second = asyncio.ensure_future(queue.async_run("charge_2", create_operation("charge_2", events, release), exclusive_resources=["subscription_2"], shared_resources=["account"]))
+  holiday = asyncio.ensure_future(queue.async_run("holiday", create_operation("holiday", events), exclusive_resources=["account"]))
+  await asyncio.sleep(0.01)
+  release.set()
+  await asyncio.gather(first, second, holiday)
+
+  # Assert
+  assert events[-2:] == ["holiday_started", "holiday_finished"]
+
+@pytest.mark.asyncio
+async def test_when_identical_operation_in_flight_then_operation_sent_once():
+  # Arrange
+  queue = SmolMutationQueue()
+  events = []
+  release = asyncio.Event()
+
+  # Act
+  first = asyncio.ensure_future(queue.async_run(("charge", "sub-1", "2025-01-01"), create_operation("first", events, release), exclusive_resources=["subscription_1"]))
+  second = asyncio.ensure_future(queue.async_run(("charge", "sub-1", "2025-01-01"), create_operation("second", events, release), exclusive_resources=["subscription_1"]))
+  await asyncio.sleep(0.01)
+  release.set()
+  results = await asyncio.gather(first, second)
+
+  # Assert
+  assert results == ["first", "first"]
+  assert events == ["first_started", "first_finished"]
+  assert queue.deduplicated == 1
+  assert queue.executed == 1
+
+@pytest.mark.asyncio
+async def test_when_operation_fails_then_next_operation_still_runs():
+  # Arrange
+  queue = SmolMutationQueue()
+  events = []
+
+  # Act
+  first = asyncio.ensure_future(queue.async_run("first", create_operation("first", events, exception=Exception("Failed")), exclusive_resources=["account"]))
+  second = asyncio.ensure_future(queue.async_run("second", create_operation("second", events), exclusive_resources=["account"]))
+  results = await asyncio.gather(first, second, return_exceptions=True)
+
+  # Assert
+  assert isinstance(results[0], Exception)
+  assert results[1] == "second"
+
+@pytest.mark.asyncio
+async def test_when_caller_cancelled_then_operation_completes():
+  # Arrange
+  queue = SmolMutationQueue()
+  events = []
+  release = asyncio.Event()
+  first = asyncio.ensure_future(queue.async_run("first", create_operation("first", events, release), exclusive_resources=["account"]))
+  second = asyncio.ensure_future(queue.async_run("second", create_operation("second", events), exclusive_resources=["account"]))
+  await asyncio.sleep(0.01)
+
+  # Act
+  first.cancel()
+  release.set()
+
+  # Assert
+  assert await second == "second"
+  assert events == ["first_started", "first_finished", "second_started", "second_finished"]
+  assert queue.depth == 0
@@ -0,0 +1,138 @@
+from datetime import timedelta
+import pytest
+import mock
+
+from homeassistant.util.dt import (now)
+
+from custom_components.smol.api_client import RequestException, SmolApiClient, token_grant_type_password
+from custom_components.smol.api_client.token_manager import SmolToken
+
+def create_client(use_persisted_queries: bool):
+  return SmolApiClient(
+    "user",
+    "pass",
+    token=SmolToken("valid", now() + timedelta(hours=1), "refresh", token_grant_type_password),
+    use_persisted_queries=use_persisted_queries
+  )
+
+account_response = { "data": { "customer": { "holidayMode": { "config": None }, "subscriptions": [] } } }
+
+@pytest.mark.asyncio
+async def test_when_persisted_queries_disabled_then_full_query_sent():
+  # Arrange
+  client = create_client(False)
+
+  payloads = []
+  async def async_mocked_post(self, url: str, payload: dict, access_token: str):
+    payloads.append(payload)
+    return account_response
+
+  # Act
+  with mock.patch.object(SmolApiClient, "_SmolApiClient__async_post", async_mocked_post):
+    account = await client.async_get_account()
+
+  # Assert
+  assert account is not None
+  assert len(payloads) == 1
+  assert "query" in payloads[0]
+  assert "extensions" not in payloads[0]
+  assert "customer(market: GB)" in payloads[0]["query"]
+
+@pytest.mark.asyncio
+async def test_when_persisted_query_known_then_only_hash_sent():
+  # Arrange
+  client = create_client(True)
+
+  payloads = []
+  async def async_mocked_post(self, url: str, payload: dict, access_token: str):
+    payloads.append(payload)
+    return account_response
+
+  # Act
+  with mock.patch.object(SmolApiClient, "_SmolApiClient__async_post", async_mocked_post):
+    account = await client.async_get_account()
+
+  # Assert
+  assert account is not None
+  assert len(payloads) == 1
+  assert "query" not in payloads[0]
+  assert "sha256Hash" in payloads[0]["extensions"]["persistedQuery"]
+
+@pytest.mark.asyncio
+async def test_when_persisted_query_not_found_then_full_query_sent_with_hash():
+  # Arrange
+  client = create_client(True)
+
+  payloads = []
+  async def async_mocked_post(self, url: str, payload: dict, access_token: str):
+    payloads.append(payload)
+    if "query" not in payload:
+      raise RequestException("Failed - PersistedQueryNotFound", ["PersistedQueryNotFound"])
+    return account_response
+
+  # Act
+  with mock.patch.object(SmolApiClient, "_SmolApiClient__async_post", async_mocked_post):
+    account = await client.async_get_account()
+
+  # Assert
+  assert account is not None
+  assert len(payloads) == 2
+  assert "query" not in payloads[0]
+  assert "query" in payloads[1]
+  assert payloads[1]["extensions"] == payloads[0]["extensions"]
+
+@pytest.mark.asyncio
+async def test_when_persisted_queries_not_supported_then_persisted_queries_disabled():
+  # Arrange
+  client = create_client(True)
+
+  payloads = []
+  async def async_mocked_post(self, url: str, payload: dict, access_token: str):
+    payloads.append(payload)
+    if "query" not in payload:
+      raise RequestException("Failed - PersistedQueryNotSupported", ["PersistedQueryNotSupported"])
+    return account_response
+
+  # Act
+  with mock.patch.object(SmolApiClient, "_SmolApiClient__async_post", async_mocked_post):
+    await client.async_get_account()
+    await client.async_get_account()
+
+  # Assert
+  assert len(payloads) == 3
+  assert "query" not in payloads[0]
+  assert "query" in payloads[1]
+  assert "query" in payloads[2]
+
+@pytest.mark.asyncio
+async def test_when_other_request_error_then_exception_raised():
+  # Arrange
+  client = create_client(True)
+
+  async def async_mocked_post(self, url: str, payload: dict, access_token: str):
+    raise RequestException("Failed - Something else", ["Something else"])
+
+  # Act
+  with mock.patch.object(SmolApiClient, "_SmolApiClient__async_post", async_mocked_post):
+    with pytest.raises(RequestException):
+      await client.async_get_account()
+
+@pytest.mark.asyncio
+async def test_when_document_contains_request_values_then_full_query_sent():
+  # Arrange
+  client = create_client(True)
+
+  payloads = []
+  async def async_mocked_post(self, url: str, payload: dict, access_token: str):
+    payloads.append(payload)
+    return { "data": { "changeNextChargeDate": { "__typename": "Result" } } }
+
+  # Act
+  with mock.patch.object(SmolApiClient, "_SmolApiClient__async_post", async_mocked_post):
+    result = await client.async_change_next_charge_date("sub-1", "address-1", now())
+
+  # Assert
+  assert result == True
+  assert len(payloads) == 1
+  assert 'subscriptionId: "sub-1"' in payloads[0]["query"]
+  assert "extensions" not in payloads[0]
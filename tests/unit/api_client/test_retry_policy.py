@@ -0,0 +1,169 @@
+import asyncio
+from datetime import timedelta
+import pytest
+import mock
+
+from homeassistant.util.dt import (now)
+
+from custom_components.smol.api_client import RequestException, ServerException, SmolApiClient, TimeoutException, token_grant_type_password
+from custom_components.smol.api_client.retry import SmolRetryMetrics, SmolRetryPolicy
+from custom_components.smol.api_client.token_manager import SmolToken
+
+def create_policy(max_attempts = 3, deadline_in_seconds = 15):
+  return SmolRetryPolicy((ServerException, TimeoutException), max_attempts=max_attempts, deadline_in_seconds=deadline_in_seconds)
+
+def create_request(failures: list[Exception]):
+  attempts = []
+  async def async_request():
+    attempts.append(len(attempts) + 1)
+    if len(failures) > 0:
+      raise failures.pop(0)
+    return "success"
+
+  return (async_request, attempts)
+
+@pytest.mark.asyncio
+async def test_when_request_succeeds_then_not_retried():
+  # Arrange
+  policy = create_policy()
+  metrics = SmolRetryMetrics()
+  (async_request, attempts) = create_request([])
+
+  # Act
+  with mock.patch("custom_components.smol.api_client.retry.sleep") as mocked_sleep:
+    result = await policy.async_execute(async_request, metrics)
+
+  # Assert
+  assert result == "success"
+  assert len(attempts) == 1
+  mocked_sleep.assert_not_called()
+  assert (metrics.retried, metrics.recovered, metrics.given_up) == (0, 0, 0)
+
+@pytest.mark.asyncio
+async def test_when_transient_failure_then_request_recovered():
+  # Arrange
+  policy = create_policy()
+  metrics = SmolRetryMetrics()
+  (async_request, attempts) = create_request([ServerException(), TimeoutException()])
+
+  # Act
+  with mock.patch("custom_components.smol.api_client.retry.sleep") as mocked_sleep:
+    result = await policy.async_execute(async_request, metrics)
+
+  # Assert
+  assert result == "success"
+  assert len(attempts) == 3
+  assert mocked_sleep.call_count == 2
+  assert (metrics.retried, metrics.recovered, metrics.given_up) == (2, 1, 0)
+
+@pytest.mark.asyncio
+async def test_when_attempts_exhausted_then_exception_raised():
+  # Arrange
+  policy = create_policy(max_attempts=2)
+  metrics = SmolRetryMetrics()
+  (async_request, attempts) = create_request([ServerException(), ServerException(), ServerException()])
+
+  # Act
+  with mock.patch("custom_components.smol.api_client.retry.sleep"):
+    with pytest.raises(ServerException):
+      await policy.async_execute(async_request, metrics)
+
+  # Assert
+  assert len(attempts) == 2
+  assert (metrics.retried, metrics.recovered, metrics.given_up) == (1, 0, 1)
+
+@pytest.mark.asyncio
+async def test_when_deadline_would_be_exceeded_then_not_retried():
+  # Arrange
+  policy = create_policy(deadline_in_seconds=0)
+  metrics = SmolRetryMetrics()
+  (async_request, attempts) = create_request([ServerException()])
+
+  # Act
+  with mock.patch("custom_components.smol.api_client.retry.random.uniform", return_value=0.1):
+    with pytest.raises(ServerException):
+      await policy.async_execute(async_request, metrics)
+
+  # Assert
+  assert len(attempts) == 1
+  assert (metrics.retried, metrics.recovered, metrics.given_up) == (0, 0, 1)
+
+@pytest.mark.asyncio
+async def test_when_non_transient_failure_then_not_retried():
+  # Arrange
+  policy = create_policy()
+  metrics = SmolRetryMetrics()
+  (async_request, attempts) = create_request([RequestException("Failed", [])])
+
+  # Act
+  with pytest.raises(RequestException):
+    await policy.async_execute(async_request, metrics)
+
+  # Assert
+  assert len(attempts) == 1
+  assert (metrics.retried, metrics.recovered, metrics.given_up) == (0, 0, 0)
+
+@pytest.mark.parametrize("attempt,expected_max_delay",[
+  (1, 0.5),
+  (2, 1),
+  (3, 2),
+  (10, 5),
+])
+def test_when_delay_calculated_then_full_jitter_applied_up_to_cap(attempt: int, expected_max_delay: float):
+  # Arrange
+  policy = create_policy()
+
+  # Act
+  with mock.patch("custom_components.smol.api_client.retry.random.uniform", side_effect=lambda low, high: (low, high)):
+    result = policy.get_delay(attempt)
+
+  # Assert
+  assert result == (0, expected_max_delay)
+
+class TimingOutSession:
+  """A session whose requests time out once their timeout has elapsed, advancing our clock instead of waiting"""
+
+  def __init__(self):
+    self.current = 0
+    self.timeouts = []
+
+  def post(self, url, json = None, headers = None, timeout = None):
+    self.timeouts.append(timeout)
+    return self
+
+  async def __aenter__(self):
+    timeout = self.timeouts[-1]
+    self.current += min(timeout.sock_read, timeout.total) if timeout.total is not None else timeout.sock_read
+    raise asyncio.TimeoutError()
+
+  async def __aexit__(self, *args):
+    return False
+
+@pytest.mark.asyncio
+async def test_when_client_times_out_with_default_timeouts_then_retried_within_deadline():
+  # Arrange
+  session = TimingOutSession()
+  client = SmolApiClient(
+    "user",
+    "pass",
+    token=SmolToken("valid", now() + timedelta(hours=1), "refresh", token_grant_type_password),
+    session=session
+  )
+
+  async def async_mocked_sleep(delay: float):
+    session.current += delay
+
+  # Act
+  with mock.patch("custom_components.smol.api_client.retry.time") as mocked_time:
+    mocked_time.monotonic.side_effect = lambda: session.current
+    with mock.patch("custom_components.smol.api_client.retry.sleep", async_mocked_sleep):
+      with pytest.raises(TimeoutException):
+        await client.async_get_account()
+
+  # Assert
+  # Our first attempt uses the full timeout, with the retry capped to the time left before the deadline
+  assert len(session.timeouts) == 2
+  assert session.timeouts[0].sock_read == 20
+  assert session.timeouts[1].total <= 20
+  assert session.current <= 40
+  assert (client.retry_metrics.retried, client.retry_metrics.given_up) == (1, 1)
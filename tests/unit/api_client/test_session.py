@@ -0,0 +1,46 @@
+import pytest
+import mock
+
+from custom_components.smol.api_client import SmolApiClient
+from custom_components.smol.api_client.session import SmolSessionMetrics
+
+def test_when_connections_created_then_only_connections_in_window_counted():
+  # Arrange
+  metrics = SmolSessionMetrics(window_in_seconds=3600)
+
+  # Act
+  metrics.record_connection_created(0)
+  metrics.record_connection_created(1800)
+  metrics.record_connection_created(3599)
+
+  # Assert
+  assert metrics.connections_created == 3
+  assert metrics.connections_created_in_window(3599) == 3
+  assert metrics.connections_created_in_window(3600) == 2
+  assert metrics.connections_created_in_window(7200) == 0
+
+@pytest.mark.asyncio
+async def test_when_session_provided_then_session_not_closed():
+  # Arrange
+  session = mock.AsyncMock()
+  metrics = SmolSessionMetrics()
+  client = SmolApiClient("user", "pass", session=session, session_metrics=metrics)
+
+  # Act
+  await client.async_close()
+
+  # Assert
+  session.close.assert_not_called()
+  assert client.session_metrics is metrics
+
+@pytest.mark.asyncio
+async def test_when_session_not_provided_then_created_session_closed():
+  # Arrange
+  client = SmolApiClient("user", "pass")
+  session = client._create_client_session()
+
+  # Act
+  await client.async_close()
+
+  # Assert
+  assert session.closed == True
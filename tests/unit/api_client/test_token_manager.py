@@ -0,0 +1,168 @@
+import asyncio
+from datetime import timedelta
+import pytest
+
+from homeassistant.util.dt import (now)
+
+from custom_components.smol.api_client.token_manager import SmolToken, SmolTokenManager
+
+@pytest.mark.asyncio
+async def test_when_token_refreshed_concurrently_then_token_only_fetched_once():
+  # Arrange
+  fetch_calls = 0
+  async def async_fetch_token(current_token: SmolToken | None):
+    nonlocal fetch_calls
+    fetch_calls += 1
+    await asyncio.sleep(0.01)
+    return SmolToken("abc", now() + timedelta(hours=1))
+
+  manager = SmolTokenManager(async_fetch_token)
+  number_of_callers = 10
+
+  # Act
+  await asyncio.gather(*[manager.async_refresh_token() for _ in range(number_of_callers)])
+
+  # Assert
+  assert fetch_calls == 1
+  assert manager.fetch_count == 1
+  assert manager.coalesced_waiters == number_of_callers - 1
+  assert manager.access_token == "abc"
+
+@pytest.mark.asyncio
+async def test_when_token_is_valid_then_token_not_fetched():
+  # Arrange
+  fetch_calls = 0
+  async def async_fetch_token(current_token: SmolToken | None):
+    nonlocal fetch_calls
+    fetch_calls += 1
+    return SmolToken("abc", now() + timedelta(hours=1))
+
+  manager = SmolTokenManager(async_fetch_token)
+  await manager.async_refresh_token()
+
+  # Act
+  await manager.async_refresh_token()
+
+  # Assert
+  assert fetch_calls == 1
+  assert manager.coalesced_waiters == 0
+
+@pytest.mark.asyncio
+async def test_when_token_is_about_to_expire_then_token_fetched():
+  # Arrange
+  fetch_calls = 0
+  async def async_fetch_token(current_token: SmolToken | None):
+    nonlocal fetch_calls
+    fetch_calls += 1
+    return SmolToken(f"abc{fetch_calls}", now() + timedelta(minutes=4))
+
+  manager = SmolTokenManager(async_fetch_token)
+  await manager.async_refresh_token()
+
+  # Act
+  await manager.async_refresh_token()
+
+  # Assert
+  assert fetch_calls == 2
+  assert manager.access_token == "abc2"
+
+@pytest.mark.asyncio
+async def test_when_token_fetch_fails_then_all_callers_receive_error_and_next_call_retries():
+  # Arrange
+  fetch_calls = 0
+  async def async_fetch_token(current_token: SmolToken | None):
+    nonlocal fetch_calls
+    fetch_calls += 1
+    await asyncio.sleep(0.01)
+    if fetch_calls == 1:
+      raise Exception("Failed")
+
+    return SmolToken("abc", now() + timedelta(hours=1))
+
+  manager = SmolTokenManager(async_fetch_token)
+
+  # Act
+  results = await asyncio.gather(manager.async_refresh_token(), manager.async_refresh_token(), return_exceptions=True)
+  await manager.async_refresh_token()
+
+  # Assert
+  assert len(results) == 2
+  for result in results:
+    assert isinstance(result, Exception)
+
+  assert fetch_calls == 2
+  assert manager.access_token == "abc"
+
+@pytest.mark.asyncio
+async def test_when_token_fetched_then_token_updated_callback_called():
+  # Arrange
+  async def async_fetch_token(current_token: SmolToken | None):
+    return SmolToken("abc", now() + timedelta(hours=1))
+
+  updated_tokens = []
+  async def async_token_updated(token: SmolToken):
+    updated_tokens.append(token)
+
+  manager = SmolTokenManager(async_fetch_token, async_token_updated=async_token_updated)
+
+  # Act
+  await manager.async_refresh_token()
+
+  # Assert
+  assert len(updated_tokens) == 1
+  assert updated_tokens[0].access_token == "abc"
+
+@pytest.mark.asyncio
+async def test_when_persisted_token_is_valid_then_token_not_fetched():
+  # Arrange
+  fetch_calls = 0
+  async def async_fetch_token(current_token: SmolToken | None):
+    nonlocal fetch_calls
+    fetch_calls += 1
+    return SmolToken("new", now() + timedelta(hours=1))
+
+  manager = SmolTokenManager(async_fetch_token)
+  manager.set_token(SmolToken("persisted", now() + timedelta(hours=1), "refresh"))
+
+  # Act
+  await manager.async_refresh_token()
+
+  # Assert
+  assert fetch_calls == 0
+  assert manager.access_token == "persisted"
+
+@pytest.mark.asyncio
+async def test_when_token_expired_then_token_fetched_with_existing_refresh_token():
+  # Arrange
+  provided_tokens = []
+  async def async_fetch_token(current_token: SmolToken | None):
+    provided_tokens.append(current_token)
+    return SmolToken("new", now() + timedelta(hours=1))
+
+  manager = SmolTokenManager(async_fetch_token)
+  manager.set_token(SmolToken("persisted", now() + timedelta(hours=1), "refresh"))
+
+  # Act
+  manager.expire_token("persisted")
+  await manager.async_refresh_token()
+
+  # Assert
+  assert len(provided_tokens) == 1
+  assert provided_tokens[0].refresh_token == "refresh"
+  assert manager.access_token == "new"
+
+@pytest.mark.asyncio
+async def test_when_expired_token_is_not_current_token_then_token_not_expired():
+  # Arrange
+  async def async_fetch_token(current_token: SmolToken | None):
+    raise Exception("Should not be called")
+
+  manager = SmolTokenManager(async_fetch_token)
+  manager.set_token(SmolToken("current", now() + timedelta(hours=1)))
+
+  # Act
+  manager.expire_token("old")
+  await manager.async_refresh_token()
+
+  # Assert
+  assert manager.access_token == "current"
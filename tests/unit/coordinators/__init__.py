@@ -0,0 +1,43 @@
+import mock
+
+from custom_components.smol.api_client.account import SmolAccount
+from custom_components.smol.coordinators.account import (
+  ACCOUNT_CONTEXT_HOLIDAY_MODE,
+  ACCOUNT_CONTEXT_RESULT,
+  AccountCoordinatorResult,
+  AccountDataUpdateCoordinator,
+  get_subscription_context
+)
+
+def create_account(holiday_end_date: str | None = None, next_charge_dates: list[str | None] = ["2025-01-20T04:00:00Z"]):
+  return SmolAccount.model_validate({
+    "holidayMode": {
+      "config": { "endDate": holiday_end_date } if holiday_end_date is not None else None
+    },
+    "subscriptions": list(map(lambda index_and_date: {
+      "id": f"sub-{index_and_date[0]}",
+      "nextChargeScheduledAt": index_and_date[1],
+      "address": { "id": "address-1" },
+      "product": { "typeId": f"product-{index_and_date[0]}", "name": f"Product {index_and_date[0]}", "packSize": 30 }
+    }, enumerate(next_charge_dates)))
+  })
+
+def create_coordinator(results: list[AccountCoordinatorResult], set_results: list[AccountCoordinatorResult] | None = None):
+  async def async_refresh_account(is_manual_refresh = False):
+    return results.pop(0)
+
+  set_account_result = (lambda result: set_results.append(result)) if set_results is not None else None
+  return AccountDataUpdateCoordinator(mock.MagicMock(), "test", async_refresh_account, set_account_result, refresh_window_in_seconds=0)
+
+def add_listeners(coordinator: AccountDataUpdateCoordinator, contexts: list[str]):
+  calls = {}
+  for context in contexts:
+    calls[context] = 0
+    def update_callback(context = context):
+      calls[context] += 1
+
+    coordinator.async_add_listener(update_callback, context)
+
+  return calls
+
+contexts = [ACCOUNT_CONTEXT_RESULT, ACCOUNT_CONTEXT_HOLIDAY_MODE, get_subscription_context("product-0"), get_subscription_context("product-1")]
@@ -0,0 +1,92 @@
+import pytest
+
+from homeassistant.util.dt import (now)
+
+from custom_components.smol.coordinators.account import (
+  ACCOUNT_CONTEXT_HOLIDAY_MODE,
+  ACCOUNT_CONTEXT_RESULT,
+  AccountCoordinatorResult,
+  get_subscription_context
+)
+from . import add_listeners, contexts, create_account, create_coordinator
+
+@pytest.mark.asyncio
+async def test_when_first_refresh_then_all_listeners_updated():
+  # Arrange
+  coordinator = create_coordinator([AccountCoordinatorResult(now(), 1, create_account())])
+  calls = add_listeners(coordinator, contexts)
+
+  # Act
+  await coordinator.refresh_account()
+
+  # Assert
+  for context in contexts:
+    assert calls[context] == 1
+
+@pytest.mark.asyncio
+async def test_when_subscription_changes_then_only_affected_listeners_updated():
+  # Arrange
+  coordinator = create_coordinator([
+    AccountCoordinatorResult(now(), 1, create_account(next_charge_dates=["2025-01-20T04:00:00Z", "2025-01-21T04:00:00Z"])),
+    AccountCoordinatorResult(now(), 1, create_account(next_charge_dates=["2025-01-20T04:00:00Z", "2025-01-28T04:00:00Z"])),
+  ])
+  calls = add_listeners(coordinator, contexts)
+  await coordinator.refresh_account()
+
+  # Act
+  await coordinator.refresh_account()
+
+  # Assert
+  assert calls[ACCOUNT_CONTEXT_RESULT] == 2
+  assert calls[ACCOUNT_CONTEXT_HOLIDAY_MODE] == 1
+  assert calls[get_subscription_context("product-0")] == 1
+  assert calls[get_subscription_context("product-1")] == 2
+
+@pytest.mark.asyncio
+async def test_when_result_is_reused_then_no_listeners_updated():
+  # Arrange
+  result = AccountCoordinatorResult(now(), 1, create_account())
+  coordinator = create_coordinator([result, result])
+  calls = add_listeners(coordinator, contexts)
+  await coordinator.refresh_account()
+
+  # Act
+  await coordinator.refresh_account()
+
+  # Assert
+  for context in contexts:
+    assert calls[context] == 1
+
+@pytest.mark.asyncio
+async def test_when_listeners_updated_then_fan_out_and_handling_durations_recorded():
+  # Arrange
+  coordinator = create_coordinator([
+    AccountCoordinatorResult(now(), 1, create_account(next_charge_dates=["2025-01-20T04:00:00Z", "2025-01-21T04:00:00Z"])),
+    AccountCoordinatorResult(now(), 1, create_account(next_charge_dates=["2025-01-20T04:00:00Z", "2025-01-28T04:00:00Z"])),
+  ])
+  add_listeners(coordinator, contexts)
+
+  class Entity:
+    entity_id = "sensor.smol_test_product_1_subscription_next_charge"
+
+    def _handle_coordinator_update(self):
+      pass
+
+  entity = Entity()
+  coordinator.async_add_listener(entity._handle_coordinator_update, get_subscription_context("product-1"))
+
+  # Act
+  await coordinator.refresh_account()
+  await coordinator.refresh_account()
+
+  # Assert
+  metrics = coordinator.listener_metrics
+  assert metrics.updates == 2
+  assert metrics.listeners_notified == 8
+  assert metrics.listeners_skipped == 2
+  assert metrics.last_listeners_notified == 3
+  assert metrics.last_listeners_skipped == 2
+
+  durations = metrics.handling_durations["sensor.smol_test_product_1_subscription_next_charge"]
+  assert durations["count"] == 2
+  assert durations["max_in_seconds"] >= 0
@@ -0,0 +1,69 @@
+import asyncio
+from datetime import timedelta
+import pytest
+import mock
+
+from homeassistant.util.dt import (now)
+
+from custom_components.smol.api_client import ServerException, SmolApiClient
+from custom_components.smol.coordinators.account import (
+  ACCOUNT_CONTEXT_RESULT,
+  AccountCoordinatorResult,
+  AccountDataUpdateCoordinator,
+  async_refresh_account
+)
+from . import create_account
+
+@pytest.mark.asyncio
+async def test_when_refreshes_requested_concurrently_then_account_retrieved_once():
+  # Arrange
+  client = SmolApiClient("user", "pass")
+  results = [AccountCoordinatorResult(now(), 1, create_account())]
+
+  async def async_mocked_get_account(*args, **kwargs):
+    return create_account(next_charge_dates=["2025-01-22T04:00:00Z"])
+
+  async def async_update_account_data(is_manual_refresh = False):
+    result = await async_refresh_account(now(), client, "test", results[-1], is_manual_refresh, lambda: None, lambda key: None)
+    results.append(result)
+    return result
+
+  coordinator = AccountDataUpdateCoordinator(mock.MagicMock(), "test", async_update_account_data, refresh_window_in_seconds=0.01)
+
+  listener_calls = []
+  coordinator.async_add_listener(lambda: listener_calls.append(1), ACCOUNT_CONTEXT_RESULT)
+
+  # Act
+  mocked_get_account = mock.AsyncMock(side_effect=async_mocked_get_account)
+  with mock.patch.object(SmolApiClient, "async_get_account", mocked_get_account):
+    # e.g. several service calls completing at the same time
+    refreshed = await asyncio.gather(*[coordinator.refresh_account() for _ in range(5)])
+
+  # Assert
+  assert mocked_get_account.await_count == 1
+  assert len(set(map(id, refreshed))) == 1
+  assert len(listener_calls) == 1
+  assert coordinator.coalesced_refresh.coalesced_calls == 4
+
+@pytest.mark.asyncio
+async def test_when_first_refresh_after_cached_startup_fails_then_retried_within_minutes():
+  # Arrange
+  client = SmolApiClient("user", "pass")
+  startup = now()
+
+  # Our cached account, due to be refreshed as part of the first coordinator refresh
+  cached_result = AccountCoordinatorResult(startup, 1, create_account(next_charge_dates=[None]))
+  cached_result.next_refresh = cached_result.last_evaluated
+
+  # Act
+  with mock.patch.object(SmolApiClient, "async_get_account", mock.AsyncMock(side_effect=ServerException())):
+    first_failure = await async_refresh_account(startup, client, "test", cached_result, False, lambda: None, lambda key: None)
+    second_failure = await async_refresh_account(first_failure.next_refresh, client, "test", first_failure, False, lambda: None, lambda key: None)
+
+  # Assert
+  assert first_failure.request_attempts == 2
+  assert first_failure.account is cached_result.account
+  assert first_failure.next_refresh - startup <= timedelta(minutes=1)
+
+  assert second_failure.request_attempts == 3
+  assert second_failure.next_refresh - first_failure.next_refresh <= timedelta(minutes=3)
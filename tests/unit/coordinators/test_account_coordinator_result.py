@@ -0,0 +1,37 @@
+from homeassistant.util.dt import (as_utc, parse_datetime)
+
+from custom_components.smol.coordinators.account import AccountCoordinatorResult
+from . import create_account
+
+current = as_utc(parse_datetime("2025-01-01T10:00:00Z"))
+
+def test_when_result_created_then_subscriptions_indexed():
+  # Arrange
+  account = create_account(next_charge_dates=["2025-01-20T04:00:00Z", "2025-01-21T04:00:00Z"])
+
+  # Act
+  result = AccountCoordinatorResult(current, 1, account)
+
+  # Assert
+  assert len(result.subscriptions_by_type_id) == 2
+  assert result.subscriptions_by_type_id["product-0"] == account.subscriptions[0]
+  assert result.subscriptions_by_type_id["product-1"] == account.subscriptions[1]
+
+def test_when_type_id_is_duplicated_then_first_subscription_indexed():
+  # Arrange
+  account = create_account(next_charge_dates=["2025-01-20T04:00:00Z", "2025-01-21T04:00:00Z"])
+  account.subscriptions[1].product.typeId = account.subscriptions[0].product.typeId
+
+  # Act
+  result = AccountCoordinatorResult(current, 1, account)
+
+  # Assert
+  assert len(result.subscriptions_by_type_id) == 1
+  assert result.subscriptions_by_type_id["product-0"] == account.subscriptions[0]
+
+def test_when_account_is_none_then_indexes_are_empty():
+  # Act
+  result = AccountCoordinatorResult(current, 2, None)
+
+  # Assert
+  assert result.subscriptions_by_type_id == {}
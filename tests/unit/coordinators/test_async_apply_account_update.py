@@ -0,0 +1,108 @@
+from datetime import timedelta
+import pytest
+import mock
+
+from homeassistant.util.dt import (as_utc, now, parse_datetime)
+
+from custom_components.smol.api_client import ServerException
+from custom_components.smol.api_client.account import SmolHolidyMode, SmolHolidyModeConfig
+from custom_components.smol.coordinators.account import (
+  ACCOUNT_CONTEXT_HOLIDAY_MODE,
+  ACCOUNT_CONTEXT_RESULT,
+  AccountCoordinatorResult,
+  get_subscription_context,
+  set_holiday_mode,
+  set_subscription_next_charge_date
+)
+from . import add_listeners, contexts, create_account, create_coordinator
+
+@pytest.mark.asyncio
+async def test_when_holiday_mode_applied_then_holiday_listeners_updated():
+  # Arrange
+  last_evaluated = now() - timedelta(hours=1)
+  original_result = AccountCoordinatorResult(last_evaluated, 1, create_account(next_charge_dates=["2025-01-20T04:00:00Z", "2025-01-21T04:00:00Z"]))
+  set_results = []
+  coordinator = create_coordinator([original_result], set_results)
+  await coordinator.refresh_account()
+  calls = add_listeners(coordinator, contexts)
+  end_date = as_utc(parse_datetime("2025-02-01T10:00:00Z"))
+
+  # Act
+  with mock.patch("custom_components.smol.coordinators.account.async_call_later") as mocked_call_later:
+    result = coordinator.async_apply_account_update(lambda account: set_holiday_mode(account, SmolHolidyMode(config=SmolHolidyModeConfig(endDate=end_date))))
+
+  # Assert
+  assert result.account.holidayMode.config.endDate == end_date
+  assert result.last_evaluated == last_evaluated
+  assert coordinator.data is result
+  assert set_results == [result]
+  mocked_call_later.assert_not_called()
+
+  # Our original account is left untouched
+  assert original_result.account.holidayMode.config is None
+
+  assert calls[ACCOUNT_CONTEXT_RESULT] == 1
+  assert calls[ACCOUNT_CONTEXT_HOLIDAY_MODE] == 1
+  assert calls[get_subscription_context("product-0")] == 0
+  assert calls[get_subscription_context("product-1")] == 0
+
+@pytest.mark.asyncio
+async def test_when_next_charge_date_applied_then_subscription_updated_and_reconciled():
+  # Arrange
+  set_results = []
+  coordinator = create_coordinator([
+    AccountCoordinatorResult(now(), 1, create_account(next_charge_dates=["2025-01-20T04:00:00Z", "2025-01-21T04:00:00Z"])),
+    AccountCoordinatorResult(now(), 1, create_account(next_charge_dates=["2025-01-22T04:00:00Z", "2025-01-21T04:00:00Z"])),
+  ], set_results)
+  await coordinator.refresh_account()
+  calls = add_listeners(coordinator, contexts)
+  next_charge_date = as_utc(parse_datetime("2025-01-22T04:00:00Z"))
+
+  # Act
+  with mock.patch("custom_components.smol.coordinators.account.async_call_later") as mocked_call_later:
+    result = coordinator.async_apply_account_update(lambda account: set_subscription_next_charge_date(account, "sub-0", next_charge_date), 60)
+
+  # Assert
+  assert result.subscriptions_by_type_id["product-0"].nextChargeScheduledAt == next_charge_date
+  assert list(map(lambda subscription: subscription.id, result.account.subscriptions)) == ["sub-1", "sub-0"]
+  assert calls[get_subscription_context("product-0")] == 1
+  assert calls[get_subscription_context("product-1")] == 0
+  assert calls[ACCOUNT_CONTEXT_HOLIDAY_MODE] == 0
+
+  # Confirm our change with Smol later on
+  mocked_call_later.assert_called_once()
+  assert mocked_call_later.call_args[0][1] == 60
+  await mocked_call_later.call_args[0][2](now())
+
+  # Reconciling with the data we applied doesn't change our subscription
+  assert calls[get_subscription_context("product-0")] == 1
+
+@pytest.mark.asyncio
+async def test_when_update_applied_to_failed_result_then_retry_not_delayed():
+  # Arrange
+  current = now()
+  failed_result = AccountCoordinatorResult(current - timedelta(hours=2), 2, create_account(next_charge_dates=[None]), last_error=ServerException())
+  failed_result.next_refresh = current + timedelta(minutes=1)
+  coordinator = create_coordinator([failed_result], [])
+  await coordinator.refresh_account()
+
+  # Act
+  result = coordinator.async_apply_account_update(lambda account: set_holiday_mode(account, SmolHolidyMode(config=None)))
+
+  # Assert
+  assert result.next_refresh == failed_result.next_refresh
+  assert result.request_attempts == 2
+  assert coordinator.update_interval <= timedelta(minutes=1)
+
+@pytest.mark.asyncio
+async def test_when_no_account_then_update_not_applied():
+  # Arrange
+  set_results = []
+  coordinator = create_coordinator([], set_results)
+
+  # Act
+  result = coordinator.async_apply_account_update(lambda account: set_holiday_mode(account, SmolHolidyMode(config=None)))
+
+  # Assert
+  assert result is None
+  assert set_results == []
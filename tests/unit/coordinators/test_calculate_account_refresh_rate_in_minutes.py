@@ -0,0 +1,72 @@
+from datetime import timedelta
+import pytest
+import mock
+
+from homeassistant.util.dt import (as_utc, parse_datetime)
+
+from custom_components.smol.api_client import SmolApiClient
+from custom_components.smol.coordinators.account import AccountCoordinatorResult, async_refresh_account, calculate_account_refresh_rate_in_minutes, calculate_account_update_interval
+from . import create_account
+
+current = as_utc(parse_datetime("2025-01-01T00:00:00Z"))
+
+@pytest.mark.parametrize("holiday_end_date,next_charge_dates,expected_refresh_rate_in_minutes",[
+  (None, [], 1440),
+  (None, [None], 1440),
+  (None, ["2025-01-01T03:00:00Z"], 30),
+  (None, ["2025-01-01T20:00:00Z"], 60),
+  (None, ["2025-01-03T00:00:00Z"], 180),
+  (None, ["2025-01-06T00:00:00Z"], 360),
+  (None, ["2025-01-12T00:00:00Z"], 720),
+  (None, ["2025-02-01T00:00:00Z"], 1440),
+  # Earliest event is used
+  (None, ["2025-02-01T00:00:00Z", "2025-01-03T00:00:00Z"], 180),
+  ("2025-01-01T20:00:00Z", ["2025-02-01T00:00:00Z"], 60),
+  # Recently passed events are treated as happening now
+  (None, ["2024-12-31T20:00:00Z"], 30),
+  (None, ["2024-12-31T12:00:00Z"], 1440),
+])
+def test_when_calculated_then_refresh_rate_based_on_next_event(holiday_end_date: str | None, next_charge_dates: list[str | None], expected_refresh_rate_in_minutes: float):
+  # Arrange
+  account = create_account(holiday_end_date, next_charge_dates)
+
+  # Act
+  result = calculate_account_refresh_rate_in_minutes(current, account)
+
+  # Assert
+  assert result == expected_refresh_rate_in_minutes
+
+def test_when_account_is_none_then_default_refresh_rate_returned():
+  assert calculate_account_refresh_rate_in_minutes(current, None) == 1440
+
+@pytest.mark.asyncio
+async def test_when_coordinator_runs_for_a_month_then_fewer_requests_made_and_charge_picked_up_quickly():
+  # Arrange
+  charge_date = as_utc(parse_datetime("2025-01-30T04:00:00Z"))
+  clock = current
+
+  async def async_mocked_get_account(*args, **kwargs):
+    # Once charged, the next charge is scheduled for the following month
+    return create_account(next_charge_dates=[(charge_date if clock < charge_date else charge_date + timedelta(days=30)).isoformat()])
+
+  client = SmolApiClient("user", "pass")
+  previous_result = AccountCoordinatorResult(current - timedelta(days=1), 1, create_account(next_charge_dates=[charge_date.isoformat()]))
+  end = current + timedelta(days=30)
+
+  # Act
+  fetches = []
+  with mock.patch.multiple(SmolApiClient, async_get_account=async_mocked_get_account):
+    while clock < end:
+      result = await async_refresh_account(clock, client, "test", previous_result, False, lambda: None, lambda key: None)
+      if result is not previous_result:
+        fetches.append(clock)
+      previous_result = result
+      clock = clock + calculate_account_update_interval(clock, previous_result)
+
+  # Assert
+  # A fixed 6 hour refresh rate would have resulted in 120 requests
+  assert len(fetches) < 100
+
+  # The moved charge date is seen within 30 minutes of the charge
+  first_fetch_after_charge = next(fetch for fetch in fetches if fetch >= charge_date)
+  assert first_fetch_after_charge - charge_date <= timedelta(minutes=30)
@@ -0,0 +1,74 @@
+from datetime import timedelta
+import pytest
+import mock
+
+from homeassistant.util.dt import (as_utc, parse_datetime)
+
+from custom_components.smol.api_client import SmolApiClient
+from custom_components.smol.coordinators import calculate_update_interval
+from custom_components.smol.coordinators.account import AccountCoordinatorResult, async_refresh_account, calculate_account_update_interval
+from custom_components.smol.const import COORDINATOR_REFRESH_IN_SECONDS
+from . import create_account
+
+current = as_utc(parse_datetime("2025-01-01T00:00:00Z"))
+
+def test_when_next_refresh_is_in_the_future_then_interval_is_until_next_refresh():
+  # Arrange
+  next_refresh = current + timedelta(hours=6)
+
+  # Act
+  result = calculate_update_interval(current, next_refresh)
+
+  # Assert
+  assert result == timedelta(hours=6)
+
+def test_when_next_refresh_is_in_the_past_then_minimum_interval_returned():
+  # Arrange
+  next_refresh = current - timedelta(minutes=5)
+
+  # Act
+  result = calculate_update_interval(current, next_refresh)
+
+  # Assert
+  assert result == timedelta(seconds=COORDINATOR_REFRESH_IN_SECONDS)
+
+def test_when_account_is_on_holiday_then_interval_is_until_next_refresh():
+  # Arrange
+  # Holiday mode ending is handled by the entities, so shouldn't wake up the coordinator
+  account_result = AccountCoordinatorResult(current, 1, create_account("2025-01-01T00:20:00Z"))
+
+  # Act
+  result = calculate_account_update_interval(current, account_result)
+
+  # Assert
+  assert result == account_result.next_refresh - current
+
+@pytest.mark.asyncio
+async def test_when_coordinator_runs_for_a_day_then_it_only_wakes_up_when_refresh_is_due():
+  # Arrange
+  # Next charge is 5 days away, so the account is refreshed every 6 hours
+  account = create_account(next_charge_dates=["2025-01-06T04:00:00Z"])
+  get_account_calls = 0
+  async def async_mocked_get_account(*args, **kwargs):
+    nonlocal get_account_calls
+    get_account_calls += 1
+    return account
+
+  client = SmolApiClient("user", "pass")
+  previous_result = AccountCoordinatorResult(current, 1, account)
+  end = current + timedelta(days=1)
+
+  # Act
+  # Drive the clock forward by the calculated update interval, as the coordinator would
+  wake_ups = 0
+  clock = current
+  with mock.patch.multiple(SmolApiClient, async_get_account=async_mocked_get_account):
+    while clock < end:
+      previous_result = await async_refresh_account(clock, client, "test", previous_result, False, lambda: None, lambda key: None)
+      wake_ups += 1
+      clock = clock + calculate_account_update_interval(clock, previous_result)
+
+  # Assert
+  # A fixed 60 second poll would have resulted in 1,440 wake ups
+  assert wake_ups == 4
+  assert get_account_calls == 3
@@ -0,0 +1,77 @@
+
+from homeassistant.util.dt import (as_utc, parse_datetime)
+
+from custom_components.smol.coordinators.account import (
+  ACCOUNT_CONTEXT_HOLIDAY_MODE,
+  ACCOUNT_CONTEXT_RESULT,
+  AccountCoordinatorResult,
+  get_changed_account_contexts,
+  get_subscription_context
+)
+from . import create_account
+
+current = as_utc(parse_datetime("2025-01-01T10:00:00Z"))
+
+def test_when_previous_result_is_none_then_none_returned():
+  # Arrange
+  current_result = AccountCoordinatorResult(current, 1, create_account())
+
+  # Act
+  result = get_changed_account_contexts(None, current_result)
+
+  # Assert
+  assert result is None
+
+def test_when_result_is_unchanged_then_no_contexts_returned():
+  # Arrange
+  previous_result = AccountCoordinatorResult(current, 1, create_account())
+
+  # Act
+  result = get_changed_account_contexts(previous_result, previous_result)
+
+  # Assert
+  assert result == set()
+
+def test_when_account_is_equal_then_only_result_context_returned():
+  # Arrange
+  previous_result = AccountCoordinatorResult(current, 1, create_account())
+  current_result = AccountCoordinatorResult(current, 1, create_account())
+
+  # Act
+  result = get_changed_account_contexts(previous_result, current_result)
+
+  # Assert
+  assert result == set([ACCOUNT_CONTEXT_RESULT])
+
+def test_when_holiday_mode_changed_then_holiday_context_returned():
+  # Arrange
+  previous_result = AccountCoordinatorResult(current, 1, create_account())
+  current_result = AccountCoordinatorResult(current, 1, create_account("2025-01-10T10:00:00Z"))
+
+  # Act
+  result = get_changed_account_contexts(previous_result, current_result)
+
+  # Assert
+  assert result == set([ACCOUNT_CONTEXT_RESULT, ACCOUNT_CONTEXT_HOLIDAY_MODE])
+
+def test_when_subscription_changed_then_only_changed_subscription_context_returned():
+  # Arrange
+  previous_result = AccountCoordinatorResult(current, 1, create_account(next_charge_dates=["2025-01-20T04:00:00Z", "2025-01-21T04:00:00Z"]))
+  current_result = AccountCoordinatorResult(current, 1, create_account(next_charge_dates=["2025-01-20T04:00:00Z", "2025-01-25T04:00:00Z"]))
+
+  # Act
+  result = get_changed_account_contexts(previous_result, current_result)
+
+  # Assert
+  assert result == set([ACCOUNT_CONTEXT_RESULT, get_subscription_context("product-1")])
+
+def test_when_subscription_removed_then_removed_subscription_context_returned():
+  # Arrange
+  previous_result = AccountCoordinatorResult(current, 1, create_account(next_charge_dates=["2025-01-20T04:00:00Z", "2025-01-21T04:00:00Z"]))
+  current_result = AccountCoordinatorResult(current, 1, create_account(next_charge_dates=["2025-01-20T04:00:00Z"]))
+
+  # Act
+  result = get_changed_account_contexts(previous_result, current_result)
+
+  # Assert
+  assert result == set([ACCOUNT_CONTEXT_RESULT, get_subscription_context("product-1")])
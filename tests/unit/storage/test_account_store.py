@@ -0,0 +1,125 @@
+import pytest
+import mock
+
+from custom_components.smol.api_client.account import SmolAccount
+from custom_components.smol.storage.account import SmolAccountStore
+
+def create_account(end_date: str | None = None):
+  return SmolAccount.model_validate({
+    "holidayMode": {
+      "config": { "endDate": end_date } if end_date is not None else None
+    },
+    "subscriptions": [
+      {
+        "id": "sub-1",
+        "nextChargeScheduledAt": "2025-01-01T04:00:00Z",
+        "address": { "id": "address-1" },
+        "product": { "typeId": "dishwasher", "name": "Dishwasher Tablets", "packSize": 30 }
+      }
+    ]
+  })
+
+def create_store():
+  with mock.patch("custom_components.smol.storage.account.storage.Store") as store_class:
+    store = SmolAccountStore(mock.MagicMock(), "test")
+    return (store, store_class.return_value)
+
+def test_when_account_saved_for_first_time_then_write_scheduled():
+  # Arrange
+  (store, underlying_store) = create_store()
+
+  # Act
+  result = store.async_save(create_account())
+
+  # Assert
+  assert result is True
+  assert store.writes_performed == 0
+  assert store.writes_skipped == 0
+  assert underlying_store.async_delay_save.call_count == 1
+
+def test_when_same_account_saved_then_write_skipped():
+  # Arrange
+  (store, underlying_store) = create_store()
+  account = create_account()
+  store.async_save(account)
+
+  # Act
+  result = store.async_save(account)
+
+  # Assert
+  assert result is False
+  assert store.writes_skipped == 1
+  assert underlying_store.async_delay_save.call_count == 1
+
+def test_when_equal_account_saved_then_write_skipped():
+  # Arrange
+  (store, underlying_store) = create_store()
+  store.async_save(create_account())
+
+  # Act
+  result = store.async_save(create_account())
+
+  # Assert
+  assert result is False
+  assert store.writes_skipped == 1
+  assert underlying_store.async_delay_save.call_count == 1
+
+def test_when_changed_account_saved_then_write_scheduled():
+  # Arrange
+  (store, underlying_store) = create_store()
+  store.async_save(create_account())
+
+  # Act
+  result = store.async_save(create_account("2025-02-01T10:00:00Z"))
+
+  # Assert
+  assert result is True
+  assert store.writes_skipped == 0
+  assert underlying_store.async_delay_save.call_count == 2
+
+def test_when_multiple_saves_coalesced_then_single_write_counted():
+  # Arrange
+  (store, underlying_store) = create_store()
+  store.async_save(create_account())
+  store.async_save(create_account("2025-02-01T10:00:00Z"))
+
+  # Act
+  # The store asks for the data to save once the delay has passed
+  get_data_to_save = underlying_store.async_delay_save.call_args.args[0]
+  data = get_data_to_save()
+
+  # Assert
+  assert data == create_account("2025-02-01T10:00:00Z").model_dump()
+  assert store.writes_performed == 1
+
+@pytest.mark.asyncio
+async def test_when_loaded_account_saved_then_write_skipped():
+  # Arrange
+  (store, underlying_store) = create_store()
+  underlying_store.async_load = mock.AsyncMock(return_value=create_account().model_dump())
+  loaded_account = await store.async_load()
+
+  # Act
+  result = store.async_save(create_account())
+
+  # Assert
+  assert loaded_account is not None
+  assert result is False
+  assert store.writes_skipped == 1
+  assert underlying_store.async_delay_save.call_count == 0
+
+@pytest.mark.asyncio
+async def test_when_flushed_with_pending_write_then_account_saved():
+  # Arrange
+  (store, underlying_store) = create_store()
+  underlying_store.async_save = mock.AsyncMock()
+  account = create_account()
+  store.async_save(account)
+
+  # Act
+  await store.async_flush()
+  await store.async_flush()
+
+  # Assert
+  underlying_store.async_save.assert_awaited_once_with(account.model_dump())
+  assert store.writes_performed == 1
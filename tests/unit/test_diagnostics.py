@@ -0,0 +1,91 @@
+import json
+import pytest
+import mock
+
+from homeassistant.helpers.json import ExtendedJSONEncoder
+from homeassistant.util.dt import (now)
+
+from custom_components.smol.api_client import SmolApiClient
+from custom_components.smol.api_client.metrics import operation_get_account
+from custom_components.smol.const import (
+  CONFIG_ACCOUNT_NAME,
+  CONFIG_ACCOUNT_PASSWORD,
+  CONFIG_ACCOUNT_USERNAME,
+  CONFIG_KIND,
+  CONFIG_KIND_ACCOUNT,
+  DATA_ACCOUNT,
+  DATA_ACCOUNT_COORDINATOR,
+  DATA_CLIENT,
+  DOMAIN
+)
+from custom_components.smol.coordinators.account import AccountCoordinatorResult, AccountDataUpdateCoordinator
+from custom_components.smol.diagnostics import async_get_config_entry_diagnostics
+from .coordinators import create_account
+
+def create_hass(account_data: dict):
+  hass = mock.MagicMock()
+  hass.data = { DOMAIN: { "main": account_data } }
+  return hass
+
+def create_entry():
+  entry = mock.MagicMock()
+  entry.data = {
+    CONFIG_KIND: CONFIG_KIND_ACCOUNT,
+    CONFIG_ACCOUNT_NAME: "main",
+    CONFIG_ACCOUNT_USERNAME: "someone@example.com",
+    CONFIG_ACCOUNT_PASSWORD: "secret",
+  }
+  return entry
+
+@pytest.mark.asyncio
+async def test_when_account_set_up_then_redacted_diagnostics_with_performance_snapshot_returned():
+  # Arrange
+  result = AccountCoordinatorResult(now(), 1, create_account("2025-02-01T00:00:00Z", ["2025-01-20T04:00:00Z", "2025-01-21T04:00:00Z"]))
+
+  async def async_refresh_account(is_manual_refresh = False):
+    return result
+
+  coordinator = AccountDataUpdateCoordinator(mock.MagicMock(), "test", async_refresh_account, refresh_window_in_seconds=0)
+  coordinator.async_add_listener(lambda: None)
+  await coordinator.refresh_account()
+
+  client = SmolApiClient("someone@example.com", "secret")
+  client.metrics.record_request(operation_get_account, 0.25)
+
+  hass = create_hass({ DATA_ACCOUNT: result, DATA_ACCOUNT_COORDINATOR: coordinator, DATA_CLIENT: client })
+
+  # Act
+  diagnostics = await async_get_config_entry_diagnostics(hass, create_entry())
+
+  # Assert
+  serialised = json.dumps(diagnostics, cls=ExtendedJSONEncoder)
+  assert "someone@example.com" not in serialised
+  assert "secret" not in serialised
+  assert "sub-0" not in serialised
+  assert "address-" not in serialised
+
+  assert diagnostics["config"][CONFIG_ACCOUNT_NAME] == "main"
+  assert diagnostics["account"]["number_of_subscriptions"] == 2
+  assert diagnostics["coordinator"]["request_attempts"] == 1
+  assert diagnostics["coordinator"]["next_refresh"] == result.next_refresh
+
+  performance = diagnostics["performance"]
+  assert performance["requests"][operation_get_account]["requests"] == 1
+  assert performance["requests"][operation_get_account]["p95_latency_in_ms"] == 250
+  assert performance["requests"][operation_get_account]["recent_latencies_in_ms"] == [250]
+  assert performance["caches"]["account_refreshes"] == { "refreshes": 1, "coalesced": 0 }
+  assert performance["listeners"]["updates"] == 1
+  assert performance["listeners"]["listeners_notified"] == 1
+  assert len(performance["listeners"]["handling_by_entity"]) == 1
+  assert performance["storage"] is None
+
+@pytest.mark.asyncio
+async def test_when_account_not_set_up_then_diagnostics_still_returned():
+  # Act
+  diagnostics = await async_get_config_entry_diagnostics(create_hass({}), create_entry())
+
+  # Assert
+  assert diagnostics["account"] is None
+  assert diagnostics["coordinator"]["last_retrieved"] is None
+  assert diagnostics["performance"]["listeners"] is None
+  assert "requests" not in diagnostics["performance"]
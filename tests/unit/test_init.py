@@ -0,0 +1,144 @@
+from contextlib import ExitStack, contextmanager
+import pytest
+import mock
+
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.util.dt import (utcnow)
+
+from custom_components.smol import async_remove_entry, async_setup_account, async_setup_entry
+from custom_components.smol.api_client import AuthenticationException, SmolApiClient
+from custom_components.smol.api_client.session import SmolSessionMetrics
+from custom_components.smol.const import (
+  CONFIG_ACCOUNT_NAME,
+  CONFIG_ACCOUNT_PASSWORD,
+  CONFIG_ACCOUNT_USERNAME,
+  CONFIG_KIND,
+  CONFIG_KIND_ACCOUNT,
+  DATA_ACCOUNT,
+  DATA_ACCOUNT_COORDINATOR,
+  DATA_CLIENT,
+  DATA_SETUP_DURATION,
+  DOMAIN
+)
+from .coordinators import create_account
+
+config = {
+  CONFIG_KIND: CONFIG_KIND_ACCOUNT,
+  CONFIG_ACCOUNT_NAME: "main",
+  CONFIG_ACCOUNT_USERNAME: "someone@example.com",
+  CONFIG_ACCOUNT_PASSWORD: "secret",
+}
+
+def create_hass():
+  hass = mock.MagicMock()
+  hass.data = { DOMAIN: { "main": {} } }
+  return hass
+
+@contextmanager
+def patch_account_setup(cached_account):
+  """Patches out everything async_setup_account depends on other than the client, providing the patched issue registry"""
+  with ExitStack() as stack:
+    stack.enter_context(mock.patch("custom_components.smol.async_setup_account_info_coordinator", mock.AsyncMock()))
+    stack.enter_context(mock.patch("custom_components.smol.async_load_cached_token", mock.AsyncMock(return_value=None)))
+    stack.enter_context(mock.patch("custom_components.smol._get_shared_session", return_value=(mock.MagicMock(), SmolSessionMetrics())))
+    stack.enter_context(mock.patch("custom_components.smol.async_load_cached_account", mock.AsyncMock(return_value=cached_account)))
+    stack.enter_context(mock.patch("custom_components.smol.async_save_cached_account", mock.AsyncMock()))
+    yield stack.enter_context(mock.patch("custom_components.smol.ir"))
+
+@pytest.mark.asyncio
+async def test_when_account_cached_then_set_up_without_calling_api():
+  # Arrange
+  hass = create_hass()
+  cached_account = create_account()
+
+  # Act
+  with patch_account_setup(cached_account):
+    with mock.patch.object(SmolApiClient, "async_get_account", mock.AsyncMock()) as mocked_get_account:
+      await async_setup_account(hass, "main", config)
+
+  # Assert
+  mocked_get_account.assert_not_awaited()
+  assert isinstance(hass.data[DOMAIN]["main"][DATA_CLIENT], SmolApiClient)
+
+  result = hass.data[DOMAIN]["main"][DATA_ACCOUNT]
+  assert result.account is cached_account
+
+  # Our cached account should be refreshed as part of the first coordinator refresh
+  assert result.next_refresh <= utcnow()
+
+@pytest.mark.asyncio
+async def test_when_account_not_cached_and_api_fails_then_not_ready_raised_with_repair():
+  # Arrange
+  hass = create_hass()
+
+  # Act
+  with patch_account_setup(None) as issue_registry:
+    with mock.patch.object(SmolApiClient, "async_get_account", mock.AsyncMock(side_effect=AuthenticationException("Failed", []))) as mocked_get_account:
+      with pytest.raises(ConfigEntryNotReady):
+        await async_setup_account(hass, "main", config)
+
+  # Assert
+  mocked_get_account.assert_awaited_once()
+  assert DATA_ACCOUNT not in hass.data[DOMAIN]["main"]
+  issue_registry.async_create_issue.assert_called_once()
+  assert issue_registry.async_create_issue.call_args.kwargs["translation_key"] == "account_not_found"
+
+@pytest.mark.asyncio
+async def test_when_account_not_cached_then_account_retrieved_during_setup():
+  # Arrange
+  hass = create_hass()
+  account = create_account()
+
+  # Act
+  with patch_account_setup(None) as issue_registry:
+    with mock.patch.object(SmolApiClient, "async_get_account", mock.AsyncMock(return_value=account)):
+      await async_setup_account(hass, "main", config)
+
+  # Assert
+  assert hass.data[DOMAIN]["main"][DATA_ACCOUNT].account is account
+  issue_registry.async_create_issue.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_when_entry_set_up_then_account_refreshed_in_background():
+  # Arrange
+  hass = create_hass()
+  hass.config_entries.async_forward_entry_setups = mock.AsyncMock()
+  entry = mock.MagicMock()
+  entry.data = config
+
+  coordinator = mock.MagicMock()
+  coordinator.async_refresh = mock.AsyncMock()
+
+  async def async_mocked_setup_account(hass, account_name, config):
+    hass.data[DOMAIN][account_name][DATA_ACCOUNT_COORDINATOR] = coordinator
+
+  # Act
+  with mock.patch("custom_components.smol.async_setup_account", async_mocked_setup_account):
+    result = await async_setup_entry(hass, entry)
+
+  # Assert
+  assert result == True
+  hass.config_entries.async_forward_entry_setups.assert_awaited_once()
+  assert hass.data[DOMAIN]["main"][DATA_SETUP_DURATION] >= 0
+
+  # The refresh is handed off rather than awaited as part of setup
+  entry.async_create_background_task.assert_called_once()
+  coordinator.async_refresh.assert_called_once()
+  coordinator.async_refresh.assert_not_awaited()
+  await entry.async_create_background_task.call_args.args[1]
+
+@pytest.mark.asyncio
+async def test_when_entry_removed_then_cached_token_removed():
+  # Arrange
+  hass = create_hass()
+  entry = mock.MagicMock()
+  entry.data = config
+
+  # Act
+  with mock.patch("custom_components.smol.storage.token.storage.Store") as store_class:
+    store_class.return_value.async_remove = mock.AsyncMock()
+    await async_remove_entry(hass, entry)
+
+  # Assert
+  assert store_class.call_args.args[2] == "smol/main_token.json"
+  store_class.return_value.async_remove.assert_awaited_once()
@@ -0,0 +1,96 @@
+from datetime import timedelta
+import mock
+
+from homeassistant.util.dt import (as_utc, parse_datetime)
+
+from custom_components.smol.utils import timers
+from custom_components.smol.utils.timers import BoundaryTimer
+
+current = as_utc(parse_datetime("2025-01-01T10:00:00Z"))
+
+def create_timer():
+  actions = []
+  scheduled = []
+  cancelled = []
+
+  def track_point_in_utc_time(hass, action, point_in_time):
+    scheduled.append((action, point_in_time))
+    return lambda: cancelled.append(point_in_time)
+
+  return (BoundaryTimer(None, lambda now: actions.append(now)), track_point_in_utc_time, actions, scheduled, cancelled)
+
+def test_when_future_time_scheduled_then_called_back_at_time():
+  # Arrange
+  (timer, track_point_in_utc_time, actions, scheduled, cancelled) = create_timer()
+  end_date = current + timedelta(hours=2)
+
+  # Act
+  with mock.patch.object(timers, "async_track_point_in_utc_time", track_point_in_utc_time):
+    timer.schedule(end_date, current)
+    (action, point_in_time) = scheduled[0]
+    action(point_in_time)
+
+  # Assert
+  assert len(scheduled) == 1
+  assert point_in_time == end_date
+  assert actions == [end_date]
+  assert timer.scheduled_for is None
+  assert cancelled == []
+
+def test_when_past_time_scheduled_then_not_called_back():
+  # Arrange
+  (timer, track_point_in_utc_time, actions, scheduled, cancelled) = create_timer()
+
+  # Act
+  with mock.patch.object(timers, "async_track_point_in_utc_time", track_point_in_utc_time):
+    timer.schedule(current - timedelta(minutes=1), current)
+    timer.schedule(current, current)
+
+  # Assert
+  assert scheduled == []
+  assert timer.scheduled_for is None
+
+def test_when_same_time_scheduled_again_then_existing_timer_kept():
+  # Arrange
+  (timer, track_point_in_utc_time, actions, scheduled, cancelled) = create_timer()
+  end_date = current + timedelta(hours=2)
+
+  # Act
+  with mock.patch.object(timers, "async_track_point_in_utc_time", track_point_in_utc_time):
+    timer.schedule(end_date, current)
+    timer.schedule(end_date, current)
+
+  # Assert
+  assert len(scheduled) == 1
+  assert cancelled == []
+  assert timer.scheduled_for == end_date
+
+def test_when_different_time_scheduled_then_previous_timer_replaced():
+  # Arrange
+  (timer, track_point_in_utc_time, actions, scheduled, cancelled) = create_timer()
+  first_end_date = current + timedelta(hours=2)
+  second_end_date = current + timedelta(hours=4)
+
+  # Act
+  with mock.patch.object(timers, "async_track_point_in_utc_time", track_point_in_utc_time):
+    timer.schedule(first_end_date, current)
+    timer.schedule(second_end_date, current)
+
+  # Assert
+  assert [point_in_time for (_, point_in_time) in scheduled] == [first_end_date, second_end_date]
+  assert cancelled == [first_end_date]
+  assert timer.scheduled_for == second_end_date
+
+def test_when_none_scheduled_then_previous_timer_cancelled():
+  # Arrange
+  (timer, track_point_in_utc_time, actions, scheduled, cancelled) = create_timer()
+  end_date = current + timedelta(hours=2)
+
+  # Act
+  with mock.patch.object(timers, "async_track_point_in_utc_time", track_point_in_utc_time):
+    timer.schedule(end_date, current)
+    timer.schedule(None, current)
+
+  # Assert
+  assert cancelled == [end_date]
+  assert timer.scheduled_for is None
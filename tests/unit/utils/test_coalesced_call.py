@@ -0,0 +1,78 @@
+import asyncio
+import pytest
+
+from custom_components.smol.utils.coalesce import CoalescedCall
+
+@pytest.mark.asyncio
+async def test_when_called_concurrently_then_single_call_made():
+  # Arrange
+  calls = []
+  async def async_call():
+    calls.append(len(calls) + 1)
+    return len(calls)
+
+  coalesced_call = CoalescedCall(async_call, 0.01)
+
+  # Act
+  results = await asyncio.gather(*[coalesced_call.async_call() for _ in range(5)])
+
+  # Assert
+  assert results == [1, 1, 1, 1, 1]
+  assert len(calls) == 1
+  assert coalesced_call.calls == 1
+  assert coalesced_call.coalesced_calls == 4
+
+@pytest.mark.asyncio
+async def test_when_called_after_call_started_then_new_call_made():
+  # Arrange
+  started = asyncio.Event()
+  release = asyncio.Event()
+  calls = []
+  async def async_call():
+    calls.append(len(calls) + 1)
+    started.set()
+    await release.wait()
+    return len(calls)
+
+  coalesced_call = CoalescedCall(async_call, 0)
+
+  # Act
+  first = asyncio.ensure_future(coalesced_call.async_call())
+  await started.wait()
+  second = asyncio.ensure_future(coalesced_call.async_call())
+  release.set()
+
+  # Assert
+  assert await first == 1
+  assert await second == 2
+
+@pytest.mark.asyncio
+async def test_when_call_fails_then_all_callers_receive_exception():
+  # Arrange
+  async def async_call():
+    raise Exception("Failed")
+
+  coalesced_call = CoalescedCall(async_call, 0)
+
+  # Act
+  results = await asyncio.gather(*[coalesced_call.async_call() for _ in range(3)], return_exceptions=True)
+
+  # Assert
+  assert all(map(lambda result: isinstance(result, Exception) and str(result) == "Failed", results))
+
+@pytest.mark.asyncio
+async def test_when_caller_cancelled_then_call_continues_for_other_callers():
+  # Arrange
+  async def async_call():
+    return "result"
+
+  coalesced_call = CoalescedCall(async_call, 0.01)
+  first = asyncio.ensure_future(coalesced_call.async_call())
+  second = asyncio.ensure_future(coalesced_call.async_call())
+  await asyncio.sleep(0)
+
+  # Act
+  first.cancel()
+
+  # Assert
+  assert await second == "result"
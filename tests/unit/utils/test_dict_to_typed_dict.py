@@ -0,0 +1,97 @@
+from datetime import datetime, timedelta, timezone
+import pytest
+
+from homeassistant.util.dt import (as_local, parse_datetime)
+
+from custom_components.smol.utils.attributes import dict_to_typed_dict
+
+def test_when_none_provided_then_none_returned():
+  assert dict_to_typed_dict(None) is None
+
+def test_when_not_dict_then_data_returned():
+  assert dict_to_typed_dict("2025-01-01T10:00:00Z") == "2025-01-01T10:00:00Z"
+
+@pytest.mark.parametrize("value,expected_value",[
+  ("12", 12),
+  ("12.5", 12.5),
+  ("2025-01-01T10:00:00Z", as_local(parse_datetime("2025-01-01T10:00:00Z"))),
+  ("2025-01-01T10:00:00+01:00", as_local(parse_datetime("2025-01-01T09:00:00Z"))),
+  ("-12", "-12"),
+  ("12.", "12."),
+  ("", ""),
+  ("smol", "smol"),
+  ("1 box", "1 box"),
+])
+def test_when_string_provided_then_converted(value, expected_value):
+  # Act
+  result = dict_to_typed_dict({ "value": value })
+
+  # Assert
+  assert result["value"] == expected_value
+  assert type(result["value"]) == type(expected_value)
+
+def test_when_datetime_provided_then_converted_to_local():
+  # Arrange
+  value = datetime(2025, 1, 1, 10, 0, 0, tzinfo=timezone(timedelta(hours=5)))
+
+  # Act
+  result = dict_to_typed_dict({ "value": value })
+
+  # Assert
+  assert result["value"] == value
+  assert result["value"].tzinfo == as_local(value).tzinfo
+
+def test_when_nested_values_provided_then_converted():
+  # Arrange
+  data = {
+    "nested": { "value": "12" },
+    "items": [{ "value": "12.5" }, "12", None]
+  }
+
+  # Act
+  result = dict_to_typed_dict(data)
+
+  # Assert
+  assert result == {
+    "nested": { "value": 12 },
+    "items": [{ "value": 12.5 }, "12", None]
+  }
+  assert data["nested"]["value"] == "12"
+  assert data["items"][0]["value"] == "12.5"
+
+def test_when_keys_to_ignore_provided_then_keys_removed():
+  # Arrange
+  data = { "value": "12", "ignored": "abc" }
+
+  # Act
+  result = dict_to_typed_dict(data, ["ignored"])
+
+  # Assert
+  assert result == { "value": 12 }
+  assert data == { "value": "12", "ignored": "abc" }
+
+def test_when_nothing_to_convert_then_original_returned():
+  # Arrange
+  data = {
+    "name": "smol",
+    "quantity": 1,
+    "date": as_local(parse_datetime("2025-01-01T10:00:00Z")),
+    "nested": { "name": "smol" },
+    "items": [{ "name": "smol" }]
+  }
+
+  # Act
+  result = dict_to_typed_dict(data)
+
+  # Assert
+  assert result is data
+
+def test_when_converted_twice_then_second_conversion_returns_original():
+  # Arrange
+  data = dict_to_typed_dict({ "quantity": "1", "date": "2025-01-01T10:00:00Z" })
+
+  # Act
+  result = dict_to_typed_dict(data)
+
+  # Assert
+  assert result is data
@@ -0,0 +1,68 @@
+import logging
+import pytest
+
+from homeassistant.util.dt import (now)
+
+from custom_components.smol.coordinators import BaseCoordinatorResult
+from custom_components.smol.utils.redaction import REDACTED, RedactionFilter, redact
+
+@pytest.mark.parametrize("message,expected_message",[
+  ("account: {'subscriptions': [{'id': 'sub-1', 'address': {'id': 'address-1'}}]}", f"account: {{'subscriptions': [{{'id': '{REDACTED}', 'address': {{'id': '{REDACTED}'}}}}]}}"),
+  ('{"access_token": "abc.def", "refresh_token": "ghi", "expires_in": 3600}', f'{{"access_token": "{REDACTED}", "refresh_token": "{REDACTED}", "expires_in": 3600}}'),
+  ("Failed to change next charge date (subscriptionId: sub-1)", f"Failed to change next charge date (subscriptionId: {REDACTED})"),
+  ("{'addressId': 'address-1', 'date': '2025-01-20T05:00:00+00:00'}", f"{{'addressId': '{REDACTED}', 'date': '2025-01-20T05:00:00+00:00'}}"),
+  ("Authorization: Bearer abc.def.ghi", f"Authorization: Bearer {REDACTED}"),
+  ("Failed to log in as someone@example.com", f"Failed to log in as {REDACTED}"),
+  ("{'holidayMode': {'id': None}}", "{'holidayMode': {'id': None}}"),
+  ("Token is valid: True; paid=3", "Token is valid: True; paid=3"),
+])
+def test_when_message_redacted_then_sensitive_values_removed(message: str, expected_message: str):
+  # Act
+  result = redact(message)
+
+  # Assert
+  assert result == expected_message
+
+def test_when_record_filtered_then_formatted_message_redacted():
+  # Arrange
+  record = logging.LogRecord("test", logging.DEBUG, __file__, 1, "account: %s", ({ "id": "sub-1", "name": "Product" },), None)
+
+  # Act
+  result = RedactionFilter().filter(record)
+
+  # Assert
+  assert result == True
+  assert record.getMessage() == f"account: {{'id': '{REDACTED}', 'name': 'Product'}}"
+
+def test_when_record_malformed_then_record_passed_through_unchanged():
+  # Arrange
+  record = logging.LogRecord("test", logging.DEBUG, __file__, 1, "a %s %s", (1,), None)
+
+  # Act
+  result = RedactionFilter().filter(record)
+
+  # Assert
+  assert result == True
+  assert record.msg == "a %s %s"
+  assert record.args == (1,)
+
+def test_when_debug_disabled_then_coordinator_result_not_formatted(caplog):
+  # Arrange
+  formatted = 0
+  class Error(Exception):
+    def __str__(self):
+      nonlocal formatted
+      formatted += 1
+      return "error"
+
+  # Act
+  with caplog.at_level(logging.INFO, logger="custom_components.smol.coordinators"):
+    BaseCoordinatorResult(now(), 1, 30, last_error=Error())
+  formatted_when_disabled = formatted
+
+  with caplog.at_level(logging.DEBUG, logger="custom_components.smol.coordinators"):
+    BaseCoordinatorResult(now(), 1, 30, last_error=Error())
+
+  # Assert
+  assert formatted_when_disabled == 0
+  assert formatted > 0
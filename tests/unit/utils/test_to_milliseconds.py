@@ -0,0 +1,17 @@
+import pytest
+
+from custom_components.smol.utils.durations import to_milliseconds
+
+@pytest.mark.parametrize("duration_in_seconds,expected_milliseconds",[
+  (None, None),
+  (0, 0),
+  (0.25, 250),
+  (0.0000123456, 0.012),
+  (1.23456789, 1234.568),
+])
+def test_when_duration_converted_then_milliseconds_returned(duration_in_seconds: float | None, expected_milliseconds: float | None):
+  # Act
+  result = to_milliseconds(duration_in_seconds)
+
+  # Assert
+  assert result == expected_milliseconds